@@ -180,7 +180,9 @@ export default function BotMonitoring() {
             <CardContent>
               {currentStatus ? (
                 <div>
-                  <p className="text-2xl font-bold">{currentStatus.healthResponseTime}ms</p>
+                  <p className="text-2xl font-bold">
+                    {currentStatus.healthResponseTime !== null ? `${currentStatus.healthResponseTime}ms` : "No response"}
+                  </p>
                   <p className="text-xs text-slate-500 mt-1">Health endpoint</p>
                 </div>
               ) : (
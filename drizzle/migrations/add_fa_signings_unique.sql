@@ -0,0 +1,9 @@
+-- One fa_window_signings row per player per signing date (upsert key for scripts/load-fa-signings.py)
+-- Replaying the old seed-fa-signings.sql more than once left duplicates; keep the oldest row of each
+DELETE dup FROM `fa_window_signings` dup
+JOIN `fa_window_signings` keep
+	ON keep.`playerName` = dup.`playerName`
+	AND keep.`signedDate` = dup.`signedDate`
+	AND keep.`id` < dup.`id`;
+
+CREATE UNIQUE INDEX `fa_window_signings_player_date_idx` ON `fa_window_signings` (`playerName`,`signedDate`);
@@ -0,0 +1,6 @@
+-- Add burst latency percentiles and histogram buckets to botHealthMetrics
+ALTER TABLE `botHealthMetrics` ADD `healthP50` int;
+ALTER TABLE `botHealthMetrics` ADD `healthP95` int;
+ALTER TABLE `botHealthMetrics` ADD `healthP99` int;
+ALTER TABLE `botHealthMetrics` ADD `healthMax` int;
+ALTER TABLE `botHealthMetrics` ADD `healthLatencyHistogram` text;
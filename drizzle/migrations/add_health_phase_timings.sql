@@ -0,0 +1,2 @@
+-- Add the per-target request phase breakdown (DNS, connect, TLS, TTFB, body, JSON) to botHealthMetrics
+ALTER TABLE `botHealthMetrics` ADD `healthPhaseTimings` text;
@@ -0,0 +1,14 @@
+-- A probe that got no response (timeout, connection refused) has no response time:
+-- store NULL instead of 0 so outages don't drag latency averages and percentiles down
+ALTER TABLE `botHealthMetrics` MODIFY `healthResponseTime` int;
+
+-- Earlier failures were written as 0ms; a real response always has a burst p50
+UPDATE `botHealthMetrics` SET `healthResponseTime` = NULL
+WHERE `healthResponseTime` = 0 AND `status` = 'unhealthy' AND `healthP50` IS NULL;
+
+-- Rollups average over the samples that had a response time
+ALTER TABLE `botHealthRollups` MODIFY `minResponseTime` int;
+ALTER TABLE `botHealthRollups` MODIFY `avgResponseTime` double;
+ALTER TABLE `botHealthRollups` MODIFY `maxResponseTime` int;
+ALTER TABLE `botHealthRollups` ADD `healthSampleCount` int NOT NULL DEFAULT 0;
+UPDATE `botHealthRollups` SET `healthSampleCount` = `sampleCount`;
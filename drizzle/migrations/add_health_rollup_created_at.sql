@@ -0,0 +1,20 @@
+-- Watermark the rollup on insert time instead of the sample timestamp or id:
+-- spooled samples are inserted a flush interval after they were taken, and
+-- AUTO_INCREMENT ids aren't ordered across TiDB nodes
+ALTER TABLE `botHealthMetrics` ADD `createdAt` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE `botHealthRollupState` ADD `lastCreatedAt` timestamp NULL;
+
+-- Existing rows all got this migration's time; rows already rolled up take their sample
+-- time instead, so they sort before the watermark below and the rest are still picked up
+UPDATE `botHealthMetrics` m
+JOIN `botHealthRollupState` s ON s.`name` = 'botHealthMetrics'
+SET m.`createdAt` = m.`timestamp`
+WHERE m.`id` <= s.`lastMetricId`;
+
+UPDATE `botHealthRollupState` s
+SET s.`lastCreatedAt` = (
+	SELECT MAX(m.`createdAt`) FROM `botHealthMetrics` m WHERE m.`id` <= s.`lastMetricId`
+)
+WHERE s.`name` = 'botHealthMetrics';
+
+CREATE INDEX `botHealthMetrics_createdAt_idx` ON `botHealthMetrics` (`createdAt`, `id`);
@@ -0,0 +1,37 @@
+-- Rollup tables for botHealthMetrics (maintained by scripts/health_rollup.py)
+CREATE TABLE IF NOT EXISTS `botHealthRollups` (
+	`id` int AUTO_INCREMENT NOT NULL,
+	`resolution` enum('1m','1h','1d') NOT NULL,
+	`bucketStart` timestamp NOT NULL,
+	`sampleCount` int NOT NULL,
+	`upCount` int NOT NULL,
+	`healthyCount` int NOT NULL,
+	`degradedCount` int NOT NULL,
+	`unhealthyCount` int NOT NULL,
+	`webUpCount` int NOT NULL,
+	`uptimePct` double NOT NULL,
+	`minResponseTime` int NOT NULL,
+	`avgResponseTime` double NOT NULL,
+	`maxResponseTime` int NOT NULL,
+	`p50ResponseTime` int,
+	`p95ResponseTime` int,
+	`p99ResponseTime` int,
+	`webSampleCount` int NOT NULL,
+	`avgWebResponseTime` double,
+	`errorTotal` int NOT NULL,
+	`maxErrors` int NOT NULL,
+	`latencyHistogram` text,
+	`updatedAt` timestamp NOT NULL DEFAULT (now()) ON UPDATE CURRENT_TIMESTAMP,
+	CONSTRAINT `botHealthRollups_id` PRIMARY KEY(`id`),
+	CONSTRAINT `botHealthRollups_resolution_bucket_idx` UNIQUE(`resolution`,`bucketStart`)
+);
+
+CREATE TABLE IF NOT EXISTS `botHealthRollupState` (
+	`name` varchar(64) NOT NULL,
+	`lastMetricId` int NOT NULL DEFAULT 0,
+	`updatedAt` timestamp NOT NULL DEFAULT (now()) ON UPDATE CURRENT_TIMESTAMP,
+	CONSTRAINT `botHealthRollupState_name` PRIMARY KEY(`name`)
+);
+
+-- Range scans and retention deletes on the raw table filter by timestamp
+CREATE INDEX `botHealthMetrics_timestamp_idx` ON `botHealthMetrics` (`timestamp`);
@@ -1,4 +1,4 @@
-import { int, mysqlEnum, mysqlTable, text, timestamp, varchar, boolean } from "drizzle-orm/mysql-core";
+import { int, mysqlEnum, mysqlTable, text, timestamp, varchar, boolean, double, index, uniqueIndex } from "drizzle-orm/mysql-core";
 
 /**
  * Core user table backing auth flow.
@@ -60,15 +60,70 @@ export const botHealthMetrics = mysqlTable("botHealthMetrics", {
   status: varchar("status", { length: 20 }).notNull(), // healthy, degraded, unhealthy
   uptime: int("uptime").notNull(), // Bot uptime in seconds
   errors: int("errors").notNull(), // Error count
-  healthResponseTime: int("healthResponseTime").notNull(), // Health endpoint response time in ms
+  healthResponseTime: int("healthResponseTime"), // Health endpoint response time in ms (null if no response)
   webResponseTime: int("webResponseTime"), // Web server response time in ms (nullable if down)
   webServerUp: int("webServerUp").notNull(), // 1 = up, 0 = down
   message: text("message"), // Status message or error description
-});
+  healthP50: int("healthP50"), // Health endpoint latency percentiles over the probe burst, in ms
+  healthP95: int("healthP95"),
+  healthP99: int("healthP99"),
+  healthMax: int("healthMax"),
+  healthLatencyHistogram: text("healthLatencyHistogram"), // JSON log-linear histogram buckets (scripts/latency_histogram.py)
+  healthPhaseTimings: text("healthPhaseTimings"), // JSON per-target DNS/connect/TLS/TTFB/body/JSON ms (scripts/timed_http.py)
+  createdAt: timestamp("createdAt").defaultNow().notNull(), // Insert time; spooled samples arrive after their timestamp
+}, (table) => [
+  index("botHealthMetrics_timestamp_idx").on(table.timestamp),
+  index("botHealthMetrics_createdAt_idx").on(table.createdAt, table.id),
+]);
 
 export type BotHealthMetric = typeof botHealthMetrics.$inferSelect;
 export type InsertBotHealthMetric = typeof botHealthMetrics.$inferInsert;
 
+/**
+ * Bot health rollups - 1-minute, 1-hour and 1-day summaries of botHealthMetrics
+ * Maintained incrementally by scripts/health_rollup.py
+ */
+export const botHealthRollups = mysqlTable("botHealthRollups", {
+  id: int("id").autoincrement().primaryKey(),
+  resolution: mysqlEnum("resolution", ["1m", "1h", "1d"]).notNull(),
+  bucketStart: timestamp("bucketStart").notNull(), // UTC start of the bucket
+  sampleCount: int("sampleCount").notNull(),
+  upCount: int("upCount").notNull(), // healthy + degraded samples
+  healthyCount: int("healthyCount").notNull(),
+  degradedCount: int("degradedCount").notNull(),
+  unhealthyCount: int("unhealthyCount").notNull(),
+  webUpCount: int("webUpCount").notNull(),
+  uptimePct: double("uptimePct").notNull(), // upCount / sampleCount * 100
+  minResponseTime: int("minResponseTime"), // Health endpoint response time in ms (null if no responses)
+  avgResponseTime: double("avgResponseTime"),
+  maxResponseTime: int("maxResponseTime"),
+  p50ResponseTime: int("p50ResponseTime"),
+  p95ResponseTime: int("p95ResponseTime"),
+  p99ResponseTime: int("p99ResponseTime"),
+  healthSampleCount: int("healthSampleCount").notNull().default(0), // Samples with a health response time
+  webSampleCount: int("webSampleCount").notNull(), // Samples with a web response time
+  avgWebResponseTime: double("avgWebResponseTime"),
+  errorTotal: int("errorTotal").notNull(),
+  maxErrors: int("maxErrors").notNull(),
+  latencyHistogram: text("latencyHistogram"), // Merged JSON histogram, so buckets can keep absorbing late rows
+  updatedAt: timestamp("updatedAt").defaultNow().onUpdateNow().notNull(),
+}, (table) => [
+  uniqueIndex("botHealthRollups_resolution_bucket_idx").on(table.resolution, table.bucketStart),
+]);
+
+export type BotHealthRollup = typeof botHealthRollups.$inferSelect;
+export type InsertBotHealthRollup = typeof botHealthRollups.$inferInsert;
+
+/**
+ * Rollup watermark - last botHealthMetrics (createdAt, id) aggregated into botHealthRollups
+ */
+export const botHealthRollupState = mysqlTable("botHealthRollupState", {
+  name: varchar("name", { length: 64 }).primaryKey(),
+  lastCreatedAt: timestamp("lastCreatedAt"),
+  lastMetricId: int("lastMetricId").notNull().default(0), // Tie-break among rows with the same createdAt
+  updatedAt: timestamp("updatedAt").defaultNow().onUpdateNow().notNull(),
+});
+
 /**
  * Transaction history table to track all player movements
  */
@@ -1083,7 +1138,9 @@ export const faWindowSignings = mysqlTable("fa_window_signings", {
   isSignAndTrade: int("isSignAndTrade").default(0).notNull(), // 1 if sign-and-trade
   notes: text("notes"), // Additional notes (e.g., "Waived on June 29")
   createdAt: timestamp("createdAt").defaultNow().notNull(),
-});
+}, (table) => [
+  uniqueIndex("fa_window_signings_player_date_idx").on(table.playerName, table.signedDate),
+]);
 
 export type FaWindowSigning = typeof faWindowSignings.$inferSelect;
 export type InsertFaWindowSigning = typeof faWindowSignings.$inferInsert;
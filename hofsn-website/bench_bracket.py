@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+HoFBA Playoff Bracket - Render Benchmark and Golden-Image Check
+===============================================================
+Renders the bracket for a fixed set of playoff scenarios, entirely
+offline (the base image in client/public and made-up series results; no
+database), and
+
+  * times each render by stage - load (decode base / cached layers),
+    draw, logo paste (part of draw) and PNG encode - in three modes:
+      cold         empty cache: base PNG decoded, logo sprites cut
+      warm         fresh renderer over a populated cache, every slot redrawn
+      incremental  from the empty bracket, redrawing only changed slots
+  * checks every full render against a stored golden image, and that the
+    incremental render is pixel-identical to the full one.
+
+Golden images live in bracket-golden/ as overlays: the render with every
+pixel that matches the base image made transparent. They stay small and
+are composited back onto the base before comparing. A pixel counts as
+different when any channel is off by more than --channel-tolerance; a
+scenario fails when more than --max-diff-ratio of the image differs, and
+a red-on-grey diff image is written for it.
+
+Usage:
+    python3 bench_bracket.py                    # Benchmark + golden check
+    python3 bench_bracket.py --repeat 5 --json  # Machine-readable timings
+    python3 bench_bracket.py --update-golden    # Accept the current output
+"""
+
+from PIL import Image, ImageChops
+import os
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+import tempfile
+import statistics
+import time
+
+import update_bracket as bracket
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASE_IMAGE = os.path.join(HERE, "client", "public", "szn17-playoff-bracket.png")
+GOLDEN_DIR = os.path.join(HERE, "bracket-golden")
+GOLDEN_INDEX = os.path.join(GOLDEN_DIR, "index.json")
+
+CHANNEL_TOLERANCE = 24    # Per-channel slack for anti-aliasing differences between FreeType/Pillow builds
+MAX_DIFF_RATIO = 0.0001   # 0.01% of the image (~230 pixels); one score badge moved 1px changes ~340
+STAGES = ("load_ms", "draw_ms", "paste_ms", "encode_ms")
+MODES = ("cold", "warm", "incremental")
+
+def scenario_series(rounds_complete, in_progress=False):
+    """
+    Series records with the first rounds_complete rounds decided.
+
+    Winners alternate between the top and bottom team so both sides of
+    every box get drawn as winner and loser; in_progress adds the next
+    round's series at 1-1.
+    """
+    series = []
+    entrants = list(bracket.FIRST_ROUND)
+    for _ in range(rounds_complete):
+        winners = []
+        for i, (top, bottom) in enumerate(entrants):
+            winner = top if i % 2 == 0 else bottom
+            loser_wins = i % 2
+            series.append(bracket.series_record(top, bottom, *((2, loser_wins) if winner == top else (loser_wins, 2)),
+                                                winner))
+            winners.append(winner)
+        entrants = list(zip(winners[0::2], winners[1::2]))
+    if in_progress:
+        series += [bracket.series_record(top, bottom, 1, 1) for top, bottom in entrants]
+    return series
+
+SCENARIOS = {
+    "empty": scenario_series(0),
+    "first-round": scenario_series(1),
+    "second-round-live": scenario_series(1, in_progress=True),
+    "full": scenario_series(4),
+}
+
+# ============================================
+# RENDERING
+# ============================================
+
+def render(workdir, name, rounds, cache_dir, renderer=None, full=False, variants=False):
+    """One timed render into workdir/<name>.png; returns (renderer, timings with total_ms)"""
+    renderer = renderer or bracket.BracketRenderer(BASE_IMAGE, os.path.join(workdir, f"{name}.png"),
+                                                   cache_dir, variants=variants)
+    started = time.perf_counter()
+    renderer.render(rounds, full=full)
+    timings = dict(renderer.timings, total_ms=(time.perf_counter() - started) * 1000)
+    return renderer, timings
+
+def bench_scenario(workdir, name, rounds, repeat, variants):
+    """{mode: [timings per run]}, leaving workdir/<name>.png (full) and <name>-incremental.png"""
+    results = {mode: [] for mode in MODES}
+    empty = bracket.rounds_from_series([])
+    for run in range(repeat):
+        cold_cache = os.path.join(workdir, f"cache-cold-{name}-{run}")
+        _, timings = render(workdir, name, rounds, cold_cache, full=True, variants=variants)
+        results["cold"].append(timings)
+        shutil.rmtree(cold_cache, ignore_errors=True)
+
+        warm_cache = os.path.join(workdir, "cache-warm")
+        _, timings = render(workdir, name, rounds, warm_cache, full=True, variants=variants)
+        results["warm"].append(timings)
+
+        renderer, _ = render(workdir, f"{name}-incremental", empty, warm_cache, full=True, variants=variants)
+        _, timings = render(workdir, f"{name}-incremental", rounds, warm_cache, renderer=renderer, variants=variants)
+        results["incremental"].append(timings)
+    return results
+
+def median_timings(runs):
+    keys = [key for key in (*STAGES, "state_ms", "variants_ms", "total_ms") if any(key in run for run in runs)]
+    return {key: statistics.median(run.get(key, 0.0) for run in runs) for key in keys}
+
+# ============================================
+# GOLDEN IMAGES
+# ============================================
+
+def load_rgba(path):
+    with Image.open(path) as img:
+        return img.convert("RGBA")
+
+def difference_mask(a, b, tolerance=0):
+    """L mask, 255 where any channel differs by more than tolerance"""
+    diff = ImageChops.difference(a.convert("RGB"), b.convert("RGB"))
+    worst = ImageChops.lighter(ImageChops.lighter(*diff.split()[:2]), diff.split()[2])
+    return worst.point(lambda v: 255 if v > tolerance else 0)
+
+def count_set(mask):
+    return mask.histogram()[255]
+
+def make_overlay(image, base):
+    overlay = Image.new("RGBA", image.size, (0, 0, 0, 0))
+    overlay.paste(image, (0, 0), difference_mask(image, base))
+    return overlay
+
+def golden_image(name, base):
+    overlay = load_rgba(os.path.join(GOLDEN_DIR, f"{name}.png"))
+    if overlay.size != base.size:
+        raise ValueError(f"golden is {overlay.size[0]}x{overlay.size[1]}, base is {base.size[0]}x{base.size[1]}")
+    golden = base.copy()
+    golden.alpha_composite(overlay)
+    return golden
+
+def write_diff(image, mask, path):
+    """Differing pixels in red over a dimmed grey copy of the render"""
+    grey = image.convert("L").point(lambda v: v // 3).convert("RGB")
+    grey.paste((255, 0, 0), (0, 0), mask)
+    grey.save(path, "PNG", compress_level=1)
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+def load_index():
+    try:
+        with open(GOLDEN_INDEX, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def update_golden(workdir, names):
+    base = load_rgba(BASE_IMAGE)
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    index = load_index()  # Scenarios not re-run this time keep their entries
+    index.update(base=file_hash(BASE_IMAGE), layout=bracket.layout_key())
+    index.setdefault("scenarios", {})
+    for name in names:
+        image = load_rgba(os.path.join(workdir, f"{name}.png"))
+        make_overlay(image, base).save(os.path.join(GOLDEN_DIR, f"{name}.png"), "PNG", optimize=True)
+        index["scenarios"][name] = {"changedPixels": count_set(difference_mask(image, base))}
+        print(f"  {name}: golden written ({index['scenarios'][name]['changedPixels']:,} pixels differ from the base)")
+    with open(GOLDEN_INDEX, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+
+def check_scenario(workdir, name, base, channel_tolerance, max_diff_ratio, diff_dir):
+    """List of failure messages for one scenario (empty when it passes)"""
+    failures = []
+    image = load_rgba(os.path.join(workdir, f"{name}.png"))
+    incremental = load_rgba(os.path.join(workdir, f"{name}-incremental.png"))
+    mismatched = count_set(difference_mask(image, incremental))
+    if mismatched:
+        failures.append(f"incremental render differs from the full render in {mismatched:,} pixels")
+
+    if not os.path.exists(os.path.join(GOLDEN_DIR, f"{name}.png")):
+        return failures + ["no golden image (run with --update-golden)"]
+    try:
+        golden = golden_image(name, base)
+    except ValueError as e:
+        return failures + [str(e)]
+    mask = difference_mask(image, golden, channel_tolerance)
+    differing = count_set(mask)
+    if differing > max_diff_ratio * image.width * image.height:
+        os.makedirs(diff_dir, exist_ok=True)
+        diff_path = os.path.join(diff_dir, f"{name}-diff.png")
+        write_diff(image, mask, diff_path)
+        failures.append(f"{differing:,} pixels differ from the golden image (limit "
+                        f"{int(max_diff_ratio * image.width * image.height):,}); see {diff_path}")
+    return failures
+
+# ============================================
+# REPORTING
+# ============================================
+
+def print_timings(results):
+    header = f"{'scenario':<20}{'mode':<13}" + "".join(f"{stage[:-3]:>9}" for stage in (*STAGES, "total_ms"))
+    print(header)
+    print("-" * len(header))
+    for name, modes in results.items():
+        for mode, timings in modes.items():
+            print(f"{name:<20}{mode:<13}" + "".join(f"{timings.get(stage, 0.0):>9.1f}" for stage in (*STAGES, "total_ms")))
+    print("(ms, median; paste is part of draw)")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark bracket renders and compare them to golden images")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="Only these scenarios (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario and mode; medians are reported (default: 3)")
+    parser.add_argument("--variants", action="store_true", help="Include writing the PNG/WebP size variants")
+    parser.add_argument("--update-golden", action="store_true", help="Store this run's renders as the golden images")
+    parser.add_argument("--no-check", action="store_true", help="Only benchmark, skip the golden comparison")
+    parser.add_argument("--channel-tolerance", type=int, default=CHANNEL_TOLERANCE,
+                        help=f"Per-channel difference ignored (default: {CHANNEL_TOLERANCE})")
+    parser.add_argument("--max-diff-ratio", type=float, default=MAX_DIFF_RATIO,
+                        help=f"Share of pixels allowed to differ (default: {MAX_DIFF_RATIO})")
+    parser.add_argument("--diff-dir", default=os.path.join(bracket.CACHE_DIR, "bench-diffs"),
+                        help="Where diff images for failing scenarios go")
+    parser.add_argument("--json", action="store_true", help="Print timings and check results as JSON")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    names = args.scenario or list(SCENARIOS)
+    if not os.path.exists(bracket.FONT_PATH):
+        print(f"⚠️  {bracket.FONT_PATH} is missing; text falls back to Pillow's default font and won't match the goldens")
+
+    workdir = tempfile.mkdtemp(prefix="bracket-bench-")
+    try:
+        results = {}
+        for name in names:
+            rounds = bracket.rounds_from_series(SCENARIOS[name])
+            runs = bench_scenario(workdir, name, rounds, max(1, args.repeat), args.variants)
+            results[name] = {mode: median_timings(runs[mode]) for mode in MODES}
+
+        if args.update_golden:
+            update_golden(workdir, names)
+            return 0
+
+        failures = {}
+        if not args.no_check:
+            index = load_index()
+            if index and index.get("base") != file_hash(BASE_IMAGE):
+                print("⚠️  The base image changed since the goldens were made; expect differences everywhere")
+            base = load_rgba(BASE_IMAGE)
+            for name in names:
+                failed = check_scenario(workdir, name, base, args.channel_tolerance, args.max_diff_ratio, args.diff_dir)
+                if failed:
+                    failures[name] = failed
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps({"timings": results, "failures": failures, "checked": not args.no_check}, indent=2))
+    else:
+        print_timings(results)
+        if not args.no_check:
+            print()
+            for name in names:
+                if name in failures:
+                    print(f"❌ {name}")
+                    for failure in failures[name]:
+                        print(f"    {failure}")
+                else:
+                    print(f"✅ {name} matches its golden image")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+HoFSN Game and Series Graphics - Batch Renderer
+===============================================
+Renders a night's game and series cards in one pass, from the same stats
+files the recaps are written from:
+
+    python3 game_graphics.py raptors-pacers-game1-stats.json
+    python3 game_graphics.py test-series.csv slate/*.json --out client/public/graphics
+
+Inputs are game stats JSON (the raptors-pacers-game1-stats.json layout:
+one game, a list of games, or {"games": [...]}) and series CSVs in the
+test-series.csv layout (per-player Game rows plus a Series row per
+finished series). Every game becomes a game card and every finished
+series a series card.
+
+Cards follow STYLE_GUIDE.md: 16:9, a 40% left panel with the league
+logo, an ALL CAPS headline, the score and the series status, and a 60%
+right panel in the winner's colors with the top performer's headshot
+(or the team logo when there isn't one) and their stat line. They are
+drawn at 1600x900 and saved as 1200px JPEGs at quality 85.
+
+Cards render in a process pool. The logos and headshots a slate needs
+are decoded and scaled once, in the parent, into an AssetCache that each
+worker receives when it starts (not with every card). Scaled copies are
+also kept in .graphics-cache/, keyed by a hash of the source file, so
+the next night starts from them instead of the multi-megapixel originals.
+"""
+
+from PIL import Image, ImageDraw, ImageFont
+import os
+import re
+import sys
+import csv
+import json
+import time
+import hashlib
+import argparse
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import sprite_atlas
+from update_bracket import SERIES_SCORE_RE, resolve_team, FONT_PATH
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PUBLIC_DIR = os.path.join(HERE, "client", "public")
+OUTPUT_DIR = os.path.join(PUBLIC_DIR, "graphics")
+LOGO_DIR = os.path.join(PUBLIC_DIR, "logos")
+HEADSHOT_DIR = os.path.join(PUBLIC_DIR, "headshots")
+LEAGUE_LOGO = os.path.join(PUBLIC_DIR, "hall-of-champions-logo.png")  # The only logo the style guide allows
+CACHE_DIR = os.getenv("GRAPHICS_CACHE_DIR", os.path.join(HERE, ".graphics-cache"))
+FONT_REGULAR_PATH = os.path.join(os.path.dirname(FONT_PATH), "DejaVuSans.ttf")
+
+CARD_SIZE = (1600, 900)
+LEFT_PANEL = 640                 # 40% of the width
+STAT_BAR = 110
+OUTPUT_WIDTH = 1200              # Discord/web width from the style guide
+JPEG_OPTIONS = {"format": "JPEG", "quality": 85, "optimize": True, "progressive": True}
+MAX_CARD_BYTES = 500 * 1024      # Style guide limit for Discord posts
+
+LEAGUE_LOGO_BOX = (190, 190)
+LOGO_BOX = (380, 380)
+HEADSHOT_BOX = (900, 660)
+
+GOLD = (255, 215, 0)
+WHITE = (255, 255, 255)
+GREY = (170, 170, 170)
+BACKGROUND = (10, 10, 10)
+DEFAULT_TEAM_COLOR = (60, 60, 60)
+
+TWO_WORD_NICKNAMES = {"Trail Blazers"}
+
+# Primary colors (STYLE_GUIDE.md where listed, official team colors otherwise)
+TEAM_COLORS = {
+    "Toronto Raptors": "#CE1141", "Indiana Pacers": "#002D62", "San Antonio Spurs": "#8A8D8F",
+    "Milwaukee Bucks": "#00471B", "Washington Wizards": "#002B5C", "Portland Trail Blazers": "#E03A3E",
+    "Houston Rockets": "#CE1141", "Cleveland Cavaliers": "#6F263D", "Atlanta Hawks": "#E03A3E",
+    "Charlotte Hornets": "#1D1160", "Denver Nuggets": "#0E2240", "Utah Jazz": "#002B5C",
+    "Sacramento Kings": "#5A2D81", "Chicago Bulls": "#CE1141", "Detroit Pistons": "#C8102E",
+    "Dallas Mavericks": "#00538C",
+}
+
+# ============================================
+# SLATE INPUT
+# ============================================
+# A card is a plain dict (picklable, so it can go to a worker as-is):
+#   kind, id, winner, loser, score, headline, subtitle, status,
+#   player {name, team, line} or None
+
+def slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", str(text).lower()).strip("-")
+
+def nickname(team):
+    """San Antonio Spurs -> Spurs, Portland Trail Blazers -> Trail Blazers"""
+    full = resolve_team(team) or ""
+    two_words = " ".join(full.split()[-2:])
+    return two_words if two_words in TWO_WORD_NICKNAMES else full.split()[-1] if full else ""
+
+def stat_line(name, parts):
+    return " · ".join([name.upper()] + [part for part in parts if part])
+
+def series_status(team_a, team_b, wins_a, wins_b, best_of=3):
+    """ "BUCKS LEAD 2-0" / "SERIES TIED 1-1" / "BUCKS WIN 2-1" """
+    needed = best_of // 2 + 1
+    if wins_a == wins_b:
+        return f"SERIES TIED {wins_a}-{wins_b}"
+    leader, high, low = (team_a, wins_a, wins_b) if wins_a > wins_b else (team_b, wins_b, wins_a)
+    verb = "WIN" if high >= needed else "LEAD"
+    return f"{nickname(leader).upper()} {verb} {high}-{low}"
+
+def game_number(label):
+    match = re.search(r"game\s*(\d+)", str(label or ""), re.IGNORECASE)
+    return int(match.group(1)) if match else None
+
+def card_from_stats(data):
+    """A game card from the *-stats.json layout (team keys are nicknames, e.g. "raptors")"""
+    game = data["game"]
+    (team_a, score_a), (team_b, score_b) = list(game["final_score"].items())[:2]
+    winner_key, loser_key = (team_a, team_b) if score_a >= score_b else (team_b, team_a)
+    winner, loser = resolve_team(winner_key.replace("_", " ")), resolve_team(loser_key.replace("_", " "))
+    number = game_number(game.get("series"))
+
+    player = None
+    players = data.get("player_stats", {}).get(winner_key, [])
+    if players:
+        top = max(players, key=lambda p: p.get("pts", 0))
+        player = {"name": top["name"], "team": winner,
+                  "line": stat_line(top["name"], [f"{top.get('pts', 0)} PTS", f"{top.get('reb', 0)} REB",
+                                                  f"{top.get('ast', 0)} AST",
+                                                  f"{top['fg']} FG" if top.get("fg") else None])}
+    return {
+        "kind": "game",
+        "id": slug(f"{game.get('date', '')}-{nickname(winner)}-{nickname(loser)}-game-{number or ''}"),
+        "winner": winner,
+        "loser": loser,
+        "score": f"{max(score_a, score_b)}-{min(score_a, score_b)}",
+        "headline": f"{nickname(winner)} take game {number}" if number else f"{nickname(winner)} win",
+        "subtitle": " · ".join(part for part in (game.get("series"), game.get("date")) if part),
+        "status": str(game.get("series_record", "")).upper(),
+        "player": player,
+    }
+
+def cards_from_csv(path):
+    """Game cards (with the running series status) and series cards from the test-series.csv layout"""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        rows = [{str(k).replace("_", "").replace(" ", "").lower(): v for k, v in row.items()}
+                for row in csv.DictReader(f)]
+
+    games = {}
+    series_cards = []
+    for row in rows:
+        if row.get("type") == "Game" and row.get("homescore") and row.get("awayscore"):
+            key = (int(row["gamenumber"]), resolve_team(row["hometeam"]), resolve_team(row["awayteam"]))
+            game = games.setdefault(key, {"scores": (int(row["homescore"]), int(row["awayscore"])), "players": []})
+            game["players"].append(row)
+        elif row.get("type") == "Series":
+            # Same column-short handling as update_bracket.series_from_csv: anchor on the "X-Y" score
+            cells = [value or "" for key, value in row.items() if key and key != "type"]
+            for i, value in enumerate(cells):
+                if i >= 2 and SERIES_SCORE_RE.match(value) and cells[i - 2] and cells[i - 1]:
+                    winner, loser = resolve_team(cells[i - 2]), resolve_team(cells[i - 1])
+                    round_name, mvp, mvp_team, ppg, rpg, apg, key_moment = (cells[i + 1:i + 8] + [""] * 7)[:7]
+                    series_cards.append({
+                        "kind": "series",
+                        "id": slug(f"{round_name}-{nickname(winner)}-{nickname(loser)}-series"),
+                        "winner": winner,
+                        "loser": loser,
+                        "score": value,
+                        "headline": f"{nickname(winner)} advance",
+                        "subtitle": " · ".join(part for part in (round_name, key_moment) if part),
+                        "status": f"SERIES MVP {mvp.upper()}" if mvp else f"{nickname(winner).upper()} WIN {value}",
+                        "player": {"name": mvp, "team": resolve_team(mvp_team) or winner,
+                                   "line": stat_line(mvp, [f"{ppg} PPG" if ppg else None, f"{rpg} RPG" if rpg else None,
+                                                           f"{apg} APG" if apg else None])} if mvp else None,
+                    })
+                    break
+
+    game_cards = []
+    wins = {}
+    for (number, home, away), game in sorted(games.items(), key=lambda item: item[0][0]):
+        home_score, away_score = game["scores"]
+        winner, loser = (home, away) if home_score > away_score else (away, home)
+        pair = tuple(sorted((home, away)))
+        record = wins.setdefault(pair, {home: 0, away: 0})
+        record[winner] += 1
+
+        top = max((p for p in game["players"] if resolve_team(p.get("team")) == winner),
+                  key=lambda p: int(p.get("pts") or 0), default=None)
+        player = {"name": top["player"], "team": winner,
+                  "line": stat_line(top["player"], [f"{top['pts']} PTS", f"{top['reb']} REB", f"{top['ast']} AST",
+                                                    f"{top['fg%']}% FG" if top.get("fg%") else None])} if top else None
+        game_cards.append({
+            "kind": "game",
+            "id": slug(f"{nickname(pair[0])}-{nickname(pair[1])}-game-{number}"),
+            "winner": winner,
+            "loser": loser,
+            "score": f"{max(game['scores'])}-{min(game['scores'])}",
+            "headline": f"{nickname(winner)} take game {number}",
+            "subtitle": f"Game {number} · {nickname(away)} at {nickname(home)}",
+            "status": series_status(pair[0], pair[1], record[pair[0]], record[pair[1]]),
+            "player": player,
+        })
+    return game_cards + series_cards
+
+def load_slate(paths):
+    cards = []
+    for path in paths:
+        if path.lower().endswith(".csv"):
+            cards += cards_from_csv(path)
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get("games", [data])
+        cards += [card_from_stats(game) for game in data]
+    return cards
+
+# ============================================
+# SHARED ASSET CACHE
+# ============================================
+
+class AssetCache:
+    """
+    Logos and headshots a slate needs, decoded and scaled to card size once.
+
+    Built in the parent process and passed to every worker through the
+    pool initializer; Pillow images pickle as raw pixels, so workers never
+    open the source files.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.league_logo = None
+        self.logos = {}       # Full team name -> RGBA
+        self.headshots = {}   # Player name as written in the stats -> RGBA
+        self.loaded_from_disk = 0
+        self.decoded = 0
+
+    def _scaled(self, path, box, mode):
+        """path scaled into box, via the on-disk cache of earlier runs"""
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()[:16]
+        cached = os.path.join(self.cache_dir, f"{sprite_atlas.sprite_name(path)}-{digest}-{box[0]}x{box[1]}-{mode}.png")
+        if os.path.exists(cached):
+            self.loaded_from_disk += 1
+            with Image.open(cached) as img:
+                return img.convert("RGBA")
+        image = sprite_atlas.normalize(sprite_atlas.open_rgba(path), box, mode)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{cached}.tmp"
+        image.save(tmp_path, "PNG", compress_level=1)
+        os.replace(tmp_path, cached)
+        self.decoded += 1
+        return image
+
+    @staticmethod
+    def find_logo(team):
+        """logos/<nickname>.png for a full team name, trying shorter suffixes ("trail-blazers", "blazers")"""
+        words = slug(team).split("-")
+        for start in range(len(words)):
+            for ext in (".png", ".jpg", ".webp"):
+                path = os.path.join(LOGO_DIR, "-".join(words[start:]) + ext)
+                if os.path.exists(path):
+                    return path
+        return None
+
+    @staticmethod
+    def find_headshot(name):
+        """headshots/<first>-<last>.* for "J. Tatum" / "R.J. Barrett" / "Jayson Tatum": last name, then first initial"""
+        words = slug(name).split("-")
+        if not words or not words[-1]:
+            return None
+        candidates = [p for p in sprite_atlas.find_images(HEADSHOT_DIR, recursive=False)
+                      if slug(sprite_atlas.sprite_name(p)).split("-")[-1] == words[-1]]
+        initial = [p for p in candidates if sprite_atlas.sprite_name(p)[0] == words[0][0]]
+        # Prefer full first-last files over bare last names (deaaron-fox over fox)
+        for group in (initial, candidates):
+            if group:
+                return max(group, key=lambda p: len(sprite_atlas.sprite_name(p)))
+        return None
+
+    def preload(self, cards):
+        if os.path.exists(LEAGUE_LOGO):
+            self.league_logo = self._scaled(LEAGUE_LOGO, LEAGUE_LOGO_BOX, "contain")
+        for team in {team for card in cards for team in (card["winner"], card["loser"]) if team}:
+            path = self.find_logo(team)
+            if path:
+                self.logos[team] = self._scaled(path, LOGO_BOX, "contain")
+        for player in {card["player"]["name"] for card in cards if card.get("player")}:
+            path = self.find_headshot(player)
+            if path:
+                self.headshots[player] = self._scaled(path, HEADSHOT_BOX, "contain")
+        return self
+
+# ============================================
+# RENDERING
+# ============================================
+
+_assets = None  # Each worker's AssetCache, set by _init_worker
+
+def _init_worker(assets):
+    global _assets
+    _assets = assets
+
+@lru_cache(maxsize=None)
+def load_font(size, bold=True):
+    try:
+        return ImageFont.truetype(FONT_PATH if bold else FONT_REGULAR_PATH, size)
+    except OSError:
+        return ImageFont.load_default()
+
+def team_color(team):
+    value = TEAM_COLORS.get(team)
+    return tuple(int(value[i:i + 2], 16) for i in (1, 3, 5)) if value else DEFAULT_TEAM_COLOR
+
+def break_word(draw, word, max_width, font):
+    """A word too wide for one line, split into hyphenated pieces that each fit"""
+    pieces = []
+    while len(word) > 1 and draw.textlength(word, font=font) > max_width:
+        cut = len(word) - 1
+        while cut > 1 and draw.textlength(word[:cut] + "-", font=font) > max_width:
+            cut -= 1
+        pieces.append(word[:cut] + "-")
+        word = word[cut:]
+    return pieces + [word]
+
+def wrap_text(draw, text, max_width, sizes, max_lines=2):
+    """
+    (font, lines) at the largest size in sizes that fits in max_lines lines.
+
+    Words wider than a line are hyphenated; if even the smallest size needs
+    more lines, the text is cut to max_lines with an ellipsis.
+    """
+    for size in sizes:
+        font = load_font(size)
+        lines, line = [], ""
+        for word in text.split():
+            for piece in break_word(draw, word, max_width, font):
+                candidate = f"{line} {piece}".strip()
+                if draw.textlength(candidate, font=font) <= max_width:
+                    line = candidate
+                else:
+                    if line:
+                        lines.append(line)
+                    line = piece
+        if line:
+            lines.append(line)
+        if len(lines) <= max_lines:
+            return font, lines
+    lines = lines[:max_lines]
+    last = lines[-1]
+    while last and draw.textlength(last + "...", font=font) > max_width:
+        last = last[:-1].rstrip()
+    lines[-1] = last + "..."
+    return font, lines
+
+def fit_font(draw, text, max_width, size, min_size):
+    while size > min_size and draw.textlength(text, font=load_font(size)) > max_width:
+        size -= 2
+    return load_font(size)
+
+def faded(image, opacity):
+    copy = image.copy()
+    copy.putalpha(image.getchannel("A").point(lambda v: v * opacity // 255))
+    return copy
+
+def render_card(card, assets):
+    width, height = CARD_SIZE
+    canvas = Image.new("RGBA", CARD_SIZE, BACKGROUND + (255,))
+    draw = ImageDraw.Draw(canvas)
+    panel_width = width - LEFT_PANEL
+
+    # Right panel: winner's color fading to black towards the bottom, big faint logo behind the player
+    fade = Image.linear_gradient("L").transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+    fade = fade.resize((panel_width, height)).point(lambda v: v * 220 // 255)
+    canvas.paste(Image.new("RGBA", (panel_width, height), team_color(card["winner"]) + (255,)), (LEFT_PANEL, 0), fade)
+    logo = assets.logos.get(card["winner"])
+    player = card.get("player")
+    headshot = assets.headshots.get(player["name"]) if player else None
+    if headshot is not None:
+        if logo is not None:
+            canvas.alpha_composite(faded(logo, 50), (width - logo.width - 30, 30))
+        x, y = LEFT_PANEL + (panel_width - headshot.width) // 2, height - STAT_BAR - headshot.height
+        canvas.alpha_composite(headshot, (x, y))
+        if headshot.getchannel("A").getextrema()[0] == 255:  # A photo, not a cut-out: frame it
+            draw.rectangle((x, y, x + headshot.width - 1, y + headshot.height - 1), outline=GOLD, width=4)
+    elif logo is not None:
+        canvas.alpha_composite(logo, (LEFT_PANEL + (panel_width - logo.width) // 2,
+                                      (height - STAT_BAR - logo.height) // 2))
+    if player:
+        canvas.alpha_composite(Image.new("RGBA", (panel_width, STAT_BAR), (0, 0, 0, 200)), (LEFT_PANEL, height - STAT_BAR))
+        draw.text((LEFT_PANEL + panel_width // 2, height - STAT_BAR // 2), player["line"], fill=WHITE, anchor="mm",
+                  font=fit_font(draw, player["line"], panel_width - 60, 34, 20))
+    draw.rectangle((LEFT_PANEL - 3, 0, LEFT_PANEL + 3, height), fill=GOLD)
+
+    # Left panel: league logo, subtitle, headline, score, matchup, status
+    margin = 60
+    text_width = LEFT_PANEL - 2 * margin
+    if assets.league_logo is not None:
+        canvas.alpha_composite(assets.league_logo, (margin, 40))
+    y = 40 + LEAGUE_LOGO_BOX[1] + 30
+    if card.get("subtitle"):
+        subtitle_font = fit_font(draw, card["subtitle"].upper(), text_width, 24, 16)
+        draw.text((margin, y), card["subtitle"].upper(), fill=GOLD, font=subtitle_font)
+        y += 50
+    font, lines = wrap_text(draw, card["headline"].upper(), text_width, range(60, 38, -4))
+    for line in lines:
+        draw.text((margin, y), line, fill=WHITE, font=font)
+        y += font.size + 10
+    y += 20
+    draw.text((margin, y), card["score"].replace("-", " - "), fill=WHITE, font=load_font(110))
+    y += 140
+    matchup = f"{nickname(card['winner']).upper()} DEF. {nickname(card['loser']).upper()}"
+    draw.text((margin, y), matchup, fill=GREY, font=fit_font(draw, matchup, text_width, 28, 18))
+    if card.get("status"):
+        draw.text((margin, height - 70), card["status"], fill=GOLD, anchor="ls",
+                  font=fit_font(draw, card["status"], text_width, 32, 18))
+    return canvas
+
+def save_card(card, out_dir, assets=None):
+    """Worker: render one card to <out_dir>/<id>.jpg; returns (card id, path, bytes, milliseconds)"""
+    started = time.perf_counter()
+    image = render_card(card, assets or _assets).convert("RGB")
+    image = image.resize((OUTPUT_WIDTH, round(image.height * OUTPUT_WIDTH / image.width)), Image.Resampling.LANCZOS)
+    path = os.path.join(out_dir, f"{card['id']}.jpg")
+    tmp_path = f"{path}.tmp"
+    image.save(tmp_path, **JPEG_OPTIONS)
+    os.replace(tmp_path, path)
+    return card["id"], path, os.path.getsize(path), (time.perf_counter() - started) * 1000
+
+def render_slate(cards, out_dir=OUTPUT_DIR, workers=None):
+    """Preload the shared assets, render every card in a process pool; returns (assets, results)"""
+    assets = AssetCache().preload(cards)
+    os.makedirs(out_dir, exist_ok=True)
+    results = []
+    if workers == 1:
+        return assets, [save_card(card, out_dir, assets) for card in cards]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(assets,)) as pool:
+        futures = {pool.submit(save_card, card, out_dir): card["id"] for card in cards}
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"  ⚠️  {futures[future]}: {e}")
+    return assets, results
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Render game and series graphics for a slate of stats files")
+    parser.add_argument("inputs", nargs="+", metavar="PATH", help="Game stats JSON or series CSV files")
+    parser.add_argument("--out", default=OUTPUT_DIR, help="Output directory (default: client/public/graphics)")
+    parser.add_argument("--workers", type=int, default=None, help="Render processes (default: one per CPU; 1 = no pool)")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    started = time.perf_counter()
+    cards = load_slate(args.inputs)
+    if not cards:
+        print("No games or series found in the input")
+        return 1
+    loaded = time.perf_counter()
+    assets, results = render_slate(cards, args.out, args.workers)
+
+    for card_id, path, size, elapsed_ms in sorted(results):
+        warning = "  ⚠️  over the 500KB Discord limit" if size > MAX_CARD_BYTES else ""
+        print(f"  {os.path.relpath(path)}: {size / 1024:.0f}KB ({elapsed_ms:.0f}ms){warning}")
+    missing = sorted({c["player"]["name"] for c in cards if c.get("player") and c["player"]["name"] not in assets.headshots})
+    if missing:
+        print(f"\nNo headshot for: {', '.join(missing)} (team logo used instead)")
+    print(f"\n{len(results)}/{len(cards)} cards in {time.perf_counter() - started:.1f}s "
+          f"(assets {len(assets.logos)} logos + {len(assets.headshots)} headshots: "
+          f"{assets.decoded} decoded, {assets.loaded_from_disk} from cache; "
+          f"slate parsed in {(loaded - started) * 1000:.0f}ms)")
+    return 0 if len(results) == len(cards) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
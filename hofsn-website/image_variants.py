@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+HOFSN Rendered Graphics - Optimized Output Variants
+====================================================
+Turns one rendered image into the files the site and Discord should
+actually serve: optimized PNG and WebP at a few widths (full, embed,
+thumb), plus a manifest listing each file with its size in bytes.
+
+    <stem>-full.png    <stem>-full.webp
+    <stem>-embed.png   <stem>-embed.webp
+    <stem>-thumb.png   <stem>-thumb.webp
+    <stem>.manifest.json
+
+Each variant is encoded on its own thread (Pillow releases the GIL while
+encoding, so they run in parallel) and written to a temporary file that
+is swapped in with os.replace. The manifest is written last, so it never
+lists a file that isn't in place yet.
+
+Usage: python3 image_variants.py client/public/szn17-playoff-bracket-current.png
+"""
+
+from PIL import Image
+import os
+import sys
+import json
+import time
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+
+# (name, max width) - None keeps the original size; images are never upscaled
+VARIANTS = [
+    ("full", None),
+    ("embed", 1200),    # Discord embeds and mobile
+    ("thumb", 480),     # Cards and link previews
+]
+
+# PNG stays lossless (optimize=True searches zlib settings); WebP carries most of the savings
+FORMATS = {
+    "png": {"format": "PNG", "optimize": True},
+    "webp": {"format": "WEBP", "quality": 85, "method": 4},
+}
+
+def variant_path(output_path, name, ext):
+    stem = os.path.splitext(output_path)[0]
+    return f"{stem}-{name}.{ext}"
+
+def manifest_path(output_path):
+    return f"{os.path.splitext(output_path)[0]}.manifest.json"
+
+def resize_to_width(image, width):
+    if width is None or image.width <= width:
+        return image
+    height = round(image.height * width / image.width)
+    return image.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+def encode_variant(image, path, options):
+    """Encode one file atomically; returns its size in bytes"""
+    tmp_path = f"{path}.tmp"
+    image.save(tmp_path, **options)
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+def write_variants(image, output_path, variants=VARIANTS, formats=FORMATS, workers=None):
+    """Write every variant of an already-rendered image next to output_path; returns the manifest"""
+    started = time.perf_counter()
+    image = image.convert("RGB") if image.mode not in ("RGB", "RGBA") else image
+    sized = {name: resize_to_width(image, width) for name, width in variants}
+
+    jobs = [(name, ext, variant_path(output_path, name, ext)) for name, _ in variants for ext in formats]
+    with ThreadPoolExecutor(max_workers=workers or len(jobs)) as pool:
+        sizes = list(pool.map(lambda job: encode_variant(sized[job[0]], job[2], formats[job[1]]), jobs))
+
+    manifest = {
+        "source": os.path.basename(output_path),
+        "sourceBytes": os.path.getsize(output_path) if os.path.exists(output_path) else None,
+        "generatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "variants": {},
+    }
+    for (name, ext, path), size in zip(jobs, sizes):
+        variant = manifest["variants"].setdefault(name, {"width": sized[name].width, "height": sized[name].height})
+        variant[ext] = {"path": os.path.basename(path), "bytes": size}
+
+    tmp_path = f"{manifest_path(output_path)}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path(output_path))
+    manifest["elapsedMs"] = round((time.perf_counter() - started) * 1000)
+    return manifest
+
+def print_manifest(manifest):
+    print(f"Variants of {manifest['source']} ({manifest['sourceBytes'] or 0:,} bytes) "
+          f"in {manifest['elapsedMs']}ms:")
+    for name, variant in manifest["variants"].items():
+        files = ", ".join(f"{ext} {info['bytes']:,}B" for ext, info in variant.items() if isinstance(info, dict))
+        print(f"  {name:<6} {variant['width']}x{variant['height']}: {files}")
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python3 image_variants.py <image> [<image> ...]")
+        sys.exit(1)
+    for source in sys.argv[1:]:
+        with Image.open(source) as img:
+            img.load()
+            print_manifest(write_variants(img, source))
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+HOFSN Website - Static Asset Optimizer
+======================================
+Walks client/public and writes a resized, recompressed copy of every
+image to .asset-cache/optimized/, under content-hashed names:
+
+    headshots/anthony-edwards.3f9c2a71be.webp
+    headshots/anthony-edwards.8d01c4e5f2.jpg
+    manifest.json
+
+Each image is scaled down to its directory's budget (headshots and logos
+are small, graphics stay near embed size) and encoded as WebP, stepping
+the quality down until the file fits the byte budget, plus a JPEG (or
+PNG, when the image has transparency) fallback. Because a file's name
+changes whenever its bytes do, the server can send them with a one-year
+immutable Cache-Control. manifest.json maps each original path to its
+current files.
+
+Originals are left alone and keep their URLs. A page opts in to the
+small version by linking /optimized/headshots/x.jpg instead of
+/headshots/x.jpg; the production server (server/_core/vite.ts) answers
+that with the WebP or fallback copy, or with the original when there is
+no optimized one.
+
+`pnpm build` runs this after `vite build` with --publish dist/public,
+which copies the output to dist/public/optimized. Optimization never
+fails the build: an image that can't be encoded is reported and left out
+of the manifest (so its original is served), and without Pillow the
+whole step is skipped.
+
+Images are processed in a process pool. A state file next to the output
+records each source's size, mtime and SHA-256 along with the settings it
+was encoded with, so a re-run only re-encodes files whose content (or
+budget) actually changed. Hashed files no longer listed in the manifest
+are deleted at the end of the run.
+
+Usage:
+    python3 optimize_assets.py                  # Optimize changed images
+    python3 optimize_assets.py --force          # Re-encode everything
+    python3 optimize_assets.py --workers 4
+    python3 optimize_assets.py --publish dist/public   # Also copy the output into the build
+"""
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Optional: without Pillow the site serves the originals
+    Image = ImageOps = None
+import io
+import os
+import re
+import sys
+import json
+import shutil
+import time
+import hashlib
+import argparse
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(HERE, "client", "public")
+CACHE_DIR = os.environ.get("ASSET_CACHE_DIR", os.path.join(HERE, ".asset-cache"))
+OUTPUT_NAME = "optimized"  # Published as dist/public/optimized, served at /optimized/
+OUTPUT_DIR = os.path.join(CACHE_DIR, OUTPUT_NAME)
+URL_PREFIX = f"/{OUTPUT_NAME}"
+GENERATED_DIRS = {OUTPUT_NAME}  # The URL prefix is ours; a source there would be shadowed
+STATE_PATH = os.path.join(CACHE_DIR, "state.json")
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp"}
+ENCODER_VERSION = 1  # Bump to re-encode everything after changing the encode settings below
+
+# Top-level directory -> (max width, max height, WebP byte budget)
+BUDGETS = {
+    "headshots": (512, 512, 60_000),
+    "logos": (512, 512, 40_000),
+    "trophies": (1024, 1024, 120_000),
+    "refs": (1024, 1024, 120_000),
+}
+DEFAULT_BUDGET = (1600, 1600, 250_000)
+
+WEBP_QUALITIES = (82, 74, 66, 58)  # Tried in order until one fits the budget
+JPEG_OPTIONS = {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True}
+PNG_OPTIONS = {"format": "PNG", "optimize": True}
+HASH_LENGTH = 10
+HASHED_NAME_RE = re.compile(rf"\.[0-9a-f]{{{HASH_LENGTH}}}\.(webp|jpg|png)$")
+
+def budget_for(rel_path):
+    return BUDGETS.get(rel_path.split("/", 1)[0], DEFAULT_BUDGET)
+
+def settings_key(budget):
+    return f"v{ENCODER_VERSION}:{budget[0]}x{budget[1]}:{budget[2]}"
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def find_images(source_dir):
+    """Relative paths (with forward slashes) of every image outside the generated directories"""
+    found = []
+    for root, dirs, files in os.walk(source_dir):
+        if root == source_dir:
+            dirs[:] = [d for d in dirs if d not in GENERATED_DIRS]
+        dirs.sort()
+        for name in sorted(files):
+            if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS:
+                found.append(os.path.relpath(os.path.join(root, name), source_dir).replace(os.sep, "/"))
+    return found
+
+def has_transparency(image):
+    if image.mode in ("RGBA", "LA", "PA"):
+        return image.getextrema()[-1][0] < 255
+    return image.mode == "P" and "transparency" in image.info
+
+def encode(image, options):
+    buffer = io.BytesIO()
+    image.save(buffer, **options)
+    return buffer.getvalue()
+
+def write_hashed(data, rel_path, ext, output_dir):
+    """Write data as <stem>.<hash>.<ext> (atomically, once); returns its path relative to output_dir"""
+    stem = os.path.splitext(rel_path)[0]
+    name = f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}.{ext}"
+    path = os.path.join(output_dir, name)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    return name
+
+def optimize_asset(source_dir, output_dir, rel_path, previous):
+    """
+    Worker: optimize one image. Returns (rel_path, state entry, manifest entry or None).
+
+    previous is the last run's state entry for this file; if the source hash
+    and settings match and its outputs still exist, nothing is re-encoded.
+    """
+    started = time.perf_counter()
+    source_path = os.path.join(source_dir, rel_path)
+    stat = os.stat(source_path)
+    budget = budget_for(rel_path)
+    sha = file_sha256(source_path)
+
+    if (previous and previous.get("sha256") == sha and previous.get("settings") == settings_key(budget)
+            and all(os.path.exists(os.path.join(output_dir, name)) for name in previous.get("outputs", []))):
+        entry = dict(previous, size=stat.st_size, mtimeNs=stat.st_mtime_ns)
+        return rel_path, entry, None
+
+    max_width, max_height, byte_budget = budget
+    with Image.open(source_path) as img:
+        source_format = img.format
+        image = ImageOps.exif_transpose(img)
+        image.load()
+    transparent = has_transparency(image)
+    image = image.convert("RGBA" if transparent else "RGB")
+    original_size = image.size
+    image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+    for quality in WEBP_QUALITIES:
+        webp = encode(image, {"format": "WEBP", "quality": quality, "method": 4})
+        if len(webp) <= byte_budget:
+            break
+
+    fallback_ext = "png" if transparent else "jpg"
+    fallback = encode(image, PNG_OPTIONS if transparent else JPEG_OPTIONS)
+    same_format = source_format == ("PNG" if transparent else "JPEG")
+    if same_format and image.size == original_size and len(fallback) >= stat.st_size:
+        with open(source_path, "rb") as f:  # Already smaller than anything we'd produce
+            fallback = f.read()
+
+    webp_name = write_hashed(webp, rel_path, "webp", output_dir)
+    fallback_name = write_hashed(fallback, rel_path, fallback_ext, output_dir)
+    manifest_entry = {
+        "width": image.width,
+        "height": image.height,
+        "sourceBytes": stat.st_size,
+        "sourceHash": sha[:HASH_LENGTH],
+        "webp": {"path": f"{URL_PREFIX}/{webp_name}", "bytes": len(webp), "quality": quality},
+        fallback_ext: {"path": f"{URL_PREFIX}/{fallback_name}", "bytes": len(fallback)},
+    }
+    entry = {
+        "size": stat.st_size,
+        "mtimeNs": stat.st_mtime_ns,
+        "sha256": sha,
+        "settings": settings_key(budget),
+        "outputs": [webp_name, fallback_name],
+        "manifest": manifest_entry,
+        "encodeMs": round((time.perf_counter() - started) * 1000),
+    }
+    return rel_path, entry, manifest_entry
+
+def load_state(path=STATE_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+def prune_outputs(output_dir, keep):
+    """Delete hashed files that no manifest entry points at any more; returns how many"""
+    removed = 0
+    for root, _, files in os.walk(output_dir):
+        for name in files:
+            rel_path = os.path.relpath(os.path.join(root, name), output_dir).replace(os.sep, "/")
+            if HASHED_NAME_RE.search(name) and rel_path not in keep:
+                os.remove(os.path.join(root, name))
+                removed += 1
+    return removed
+
+def publish(output_dir, publish_dir):
+    """Replace publish_dir/optimized with a copy of output_dir"""
+    target = os.path.join(publish_dir, OUTPUT_NAME)
+    shutil.rmtree(target, ignore_errors=True)
+    shutil.copytree(output_dir, target)
+    return target
+
+def optimize_assets(source_dir=SOURCE_DIR, force=False, workers=None, output_dir=OUTPUT_DIR, publish_dir=None):
+    """Optimize every image, then copy the output into publish_dir if given; returns how many failed"""
+    started = time.perf_counter()
+    state = {} if force else load_state()
+    images = find_images(source_dir)
+
+    new_state, pending, skipped = {}, [], 0
+    for rel_path in images:
+        previous = state.get(rel_path)
+        stat = os.stat(os.path.join(source_dir, rel_path))
+        # Size + mtime match: trust the recorded hash without re-reading the file
+        if (previous and previous.get("size") == stat.st_size and previous.get("mtimeNs") == stat.st_mtime_ns
+                and previous.get("settings") == settings_key(budget_for(rel_path))
+                and all(os.path.exists(os.path.join(output_dir, name)) for name in previous["outputs"])):
+            new_state[rel_path] = previous
+            skipped += 1
+        else:
+            pending.append((rel_path, previous))
+
+    encoded, unchanged, failed = 0, 0, []
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(optimize_asset, source_dir, output_dir, rel_path, previous): rel_path
+                       for rel_path, previous in pending}
+            for future in as_completed(futures):
+                try:
+                    rel_path, entry, manifest_entry = future.result()
+                except Exception as e:
+                    failed.append(futures[future])
+                    print(f"  ⚠️  {futures[future]}: {e} - keeping the original")
+                    continue
+                new_state[rel_path] = entry
+                if manifest_entry is None:
+                    unchanged += 1
+                else:
+                    encoded += 1
+                    print(f"  {rel_path}: {entry['size']:,}B -> webp {manifest_entry['webp']['bytes']:,}B "
+                          f"({manifest_entry['width']}x{manifest_entry['height']}, {entry['encodeMs']}ms)")
+
+    assets = {rel_path: new_state[rel_path]["manifest"] for rel_path in images if rel_path in new_state}
+    manifest = {
+        "generatedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "assets": assets,
+    }
+    write_json(os.path.join(output_dir, "manifest.json"), manifest)
+    write_json(STATE_PATH, new_state)
+    removed = prune_outputs(output_dir, {name for entry in new_state.values() for name in entry["outputs"]})
+
+    source_bytes = sum(a["sourceBytes"] for a in assets.values())
+    webp_bytes = sum(a["webp"]["bytes"] for a in assets.values())
+    fallback_bytes = sum(a.get("jpg", a.get("png", {})).get("bytes", 0) for a in assets.values())
+    print(f"\n{len(images)} images: {encoded} encoded, {skipped + unchanged} unchanged, "
+          f"{len(failed)} failed, {removed} stale files removed "
+          f"({time.perf_counter() - started:.1f}s)")
+    if source_bytes:
+        print(f"Originals {source_bytes / 1e6:.1f} MB -> WebP {webp_bytes / 1e6:.1f} MB "
+              f"({100 * webp_bytes / source_bytes:.0f}%), fallbacks {fallback_bytes / 1e6:.1f} MB")
+    if publish_dir:
+        print(f"Published to {publish(output_dir, publish_dir)}")
+    return len(failed)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Resize, recompress and content-hash the site's images")
+    parser.add_argument("--source", default=SOURCE_DIR, help="Asset directory (default: client/public)")
+    parser.add_argument("--force", action="store_true", help="Ignore the last run's state and re-encode everything")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--publish", default=None, metavar="DIR",
+                        help="Copy the output to DIR/optimized afterwards (the build uses dist/public)")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    if Image is None:
+        print("⚠️  Pillow is not installed (pip install Pillow) - skipping image optimization, originals are served")
+        sys.exit(0)
+    # Failed images are reported above and fall back to their originals; never fail the build over them
+    optimize_assets(os.path.abspath(args.source), args.force, args.workers,
+                    publish_dir=args.publish and os.path.abspath(args.publish))
@@ -6,6 +6,10 @@ import path from "path";
 import { createServer as createViteServer } from "vite";
 import viteConfig from "../../vite.config";
 
+// Pages opt in to optimize_assets.py's small copies by linking
+// /optimized/<original path>; the original URL always serves the original
+const OPTIMIZED_PREFIX = "/optimized/";
+
 export async function setupVite(app: Express, server: Server) {
   const serverOptions = {
     middlewareMode: true,
@@ -20,6 +24,13 @@ export async function setupVite(app: Express, server: Server) {
     appType: "custom",
   });
 
+  // There are no optimized copies in development; serve the originals
+  app.use((req, _res, next) => {
+    if (req.url.startsWith(OPTIMIZED_PREFIX)) {
+      req.url = req.url.slice(OPTIMIZED_PREFIX.length - 1);
+    }
+    next();
+  });
   app.use(vite.middlewares);
   app.use("*", async (req, res, next) => {
     const url = req.originalUrl;
@@ -47,6 +58,27 @@ export async function setupVite(app: Express, server: Server) {
   });
 }
 
+const HASHED_ASSET = /[\\/]optimized[\\/].+\.[0-9a-f]{10}\.(?:webp|jpg|png)$/;
+
+type OptimizedAsset = {
+  webp?: { path: string };
+  jpg?: { path: string };
+  png?: { path: string };
+};
+
+// optimize_assets.py's manifest: original path under client/public -> its
+// resized, content-hashed copies (published into the build by `pnpm build`)
+function loadAssetManifest(distPath: string): Record<string, OptimizedAsset> {
+  try {
+    const manifest = JSON.parse(
+      fs.readFileSync(path.join(distPath, "optimized", "manifest.json"), "utf-8")
+    );
+    return manifest.assets ?? {};
+  } catch {
+    return {};
+  }
+}
+
 export function serveStatic(app: Express) {
   const distPath =
     process.env.NODE_ENV === "development"
@@ -58,7 +90,49 @@ export function serveStatic(app: Express) {
     );
   }
 
-  app.use(express.static(distPath));
+  const optimized = loadAssetManifest(distPath);
+  if (Object.keys(optimized).length === 0) {
+    console.warn(
+      `No optimized images in ${distPath}/optimized (run optimize_assets.py --publish dist/public); serving originals`
+    );
+  }
+
+  // Answer /optimized/<original path> with its optimized copy, WebP when the
+  // browser says it takes it, or with the original if there is no copy (not
+  // optimized yet, or the encode failed). Hashed files are served as they are.
+  app.use((req, res, next) => {
+    if (req.method !== "GET" && req.method !== "HEAD") return next();
+    if (!req.path.startsWith(OPTIMIZED_PREFIX) || HASHED_ASSET.test(req.path)) {
+      return next();
+    }
+    let relPath: string;
+    try {
+      relPath = decodeURIComponent(req.path.slice(OPTIMIZED_PREFIX.length));
+    } catch {
+      return next();
+    }
+    const asset = optimized[relPath];
+    const acceptsWebp = (req.headers.accept ?? "").includes("image/webp");
+    const variant = asset && ((acceptsWebp && asset.webp) || asset.jpg || asset.png);
+    if (variant) res.vary("Accept");
+    // The URL is not content-addressed, so keep it revalidating
+    res.setHeader("Cache-Control", "public, max-age=3600");
+    const target = variant ? variant.path : `/${relPath}`;
+    req.url = target.split("/").map(encodeURIComponent).join("/");
+    next();
+  });
+
+  // optimize_assets.py names files <name>.<content hash>.<ext>, so a new
+  // version always gets a new URL and these can be cached for good
+  app.use(
+    express.static(distPath, {
+      setHeaders(res, filePath) {
+        if (HASHED_ASSET.test(filePath) && !res.getHeader("Cache-Control")) {
+          res.setHeader("Cache-Control", "public, max-age=31536000, immutable");
+        }
+      },
+    })
+  );
 
   // fall through to index.html if the file doesn't exist
   app.use("*", (_req, res) => {
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+HOFSN Website - Duplicate Finder and Sprite Atlases
+===================================================
+Packs every player headshot and team logo into one image per kind, with
+a JSON index of where each sprite sits:
+
+    .atlas-cache/headshots.png   headshots.webp   headshots.json
+    .atlas-cache/logos.png       logos.webp       logos.json
+
+Sprites are normalized to a fixed cell size first: headshots are
+center-cropped to the NBA CDN's 260x190 framing, and logos are trimmed to
+their visible pixels and fitted into a 128x128 square. Cells are laid out
+on a grid, so a sprite's position in the index is all a consumer needs
+(CSS background-position, or a crop of the atlas via load_atlas()).
+
+This is an offline tool: the atlases are written outside client/public
+(set ATLAS_DIR to move them) and are neither committed nor part of the
+build. Copy them somewhere served before pointing a page at them.
+
+Before packing, images are compared by perceptual hash (a 16x16
+difference hash, 256 bits, taken over the image composited onto white).
+Copies that differ only in size, format or compression land within a
+few bits of each other and are collapsed into one sprite; the index lists
+the extra names under "aliases". Same-template NBA headshots of different
+players sit 30+ bits apart, well clear of the threshold.
+
+Files whose names point at the same player but whose pictures differ
+(fox.jpg vs deaaron-fox.jpg) are different photos, not copies; they are
+reported for a human to pick one and are not merged.
+
+Usage:
+    python3 sprite_atlas.py                 # Build the headshot and logo atlases
+    python3 sprite_atlas.py --dupes         # Only report duplicates across client/public
+    python3 sprite_atlas.py --threshold 8   # Max differing bits to call two images copies
+"""
+
+from PIL import Image, ImageOps
+import os
+import sys
+import json
+import math
+import time
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PUBLIC_DIR = os.path.join(HERE, "client", "public")
+ATLAS_DIR = os.getenv("ATLAS_DIR", os.path.join(HERE, ".atlas-cache"))
+GENERATED_DIRS = {"optimized"}  # Build output, never scanned as sources
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp"}
+HASH_SIZE = 16            # 16x16 difference hash = 256 bits
+DUPLICATE_THRESHOLD = 10  # Bits; copies here are 0-7 apart, look-alike trophies (roy/dpoy) 12+
+PADDING = 2               # Transparent gap between cells so scaled sprites don't bleed
+
+# Atlas name -> (source directory, cell size, fit mode)
+ATLASES = {
+    "headshots": ("headshots", (260, 190), "cover"),
+    "logos": ("logos", (128, 128), "contain"),
+}
+
+def find_images(directory, recursive=True):
+    found = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if recursive and not (root == PUBLIC_DIR and d in GENERATED_DIRS))
+        found += [os.path.join(root, name) for name in sorted(files)
+                  if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS]
+    return found
+
+def open_rgba(path):
+    """Load any image as RGBA (palette transparency included)"""
+    with Image.open(path) as img:
+        img.draft("RGB", (512, 512))  # JPEG only: decode at reduced scale when that's enough
+        return ImageOps.exif_transpose(img).convert("RGBA")
+
+def perceptual_hash(path, size=HASH_SIZE):
+    """Difference hash: brightness gradient signs over a (size+1) x size thumbnail, as an int"""
+    image = open_rgba(path)
+    flat = Image.new("RGBA", image.size, "white")
+    flat.alpha_composite(image)
+    pixels = flat.convert("L").resize((size + 1, size), Image.Resampling.LANCZOS).tobytes()
+    value = 0
+    for row in range(size):
+        for col in range(size):
+            i = row * (size + 1) + col
+            value = value << 1 | (pixels[i] > pixels[i + 1])
+    return value
+
+def hash_images(paths, workers=None):
+    """{path: hash}, decoded in a process pool (large PNGs dominate the cost)"""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(paths, pool.map(perceptual_hash, paths, chunksize=4)))
+
+def duplicate_groups(hashes, threshold=DUPLICATE_THRESHOLD):
+    """Groups (2+ paths) whose hashes are within threshold bits, joined transitively"""
+    paths = list(hashes)
+    parent = {p: p for p in paths}
+
+    def root(p):
+        while parent[p] != p:
+            parent[p] = parent[parent[p]]
+            p = parent[p]
+        return p
+
+    for i, a in enumerate(paths):
+        for b in paths[i + 1:]:
+            if bin(hashes[a] ^ hashes[b]).count("1") <= threshold:
+                parent[root(b)] = root(a)
+
+    groups = {}
+    for p in paths:
+        groups.setdefault(root(p), []).append(p)
+    return [g for g in groups.values() if len(g) > 1]
+
+def pick_canonical(group):
+    """Keep the largest (then biggest file) copy; the rest become aliases"""
+    def score(path):
+        with Image.open(path) as img:
+            return img.width * img.height, os.path.getsize(path)
+    return max(group, key=score)
+
+def sprite_name(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+def same_name_pairs(paths):
+    """(short, long) where one name is the trailing words of another (fox / deaaron-fox)"""
+    names = {sprite_name(p): p for p in paths}
+    pairs = []
+    for short, short_path in names.items():
+        for long, long_path in names.items():
+            if short != long and long.endswith(f"-{short}"):
+                pairs.append((short_path, long_path))
+    return pairs
+
+def normalize(image, cell, mode):
+    """Scale an RGBA image to exactly cell: cover crops to fill, contain trims and letterboxes"""
+    if mode == "cover":
+        return ImageOps.fit(image, cell, Image.Resampling.LANCZOS, centering=(0.5, 0.3))
+    bbox = image.getchannel("A").getbbox()
+    if bbox:
+        image = image.crop(bbox)
+    image = ImageOps.contain(image, cell, Image.Resampling.LANCZOS)
+    canvas = Image.new("RGBA", cell, (0, 0, 0, 0))
+    canvas.paste(image, ((cell[0] - image.width) // 2, (cell[1] - image.height) // 2))
+    return canvas
+
+def write_atomic(path, write):
+    tmp_path = f"{path}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+def write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+def build_atlas(name, paths, cell, mode, aliases):
+    """Pack paths (canonical copies only) into <name>.png/.webp and write <name>.json; returns the index"""
+    columns = max(1, math.ceil(math.sqrt(len(paths) * cell[1] / cell[0])))  # Roughly square sheet
+    rows = max(1, math.ceil(len(paths) / columns))
+    pitch = (cell[0] + PADDING, cell[1] + PADDING)
+    atlas = Image.new("RGBA", (columns * pitch[0] - PADDING, rows * pitch[1] - PADDING), (0, 0, 0, 0))
+
+    sprites = {}
+    for i, path in enumerate(paths):
+        x, y = (i % columns) * pitch[0], (i // columns) * pitch[1]
+        atlas.paste(normalize(open_rgba(path), cell, mode), (x, y))
+        sprites[sprite_name(path)] = {"x": x, "y": y, "w": cell[0], "h": cell[1],
+                                      "source": os.path.relpath(path, PUBLIC_DIR).replace(os.sep, "/")}
+
+    os.makedirs(ATLAS_DIR, exist_ok=True)
+    png_path = os.path.join(ATLAS_DIR, f"{name}.png")
+    webp_path = os.path.join(ATLAS_DIR, f"{name}.webp")
+    write_atomic(png_path, lambda p: atlas.save(p, format="PNG", optimize=True))
+    write_atomic(webp_path, lambda p: atlas.save(p, format="WEBP", quality=85, method=4))
+    with open(png_path, "rb") as f:
+        version = hashlib.sha256(f.read()).hexdigest()[:10]
+
+    index = {
+        "version": version,  # Content hash; append as ?v= wherever the atlas ends up served
+        "image": {"png": f"{name}.png", "webp": f"{name}.webp"},  # Next to this index
+        "width": atlas.width,
+        "height": atlas.height,
+        "cell": {"w": cell[0], "h": cell[1]},
+        "sprites": sprites,
+        "aliases": {sprite_name(alias): sprite_name(canonical) for alias, canonical in aliases.items()},
+    }
+    write_atomic(os.path.join(ATLAS_DIR, f"{name}.json"), lambda p: write_json(p, index))
+    index["bytes"] = {"png": os.path.getsize(png_path), "webp": os.path.getsize(webp_path)}
+    return index
+
+def load_atlas(name, atlas_dir=ATLAS_DIR):
+    """{sprite name or alias: RGBA image} from a built atlas, for Pillow renderers"""
+    with open(os.path.join(atlas_dir, f"{name}.json"), "r", encoding="utf-8") as f:
+        index = json.load(f)
+    with Image.open(os.path.join(atlas_dir, f"{name}.png")) as img:
+        sheet = img.convert("RGBA")
+    sprites = {key: sheet.crop((s["x"], s["y"], s["x"] + s["w"], s["y"] + s["h"]))
+               for key, s in index["sprites"].items()}
+    sprites.update({alias: sprites[canonical] for alias, canonical in index["aliases"].items()})
+    return sprites
+
+def relative(path):
+    return os.path.relpath(path, PUBLIC_DIR)
+
+def report_duplicates(groups, hashes, pairs):
+    if not groups:
+        print("No perceptual duplicates found")
+    for group in groups:
+        canonical = pick_canonical(group)
+        print(f"  {relative(canonical)} (kept)")
+        for path in group:
+            if path != canonical:
+                distance = bin(hashes[path] ^ hashes[canonical]).count("1")
+                print(f"    = {relative(path)} ({distance} bits)")
+    for short, long in pairs:
+        distance = bin(hashes[short] ^ hashes[long]).count("1")
+        print(f"  ⚠️  {relative(short)} and {relative(long)} look like the same player but are different "
+              f"pictures ({distance} bits) - keep one by hand")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Find duplicate images and build headshot/logo sprite atlases")
+    parser.add_argument("--dupes", action="store_true", help="Only report duplicates across client/public")
+    parser.add_argument("--threshold", type=int, default=DUPLICATE_THRESHOLD,
+                        help=f"Max differing bits (of {HASH_SIZE * HASH_SIZE}) to treat as copies")
+    parser.add_argument("--workers", type=int, default=None, help="Hashing processes (default: one per CPU)")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    started = time.perf_counter()
+
+    if args.dupes:
+        paths = find_images(PUBLIC_DIR)
+        hashes = hash_images(paths, args.workers)
+        groups = duplicate_groups(hashes, args.threshold)
+        print(f"Hashed {len(paths)} images in {time.perf_counter() - started:.1f}s\n")
+        report_duplicates(groups, hashes, [p for d in ATLASES.values()
+                                           for p in same_name_pairs(find_images(os.path.join(PUBLIC_DIR, d[0]), False))])
+        return
+
+    sources = {name: find_images(os.path.join(PUBLIC_DIR, directory), recursive=False)
+               for name, (directory, _, _) in ATLASES.items()}
+    hashes = hash_images([p for paths in sources.values() for p in paths], args.workers)
+
+    for name, (_, cell, mode) in ATLASES.items():
+        paths = sources[name]
+        if not paths:
+            print(f"⚠️  No images for the {name} atlas")
+            continue
+        groups = duplicate_groups({p: hashes[p] for p in paths}, args.threshold)
+        aliases = {}
+        for group in groups:
+            canonical = pick_canonical(group)
+            aliases.update({p: canonical for p in group if p != canonical})
+        keep = [p for p in paths if p not in aliases]
+
+        index = build_atlas(name, keep, cell, mode, aliases)
+        source_bytes = sum(os.path.getsize(p) for p in paths)
+        print(f"{name}: {len(keep)} sprites ({len(aliases)} duplicates collapsed) in a "
+              f"{index['width']}x{index['height']} atlas - {len(paths)} files, {source_bytes:,}B -> "
+              f"png {index['bytes']['png']:,}B, webp {index['bytes']['webp']:,}B")
+        report_duplicates(groups, hashes, same_name_pairs(paths))
+
+    print(f"\nDone in {time.perf_counter() - started:.1f}s")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+NBA 2K26 Discord Bot - Vectorized Badge Eligibility Engine
+
+Compiles badge_requirements into dense NumPy arrays and checks whole
+rosters against every badge and tier at once, instead of looping over
+players × badges × requirements in Python.
+
+    thresholds  [badges, tiers, attributes]  minimum rating, -inf where a
+                                             tier doesn't use the attribute
+    defined     [badges, tiers]              the badge has that tier at all
+    players     [players, attributes]        ratings, -inf where unknown
+
+A player meets a tier when every attribute clears its threshold, so one
+broadcast comparison plus an all() over the attribute axis scores the
+whole league; the highest tier met per badge falls out of the tier axis.
+The attribute axis holds every attribute any requirement mentions, so a
+requirement isn't limited to the three (attribute, threshold) pairs one
+badge_requirements row can hold: rows for the same badge and tier are
+merged (the Badge Caps layout stores one row per attribute).
+
+Players are evaluated in chunks sized to keep the temporary comparison
+array under MAX_PASS_BYTES.
+
+Usage:
+    python3 scripts/badge_eligibility.py --players roster.json
+    python3 scripts/badge_eligibility.py --players ratings.csv --badge "Limitless Range"
+    python3 scripts/badge_eligibility.py --players roster.json --json > eligibility.json
+
+Roster files are JSON ({"players": [{"name": ..., "attributes": {...}}]},
+a bare list of those, or {name: {attribute: rating}}) or CSV with a name
+column and one column per attribute. Attribute names are matched
+case-insensitively.
+
+Requires NumPy (pip3 install numpy); the tests run with
+python3 -m pytest scripts/test_badge_eligibility.py.
+"""
+
+import sys
+import csv
+import json
+import time
+import argparse
+from typing import Dict, Any, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from db_pool import get_pool, close_pool
+
+TIERS = ("bronze", "silver", "gold")  # badge_requirements.tier, lowest first
+NO_TIER = -1
+MAX_PASS_BYTES = 64 * 1024 * 1024     # Cap on the players × badges × tiers × attributes temporary
+
+Requirement = Tuple[str, str, Sequence[Tuple[str, float]]]  # (badge, tier, [(attribute, threshold), ...])
+
+def normalize_attribute(name: Any) -> str:
+    return " ".join(str(name).split()).lower()
+
+class BadgeMatrix:
+    """Badge requirements compiled into dense threshold arrays"""
+
+    def __init__(self, badges: List[str], attributes: List[str], thresholds: np.ndarray, defined: np.ndarray):
+        self.badges = badges
+        self.attributes = attributes
+        self.attribute_index = {name: i for i, name in enumerate(attributes)}
+        self.thresholds = thresholds
+        self.defined = defined
+
+    @classmethod
+    def compile(cls, requirements: Iterable[Requirement]) -> "BadgeMatrix":
+        """
+        Build the arrays from (badge, tier, [(attribute, threshold), ...]).
+
+        Entries for the same badge and tier are merged; if two name the
+        same attribute the higher threshold wins. An entry with no pairs is
+        skipped: with nothing to check, every player would meet it.
+        """
+        merged: Dict[Tuple[str, int], Dict[str, float]] = {}
+        badges: Dict[str, int] = {}
+        attributes: Dict[str, int] = {}
+        for badge, tier, pairs in requirements:
+            if tier not in TIERS:
+                raise ValueError(f"Unknown tier {tier!r} for badge {badge!r}")
+            pairs = list(pairs)
+            if not pairs:
+                continue
+            badges.setdefault(badge, len(badges))
+            needs = merged.setdefault((badge, TIERS.index(tier)), {})
+            for attribute, threshold in pairs:
+                attribute = normalize_attribute(attribute)
+                attributes.setdefault(attribute, len(attributes))
+                needs[attribute] = max(float(threshold), needs.get(attribute, float("-inf")))
+
+        thresholds = np.full((len(badges), len(TIERS), len(attributes)), -np.inf, dtype=np.float32)
+        defined = np.zeros((len(badges), len(TIERS)), dtype=bool)
+        for (badge, tier), needs in merged.items():
+            b = badges[badge]
+            defined[b, tier] = True
+            for attribute, threshold in needs.items():
+                thresholds[b, tier, attributes[attribute]] = threshold
+        return cls(list(badges), list(attributes), thresholds, defined)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]]) -> "BadgeMatrix":
+        """From (badgeName, tier, attribute1, threshold1, attribute2, threshold2, ...) rows of any width"""
+        def requirements():
+            for row in rows:
+                pairs = [(attr, threshold) for attr, threshold in zip(row[2::2], row[3::2])
+                         if attr and threshold is not None]
+                yield row[0], row[1], pairs
+        return cls.compile(requirements())
+
+    def attribute_vectors(self, players: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """[players, attributes] ratings; attributes a player lacks are -inf, so they never qualify"""
+        vectors = np.full((len(players), len(self.attributes)), -np.inf, dtype=np.float32)
+        for p, ratings in enumerate(players):
+            for name, value in ratings.items():
+                a = self.attribute_index.get(normalize_attribute(name))
+                if a is not None and value not in (None, ""):
+                    vectors[p, a] = float(value)
+        return vectors
+
+    def highest_tiers(self, vectors: np.ndarray) -> np.ndarray:
+        """[players, badges] index into TIERS of the highest tier met, NO_TIER where none is"""
+        players, badge_count, tier_count = len(vectors), len(self.badges), len(TIERS)
+        result = np.full((players, badge_count), NO_TIER, dtype=np.int8)
+        if not players or not badge_count:
+            return result
+        per_player = max(1, badge_count * tier_count * len(self.attributes))
+        chunk = max(1, MAX_PASS_BYTES // per_player)
+        for start in range(0, players, chunk):
+            block = vectors[start:start + chunk]
+            met = (block[:, None, None, :] >= self.thresholds[None]).all(axis=3)  # [p, badges, tiers]
+            met &= self.defined
+            # Last True along the tier axis = highest tier met
+            highest = tier_count - 1 - met[:, :, ::-1].argmax(axis=2)
+            result[start:start + chunk] = np.where(met.any(axis=2), highest, NO_TIER)
+        return result
+
+    def tier_names(self, tiers: np.ndarray, player_names: Sequence[str]) -> Dict[str, Dict[str, str]]:
+        """{player: {badge: tier}} for the badges each player qualifies for"""
+        return {
+            name: {self.badges[b]: TIERS[t] for b, t in enumerate(row) if t != NO_TIER}
+            for name, row in zip(player_names, tiers.tolist())
+        }
+
+def load_requirements(conn) -> BadgeMatrix:
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT badgeName, tier, attribute1, threshold1, attribute2, threshold2, "
+                       "attribute3, threshold3 FROM badge_requirements")
+        return BadgeMatrix.from_rows(cursor.fetchall())
+    finally:
+        cursor.close()
+
+def load_players(path: str) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """(names, ratings) from a roster JSON or CSV file"""
+    if path.lower().endswith(".csv"):
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        name_column = next((col for col in (rows[0] if rows else {}) if col.strip().lower() in ("name", "player")), None)
+        if name_column is None:
+            raise ValueError(f"{path}: no 'name' or 'player' column")
+        return ([row.pop(name_column) for row in rows], rows)
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict) and "players" in data:
+        data = data["players"]
+    if isinstance(data, dict):
+        return list(data), list(data.values())
+    return [p["name"] for p in data], [p.get("attributes", {}) for p in data]
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check player ratings against every badge requirement")
+    parser.add_argument("--players", required=True, metavar="PATH", help="Roster ratings (JSON or CSV)")
+    parser.add_argument("--badge", action="append", help="Only report these badges (repeatable)")
+    parser.add_argument("--json", action="store_true", help="Print {player: {badge: tier}} as JSON")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    names, ratings = load_players(args.players)
+
+    try:
+        with get_pool(size=1).connection() as conn:
+            matrix = load_requirements(conn)
+    finally:
+        close_pool()
+    if not matrix.badges:
+        print("badge_requirements is empty - run import-badge-requirements.py first")
+        sys.exit(1)
+
+    vectors = matrix.attribute_vectors(ratings)
+    started = time.perf_counter()
+    tiers = matrix.highest_tiers(vectors)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    results = matrix.tier_names(tiers, names)
+    if args.badge:
+        wanted = set(args.badge)
+        results = {name: {b: t for b, t in badges.items() if b in wanted} for name, badges in results.items()}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    unrated = [a for i, a in enumerate(matrix.attributes) if not np.isfinite(vectors[:, i]).any()]
+    print(f"Evaluated {len(names)} players × {len(matrix.badges)} badges × {len(TIERS)} tiers "
+          f"({len(matrix.attributes)} attributes) in {elapsed_ms:.1f}ms\n")
+    for name, badges in results.items():
+        counts = ", ".join(f"{sum(1 for t in badges.values() if t == tier)} {tier}" for tier in reversed(TIERS))
+        detail = "; ".join(f"{badge} ({tier})" for badge, tier in sorted(badges.items())) if args.badge else counts
+        print(f"  {name}: {detail or 'none'}")
+    if unrated:
+        print(f"\n⚠️  No player has a rating for: {', '.join(unrated)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+NBA 2K26 Discord Bot - Streaming Spreadsheet Helpers for the Badge Importers
+
+Shared by import-badge-requirements.py and reimport-badges.py. Workbooks
+are opened once, in openpyxl's read-only mode, which parses the sheet XML
+lazily instead of building every cell object up front; rows are then
+consumed through generators and handed to the database in fixed-size
+batches, so memory stays flat however large the upgrade-rules
+spreadsheets get.
+
+SheetPipeline parses sheets in worker processes, one per sheet, and
+streams each sheet's rows back through its own bounded queue, so the
+loader can start writing the first table while later sheets (and other
+workbooks) are still being parsed, and extra rule sheets parse in
+parallel instead of adding to the import time one after another.
+
+replace_tables() is the full reload (--full). The live tables are never
+cleared: each one is rebuilt in a `<table>_shadow` copy (CREATE TABLE ...
+LIKE, then chunked multi-row INSERTs), the copies are validated (rows
+loaded, no collapse against the live row count, unique keys, per-table
+checks such as threshold ranges), and only then are all of them swapped in
+with a single RENAME TABLE statement. Readers keep querying the old tables
+at full speed while the load runs and see the new ones the moment the
+rename lands; they never see an empty or half-loaded table, and a load or
+validation failure just drops the shadows.
+
+sync_tables() is the default, incremental mode. Each table's rows are
+hashed, and a table whose hash matches the last sync is skipped if the
+live table's fingerprint (row count plus a CRC over its rows, one
+aggregate query) also still matches what that sync left behind, so a
+--full reload or a hand edit in between is never mistaken for "nothing
+to do". Otherwise the rows are diffed against what is stored, keyed on (badgeName, tier) or abbreviation, and only the needed
+DELETE/UPDATE/INSERT statements run, in one transaction. Re-importing an
+unchanged spreadsheet therefore writes nothing and takes no locks on the
+tables the bot reads during upgrade validation.
+"""
+
+import os
+import json
+import time
+import hashlib
+import multiprocessing
+from queue import Empty
+from decimal import Decimal
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import openpyxl
+
+from db_pool import bulk_insert, quote_identifier
+
+INSERT_BATCH_ROWS = 500
+PIPELINE_QUEUE_BATCHES = 8  # Row batches a sheet parser may run ahead of the loader
+SYNC_STATE_PATH = os.getenv("BADGE_SYNC_STATE", "logs/badge_sync_state.json")
+
+ABBREVIATION_COLUMNS = ["abbreviation", "fullName", "category"]
+REQUIREMENT_COLUMNS = [
+    "badgeName", "tier", "attribute1", "threshold1", "attribute2", "threshold2", "attribute3", "threshold3",
+]
+
+SHADOW_SUFFIX = "_shadow"
+RETIRED_SUFFIX = "_old"
+MIN_KEEP_RATIO = 0.5  # A full reload that would drop more than half the live rows is refused
+
+# (description, WHERE condition matching offending rows) checked on the shadow table before the swap
+REQUIREMENT_CHECKS = [
+    ("no attribute or threshold", "attribute1 IS NULL OR threshold1 IS NULL"),
+    ("a threshold outside 0-99", " OR ".join(f"threshold{i} NOT BETWEEN 0 AND 99" for i in (1, 2, 3))),
+]
+
+class ValidationError(Exception):
+    """The new rows or a shadow table failed validation; the live tables were left untouched"""
+
+@contextmanager
+def open_workbook(filepath: str):
+    """Open a workbook read-only and make sure its file handle is released afterwards"""
+    wb = openpyxl.load_workbook(filepath, read_only=True)
+    try:
+        yield wb
+    finally:
+        wb.close()
+
+def iter_rows(wb, sheet_name: str, width: int, skip_header: bool = True) -> Iterator[Tuple[Any, ...]]:
+    """
+    Yield a sheet's rows as value tuples padded to at least `width` columns.
+
+    Read-only sheets trust the dimensions stored in the file, which some
+    exporters get wrong, so they are recomputed from the data; rows can
+    then come back ragged, hence the padding.
+    """
+    ws = wb[sheet_name]
+    ws.reset_dimensions()
+    rows = ws.iter_rows(values_only=True)
+    if skip_header:
+        next(rows, None)
+    for row in rows:
+        if len(row) < width:
+            row = tuple(row) + (None,) * (width - len(row))
+        yield row
+
+def batched(items: Iterable[Any], size: int = INSERT_BATCH_ROWS) -> Iterator[List[Any]]:
+    """Group an iterable into lists of at most `size` items"""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def _parse_sheet(queue, parser: Callable, path: str, sheet: str) -> Tuple[int, float, float]:
+    """
+    Worker process: parse one sheet and stream its rows back in batches.
+
+    Returns (rows, seconds parsing, seconds blocked on a full queue).
+    """
+    started = time.perf_counter()
+    count = 0
+    blocked = 0.0
+    with open_workbook(path) as wb:
+        for batch in batched(parser(wb, sheet)):
+            put_started = time.perf_counter()
+            queue.put(batch)
+            blocked += time.perf_counter() - put_started
+            count += len(batch)
+    queue.put(None)
+    return count, time.perf_counter() - started - blocked, blocked
+
+class SheetPipeline:
+    """
+    Parse (workbook, sheet, parser) jobs in a process pool while the caller loads rows.
+
+    parser(wb, sheet) runs in a worker with the workbook open read-only
+    and must be a module-level function returning picklable row tuples.
+    rows(i) yields job i's rows as they arrive; a parser more than
+    PIPELINE_QUEUE_BATCHES batches ahead of the reader waits for it.
+    """
+
+    def __init__(self, jobs: Sequence[Tuple[str, str, Callable]], workers: Optional[int] = None):
+        self.jobs = list(jobs)
+        self.workers = max(1, min(workers or os.cpu_count() or 1, len(self.jobs)))
+        self.waited = 0.0  # Seconds the loader spent blocked on parsers
+        self.queues: List[Any] = []
+        self.futures: List[Any] = []
+
+    def __enter__(self) -> "SheetPipeline":
+        self.manager = multiprocessing.Manager()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        for path, sheet, parser in self.jobs:
+            queue = self.manager.Queue(maxsize=PIPELINE_QUEUE_BATCHES)
+            self.queues.append(queue)
+            self.futures.append(self.pool.submit(_parse_sheet, queue, parser, path, sheet))
+        return self
+
+    def __exit__(self, *exc):
+        # Parsers nobody read to the end are blocked on a full queue; stopping
+        # the manager breaks their queue so they exit instead of hanging
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.manager.shutdown()
+        self.pool.shutdown(wait=True)
+
+    def rows(self, index: int) -> Iterator[Tuple[Any, ...]]:
+        queue, future = self.queues[index], self.futures[index]
+        while True:
+            waiting_since = time.perf_counter()
+            try:
+                batch = queue.get(timeout=0.5)
+            except Empty:
+                if future.done():
+                    future.result()  # Re-raises the parser's exception
+                    raise RuntimeError(f"Parser for {self.jobs[index][1]} exited without finishing")
+                continue
+            finally:
+                self.waited += time.perf_counter() - waiting_since
+            if batch is None:
+                return
+            yield from batch
+
+    def print_timings(self):
+        for (path, sheet, _), future in zip(self.jobs, self.futures):
+            if future.done() and not future.exception():
+                count, seconds, blocked = future.result()
+                print(f"  parse {sheet} ({os.path.basename(path)}): {count} rows {format_rate(count, seconds)}"
+                      + (f", {blocked:.2f}s waiting on the loader" if blocked >= 0.01 else ""))
+
+def format_rate(rows: int, seconds: float) -> str:
+    rate = rows / seconds if seconds > 0 else 0.0
+    return f"in {seconds:.2f}s ({rate:,.0f} rows/s)"
+
+class TableSync:
+    """Desired contents of one table plus the columns that identify a row"""
+
+    def __init__(self, table: str, columns: Sequence[str], key_columns: Sequence[str],
+                 rows: Iterable[Sequence[Any]], checks: Sequence[Tuple[str, str]] = ()):
+        self.table = table
+        self.columns = list(columns)
+        self.key_columns = list(key_columns)
+        self.key_indexes = [self.columns.index(col) for col in key_columns]
+        self.rows = rows
+        self.checks = list(checks)
+
+    def key(self, row: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        return tuple(row[i] for i in self.key_indexes)
+
+def validate_shadow(cursor, spec: TableSync, allow_shrink: bool = False) -> int:
+    """Check a loaded shadow table against the live one; raises ValidationError, returns its row count"""
+    shadow = quote_identifier(spec.table + SHADOW_SUFFIX)
+    cursor.execute(f"SELECT COUNT(*) FROM {shadow}")
+    staged = cursor.fetchone()[0]
+    cursor.execute(f"SELECT COUNT(*) FROM {quote_identifier(spec.table)}")
+    live = cursor.fetchone()[0]
+
+    problems = []
+    if staged == 0:
+        problems.append("no rows loaded")
+    elif not allow_shrink and staged < live * MIN_KEEP_RATIO:
+        problems.append(f"{staged} rows would replace {live} (pass --allow-shrink if that is intended)")
+
+    keys = ", ".join(quote_identifier(col) for col in spec.key_columns)
+    cursor.execute(f"SELECT {keys}, COUNT(*) FROM {shadow} GROUP BY {keys} HAVING COUNT(*) > 1 LIMIT 5")
+    duplicates = cursor.fetchall()
+    if duplicates:
+        problems.append("duplicate " + "; ".join(", ".join(map(str, row[:-1])) for row in duplicates))
+
+    for description, condition in spec.checks:
+        cursor.execute(f"SELECT COUNT(*) FROM {shadow} WHERE {condition}")
+        bad = cursor.fetchone()[0]
+        if bad:
+            problems.append(f"{bad} row(s) with {description}")
+
+    if problems:
+        raise ValidationError(f"{spec.table}: " + "; ".join(problems))
+    print(f"  {spec.table}: {staged} rows validated (live table has {live})")
+    return staged
+
+def replace_tables(conn, specs: Sequence[TableSync], allow_shrink: bool = False,
+                   state_path: str = SYNC_STATE_PATH) -> int:
+    """
+    Rebuild each table in a shadow copy, validate, and swap all of them in at once.
+
+    Rows may be a generator; they are inserted batch by batch as they are
+    produced. The swap is one RENAME TABLE, so readers flip from the old
+    tables to the new ones together; it only waits for transactions still
+    open on the live tables, never for the load. Prints rows/sec per table
+    and overall; returns rows loaded.
+    """
+    started = time.perf_counter()
+    names = [(spec, quote_identifier(spec.table), quote_identifier(spec.table + SHADOW_SUFFIX),
+              quote_identifier(spec.table + RETIRED_SUFFIX)) for spec in specs]
+    total = 0
+    cursor = conn.cursor()
+    try:
+        for spec, live, shadow, retired in names:
+            table_started = time.perf_counter()
+            # Leftovers from an interrupted run
+            cursor.execute(f"DROP TABLE IF EXISTS {shadow}")
+            cursor.execute(f"DROP TABLE IF EXISTS {retired}")
+            cursor.execute(f"CREATE TABLE {shadow} LIKE {live}")
+            loaded = 0
+            for batch in batched(spec.rows):
+                bulk_insert(cursor, spec.table + SHADOW_SUFFIX, spec.columns, batch, chunk_size=INSERT_BATCH_ROWS)
+                loaded += len(batch)
+            conn.commit()
+            print(f"  {spec.table}: {loaded} rows staged {format_rate(loaded, time.perf_counter() - table_started)}")
+            total += loaded
+
+        for spec, _, _, _ in names:
+            validate_shadow(cursor, spec, allow_shrink)
+    except Exception:
+        conn.rollback()
+        for _, _, shadow, _ in names:
+            try:
+                cursor.execute(f"DROP TABLE IF EXISTS {shadow}")
+            except Exception:
+                pass  # The connection may be gone; the next run drops it first
+        cursor.close()
+        raise
+
+    try:
+        cursor.execute("RENAME TABLE " + ", ".join(
+            f"{live} TO {retired}, {shadow} TO {live}" for _, live, shadow, retired in names
+        ))
+        for _, _, _, retired in names:
+            cursor.execute(f"DROP TABLE {retired}")
+    finally:
+        cursor.close()
+    # The next sync must diff these tables rather than trust its last digest
+    state = load_sync_state(state_path)
+    if any(state.pop(sync_state_key(conn, spec.table), None) is not None for spec in specs):
+        save_sync_state(state_path, state)
+    print(f"✅ Swapped in {total} rows {format_rate(total, time.perf_counter() - started)}")
+    return total
+
+class TableDiff:
+    def __init__(self):
+        self.inserts: List[Tuple[Any, ...]] = []
+        self.updates: List[Tuple[int, Tuple[Any, ...], Tuple[Any, ...]]] = []  # (id, old, new)
+        self.deletes: List[Tuple[int, Tuple[Any, ...]]] = []                   # (id, old)
+
+    def __bool__(self):
+        return bool(self.inserts or self.updates or self.deletes)
+
+    def summary(self) -> str:
+        return f"+{len(self.inserts)} ~{len(self.updates)} -{len(self.deletes)}"
+
+def normalize_value(value: Any) -> Any:
+    """Make spreadsheet and database values compare equal (80.0 == 80 == Decimal('80'))"""
+    if isinstance(value, Decimal):
+        value = float(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+def rows_digest(columns: Sequence[str], rows: Sequence[Tuple[Any, ...]]) -> str:
+    digest = hashlib.sha256(json.dumps(list(columns)).encode("utf-8"))
+    for row in rows:
+        digest.update(json.dumps(row, default=str).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+def load_sync_state(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_sync_state(path: str, state: Dict[str, Any]):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def sync_state_key(conn, table: str) -> str:
+    # Scoped to the server and schema, so syncing another database never skips
+    return f"{conn.server_host}/{conn.database}/{table}"
+
+def table_fingerprint(cursor, spec: TableSync) -> str:
+    """Row count and an order-independent CRC of the live rows; changes with any write to them"""
+    values = ", ".join(f"COALESCE(CAST({quote_identifier(col)} AS CHAR), '<null>')" for col in ["id"] + spec.columns)
+    cursor.execute(f"SELECT COUNT(*), COALESCE(BIT_XOR(CRC32(CONCAT_WS('|', {values}))), 0) "
+                   f"FROM {quote_identifier(spec.table)}")
+    count, checksum = cursor.fetchone()
+    return f"{count}:{checksum}"
+
+def diff_table(cursor, spec: TableSync, desired: Dict[Tuple[Any, ...], Tuple[Any, ...]]) -> TableDiff:
+    """Compare desired rows against the stored ones, matched on the key columns"""
+    column_list = ", ".join(quote_identifier(col) for col in spec.columns)
+    cursor.execute(f"SELECT id, {column_list} FROM {quote_identifier(spec.table)} ORDER BY id")
+    diff = TableDiff()
+    seen = set()
+    for stored in cursor.fetchall():
+        row_id, current = stored[0], tuple(normalize_value(v) for v in stored[1:])
+        key = spec.key(current)
+        if key not in desired or key in seen:
+            diff.deletes.append((row_id, current))  # Gone from the sheet, or a duplicate
+            continue
+        seen.add(key)
+        if desired[key] != current:
+            diff.updates.append((row_id, current, desired[key]))
+    diff.inserts = [row for key, row in desired.items() if key not in seen]
+    return diff
+
+def apply_diff(cursor, spec: TableSync, diff: TableDiff):
+    """Deletes first, so a row re-keyed by case alone can't trip a unique index"""
+    table = quote_identifier(spec.table)
+    ids = [row_id for row_id, _ in diff.deletes]
+    for chunk in batched(ids):
+        cursor.execute(f"DELETE FROM {table} WHERE id IN ({', '.join(['%s'] * len(chunk))})", chunk)
+    if diff.updates:
+        assignments = ", ".join(f"{quote_identifier(col)} = %s" for col in spec.columns)
+        cursor.executemany(f"UPDATE {table} SET {assignments} WHERE id = %s",
+                           [tuple(new) + (row_id,) for row_id, _, new in diff.updates])
+    for batch in batched(diff.inserts):
+        bulk_insert(cursor, spec.table, spec.columns, batch, chunk_size=INSERT_BATCH_ROWS)
+
+def print_diff(spec: TableSync, diff: TableDiff):
+    def label(row):
+        return ", ".join(str(v) for v in spec.key(row))
+    for _, old in diff.deletes:
+        print(f"    - {label(old)}")
+    for _, old, new in diff.updates:
+        changes = [f"{col}: {o!r} -> {n!r}" for col, o, n in zip(spec.columns, old, new) if o != n]
+        print(f"    ~ {label(new)}: {'; '.join(changes)}")
+    for new in diff.inserts:
+        print(f"    + {label(new)}: " + ", ".join(f"{col}={v!r}" for col, v in zip(spec.columns, new)
+                                               if v is not None and col not in spec.key_columns))
+
+def sync_tables(conn, specs: Sequence[TableSync], dry_run: bool = False, force: bool = False,
+                state_path: str = SYNC_STATE_PATH) -> int:
+    """
+    Bring each table in line with its desired rows; returns the number of rows changed.
+
+    Tables whose content hash matches the last successful sync, and whose
+    live fingerprint is still the one that sync recorded, are skipped
+    (force=True re-checks them). A key that appears twice in the desired
+    rows raises ValidationError, as a --full reload would. All changes
+    commit together; dry_run prints the diff and rolls back instead.
+    """
+    started = time.perf_counter()
+    state = load_sync_state(state_path)
+    new_state = dict(state)
+    changed = 0
+    cursor = conn.cursor()
+    try:
+        for spec in specs:
+            desired: Dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+            duplicates = []
+            for row in spec.rows:
+                row = tuple(normalize_value(v) for v in row)
+                key = spec.key(row)
+                if key in desired and key not in duplicates:
+                    duplicates.append(key)
+                desired[key] = row
+            # Same rule as validate_shadow, so --full and a sync accept the same input
+            if duplicates:
+                raise ValidationError(f"{spec.table}: duplicate "
+                                      + "; ".join(", ".join(map(str, key)) for key in duplicates[:5])
+                                      + (f" (and {len(duplicates) - 5} more)" if len(duplicates) > 5 else ""))
+            rows = [desired[key] for key in sorted(desired, key=lambda k: tuple(map(str, k)))]
+            state_key = sync_state_key(conn, spec.table)
+            digest = rows_digest(spec.columns, rows)
+            previous = state.get(state_key)
+            if (not force and isinstance(previous, dict) and previous.get("digest") == digest
+                    and previous.get("fingerprint") == table_fingerprint(cursor, spec)):
+                print(f"  {spec.table}: unchanged since last sync, skipped")
+                continue
+
+            diff = diff_table(cursor, spec, desired)
+            print(f"  {spec.table}: {len(desired)} rows in sheet, {diff.summary()}")
+            if dry_run:
+                print_diff(spec, diff)
+            elif diff:
+                apply_diff(cursor, spec, diff)
+            changed += len(diff.inserts) + len(diff.updates) + len(diff.deletes)
+            # Read after our own writes, so it is what the table holds once this commits
+            new_state[state_key] = {"digest": digest, "fingerprint": table_fingerprint(cursor, spec)}
+
+        if dry_run:
+            conn.rollback()
+            print(f"Dry run: {changed} row change(s) not applied")
+            return changed
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    save_sync_state(state_path, new_state)
+    print(f"✅ Synced with {changed} row change(s) {format_rate(changed, time.perf_counter() - started)}")
+    return changed
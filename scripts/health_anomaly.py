@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+NBA 2K26 Discord Bot - Streaming Health Anomaly Detector
+
+Learns what "normal" looks like for each health target and flags
+departures from it, instead of waiting for the fixed limits in
+health_check.py (5 errors, 5s p95) to trip. Every update is O(1) and the
+whole model is a few numbers per target, persisted between cron runs in a
+small JSON state file.
+
+Per target it keeps exponentially weighted moving averages (EWMA) of:
+    latency   log(p50), once over ~15 minutes and once over ~12 hours. A
+              sample far outside the slow baseline is a spike; the fast
+              average pulling away from the slow one is a drift (e.g.
+              /health creeping from 20ms to 800ms over a day)
+    errors    the bot's reported error count, flagged on a jump
+    failures  the fraction of failed checks
+and spots restarts when uptime is lower than the previous uptime plus the
+time since the previous check.
+
+The averages decay by elapsed time rather than per sample
+(alpha = 1 - exp(-dt / tau)), so the model means the same thing whether it
+is fed every 10s by the daemon or every 5 minutes by cron.
+
+Baselines are only fed winsorized samples (clamped to mean ± Z_THRESHOLD
+standard deviations), so one outlier can't drag them, while a lasting
+level shift is still absorbed over time.
+"""
+
+import os
+import json
+import math
+import time
+from typing import Dict, Any, List, Optional
+
+STATE_PATH = os.getenv("HEALTH_ANOMALY_STATE", "logs/health_anomaly_state.json")
+
+FAST_TAU_SECONDS = 15 * 60        # Recent behaviour
+SLOW_TAU_SECONDS = 12 * 3600      # Baseline
+MIN_SAMPLES = 8               # Stay quiet until the baseline has seen this many samples
+Z_THRESHOLD = 4.0             # Standard deviations from the baseline that count as a spike
+DRIFT_RATIO = 2.0             # Fast latency average this many times the baseline is a drift
+MIN_LATENCY_STD = 0.1         # Floor on log-latency std (~10%) so a perfectly flat baseline isn't hair-trigger
+MIN_ERROR_STD = 1.0           # Floor on error-count std
+MAX_FAILURE_RATE = 0.2        # EWMA of failed checks above this is flagged
+RESTART_SLACK_SECONDS = 30    # Clock/uptime jitter tolerated before calling it a restart
+RESTART_WINDOW_SECONDS = 3600
+MAX_RESTARTS_PER_WINDOW = 3
+MAX_RESTARTS_KEPT = 10
+
+class Ewma:
+    """Exponentially weighted mean and variance with a time constant, updated in O(1)"""
+
+    def __init__(self, tau: float, mean: float = 0.0, var: float = 0.0, n: int = 0):
+        self.tau = tau
+        self.mean = mean
+        self.var = var
+        self.n = n
+
+    def std(self, floor: float = 0.0) -> float:
+        return max(math.sqrt(self.var), floor)
+
+    def zscore(self, value: float, floor: float = 0.0) -> float:
+        std = self.std(floor)
+        return (value - self.mean) / std if std > 0 else 0.0
+
+    def update(self, value: float, dt: float):
+        """Fold in a value observed dt seconds after the previous one"""
+        if self.n == 0:
+            self.mean, self.var = value, 0.0
+        else:
+            alpha = 1.0 - math.exp(-max(dt, 0.0) / self.tau)
+            diff = value - self.mean
+            increment = alpha * diff
+            self.mean += increment
+            self.var = (1 - alpha) * (self.var + diff * increment)
+        self.n += 1
+
+    def update_winsorized(self, value: float, dt: float, floor: float = 0.0):
+        """Update with value clamped to mean ± Z_THRESHOLD std, once warmed up"""
+        if self.n >= MIN_SAMPLES:
+            limit = Z_THRESHOLD * self.std(floor)
+            value = min(max(value, self.mean - limit), self.mean + limit)
+        self.update(value, dt)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"mean": self.mean, "var": self.var, "n": self.n}
+
+    @classmethod
+    def from_dict(cls, tau: float, data: Optional[Dict[str, Any]]) -> "Ewma":
+        data = data or {}
+        return cls(tau, float(data.get("mean", 0.0)), float(data.get("var", 0.0)), int(data.get("n", 0)))
+
+class TargetModel:
+    """Learned baseline for one health target"""
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        data = data or {}
+        self.latency_fast = Ewma.from_dict(FAST_TAU_SECONDS, data.get("latencyFast"))
+        self.latency_slow = Ewma.from_dict(SLOW_TAU_SECONDS, data.get("latencySlow"))
+        self.errors = Ewma.from_dict(SLOW_TAU_SECONDS, data.get("errors"))
+        self.failures = Ewma.from_dict(FAST_TAU_SECONDS, data.get("failures"))
+        self.last_uptime: Optional[float] = data.get("lastUptime")
+        self.last_uptime_at: Optional[float] = data.get("lastUptimeAt")
+        self.last_seen: Optional[float] = data.get("lastSeen")
+        self.restarts: List[float] = list(data.get("restarts", []))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "latencyFast": self.latency_fast.to_dict(),
+            "latencySlow": self.latency_slow.to_dict(),
+            "errors": self.errors.to_dict(),
+            "failures": self.failures.to_dict(),
+            "lastUptime": self.last_uptime,
+            "lastUptimeAt": self.last_uptime_at,
+            "lastSeen": self.last_seen,
+            "restarts": self.restarts,
+        }
+
+    def observe(self, result: Dict[str, Any], now: float) -> List[str]:
+        """Score one probe result against the baseline, then fold it in; returns anomaly descriptions"""
+        anomalies = []
+        dt = now - self.last_seen if self.last_seen is not None else 0.0
+        self.last_seen = now
+
+        self.failures.update(0.0 if result["success"] else 1.0, dt)
+        if self.failures.n >= MIN_SAMPLES and self.failures.mean > MAX_FAILURE_RATE:
+            anomalies.append(f"failing {self.failures.mean:.0%} of recent checks")
+
+        if not result["success"]:
+            return anomalies  # Timeouts and refusals say nothing about normal latency
+
+        latency_ms = result["latency"]["p50"] or result["response_time_ms"]
+        if latency_ms and latency_ms > 0:
+            anomalies.extend(self._observe_latency(math.log(latency_ms), latency_ms, dt))
+
+        if result["kind"] == "bot":
+            anomalies.extend(self._observe_bot(result, now, dt))
+        return anomalies
+
+    def _observe_latency(self, log_latency: float, latency_ms: float, dt: float) -> List[str]:
+        anomalies = []
+        self.latency_fast.update(log_latency, dt)
+        if self.latency_slow.n >= MIN_SAMPLES:
+            baseline_ms = math.exp(self.latency_slow.mean)
+            recent_ms = math.exp(self.latency_fast.mean)
+            if self.latency_slow.zscore(log_latency, MIN_LATENCY_STD) > Z_THRESHOLD:
+                anomalies.append(f"latency spike: {latency_ms:g}ms vs ~{baseline_ms:.0f}ms baseline")
+            elif recent_ms > baseline_ms * DRIFT_RATIO:
+                anomalies.append(f"latency drifting up: ~{recent_ms:.0f}ms recently vs ~{baseline_ms:.0f}ms baseline")
+        self.latency_slow.update_winsorized(log_latency, dt, MIN_LATENCY_STD)
+        return anomalies
+
+    def _observe_bot(self, result: Dict[str, Any], now: float, dt: float) -> List[str]:
+        anomalies = []
+
+        errors = float(result["errors"])
+        if self.errors.n >= MIN_SAMPLES and errors > self.errors.mean:
+            if self.errors.zscore(errors, MIN_ERROR_STD) > Z_THRESHOLD:
+                anomalies.append(f"error count jumped to {result['errors']} (usually ~{self.errors.mean:.1f})")
+        self.errors.update_winsorized(errors, dt, MIN_ERROR_STD)
+
+        uptime = float(result["uptime"])
+        if self.last_uptime is not None and self.last_uptime_at is not None:
+            expected = self.last_uptime + (now - self.last_uptime_at)
+            if uptime + RESTART_SLACK_SECONDS < expected:
+                self.restarts = (self.restarts + [now])[-MAX_RESTARTS_KEPT:]
+                anomalies.append(f"bot restarted (uptime {uptime:.0f}s)")
+        recent = [t for t in self.restarts if now - t <= RESTART_WINDOW_SECONDS]
+        if len(recent) > MAX_RESTARTS_PER_WINDOW:
+            anomalies.append(f"{len(recent)} restarts in the last hour")
+        self.last_uptime = uptime
+        self.last_uptime_at = now
+        return anomalies
+
+class AnomalyDetector:
+    """Per-target models, loaded from and saved to the state file"""
+
+    def __init__(self, state_path: str = STATE_PATH):
+        self.state_path = state_path
+        self.models: Dict[str, TargetModel] = {}
+        if os.path.exists(state_path):
+            try:
+                with open(state_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self.models = {name: TargetModel(model) for name, model in data.get("targets", {}).items()}
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Ignoring unreadable anomaly state {state_path}: {e}")
+
+    def observe(self, result: Dict[str, Any], now: Optional[float] = None) -> List[str]:
+        model = self.models.setdefault(result["name"], TargetModel())
+        return model.observe(result, time.time() if now is None else now)
+
+    def observe_all(self, results: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Anomalies per target name (targets without any are left out)"""
+        now = time.time()
+        found = {result["name"]: self.observe(result, now) for result in results}
+        return {name: anomalies for name, anomalies in found.items() if anomalies}
+
+    def save(self):
+        """Write the state atomically so an interrupted run can't leave a torn file"""
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"targets": {name: model.to_dict() for name, model in self.models.items()}}, f)
+        os.replace(tmp_path, self.state_path)
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+NBA 2K26 Discord Bot - Health Endpoint Load Benchmark
+
+Drives concurrent load at the bot's /health endpoint, the web server, or
+any configured health target, and reports throughput, latency percentiles
+and error rates. Use it to size the droplet and to catch regressions
+before a deploy.
+
+Two load models:
+    closed loop (default)  N workers each send the next request as soon as
+                           the previous one returns
+    open loop (--rate R)   requests are scheduled at a fixed R req/s across
+                           the workers; latency is measured from each
+                           request's scheduled start, so a stalled server
+                           can't hide its queueing delay (coordinated omission)
+
+Every worker keeps one keep-alive connection (timed_http.TimedHTTPClient)
+and records into its own LatencyHistogram; they are merged at the end.
+
+Usage:
+    python3 scripts/health_benchmark.py --target bot -c 16 -d 30
+    python3 scripts/health_benchmark.py --url http://localhost:3000 --rate 200 -c 32
+    python3 scripts/health_benchmark.py --stub --stub-delay-ms 5 -c 8    # offline self-test
+    python3 scripts/health_benchmark.py --target bot --max-p95-ms 50 --max-error-rate 0.01  # CI gate
+"""
+
+import sys
+import json
+import time
+import argparse
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional
+
+from latency_histogram import LatencyHistogram
+from health_probe import load_targets
+from timed_http import TimedHTTPClient, ProbeTimeout, ProbeConnectionError
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_DURATION_SECONDS = 10
+DEFAULT_WARMUP_SECONDS = 1
+DEFAULT_TIMEOUT_SECONDS = 5
+
+class WorkerStats:
+    """Per-worker counters; each worker owns one, so recording needs no lock"""
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.statuses: Counter = Counter()
+        self.errors: Counter = Counter()
+
+    def merge(self, other: "WorkerStats"):
+        self.histogram.merge(other.histogram)
+        self.statuses.update(other.statuses)
+        self.errors.update(other.errors)
+
+class Schedule:
+    """Hands out request slots: unbounded (closed loop) or paced at a fixed rate (open loop)"""
+
+    def __init__(self, start: float, end: float, rate: Optional[float], max_requests: Optional[int]):
+        self.start = start
+        self.end = end
+        self.rate = rate
+        self.max_requests = max_requests
+        self.issued = 0
+        self.lock = threading.Lock()
+
+    def next_slot(self) -> Optional[float]:
+        """Scheduled start time of the next request, or None when the run is over"""
+        with self.lock:
+            if self.max_requests is not None and self.issued >= self.max_requests:
+                return None
+            slot = self.start + self.issued / self.rate if self.rate else time.perf_counter()
+            if slot >= self.end:
+                return None
+            self.issued += 1
+            return slot
+
+def run_worker(url: str, schedule: Schedule, timeout: float, record_after: float, stats: WorkerStats):
+    client = TimedHTTPClient(url)
+    try:
+        while True:
+            slot = schedule.next_slot()
+            if slot is None:
+                return
+            delay = slot - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            # Open loop measures from the scheduled start; closed loop from the actual send
+            started = slot if schedule.rate else time.perf_counter()
+            try:
+                response = client.get(timeout)
+                outcome = response.status_code
+            except ProbeTimeout:
+                outcome = "timeout"
+            except ProbeConnectionError:
+                outcome = "connection"
+            latency_ms = (time.perf_counter() - started) * 1000
+
+            if started < record_after:
+                continue  # Warm-up: connections and caches settle before we measure
+            if isinstance(outcome, int):
+                stats.statuses[outcome] += 1
+                if outcome == 200:
+                    stats.histogram.record(latency_ms)
+                else:
+                    stats.errors[f"HTTP {outcome}"] += 1
+            else:
+                stats.errors[outcome] += 1
+    finally:
+        client.close()
+
+def run_benchmark(url: str, concurrency: int, duration: float, rate: Optional[float] = None,
+                  max_requests: Optional[int] = None, warmup: float = DEFAULT_WARMUP_SECONDS,
+                  timeout: float = DEFAULT_TIMEOUT_SECONDS) -> Dict[str, Any]:
+    """Run one benchmark and return its report"""
+    start = time.perf_counter()
+    record_after = start + warmup
+    schedule = Schedule(start, record_after + duration, rate, max_requests)
+    worker_stats = [WorkerStats() for _ in range(concurrency)]
+    threads = [
+        threading.Thread(target=run_worker, args=(url, schedule, timeout, record_after, stats),
+                         name=f"bench-{i}", daemon=True)
+        for i, stats in enumerate(worker_stats)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    finished = time.perf_counter()
+    elapsed = max(0.0, finished - record_after)
+
+    total = WorkerStats()
+    for stats in worker_stats:
+        total.merge(stats)
+    succeeded = total.histogram.count
+    failed = sum(total.errors.values())
+    completed = succeeded + failed
+
+    return {
+        "url": url,
+        "concurrency": concurrency,
+        "targetRate": rate,
+        "durationSeconds": round(elapsed, 2),
+        "requests": completed,
+        "succeeded": succeeded,
+        "failed": failed,
+        "throughput": round(completed / elapsed, 1) if elapsed > 0 else 0.0,
+        "errorRate": round(failed / completed, 4) if completed else 0.0,
+        "latencyMs": total.histogram.summary(),
+        "statuses": {str(code): n for code, n in sorted(total.statuses.items())},
+        "errors": dict(total.errors),
+    }
+
+# ---------------------------------------------------------------------------
+# Bundled stub server (offline self-test)
+# ---------------------------------------------------------------------------
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Mimics the bot's /health and the web server's index, with optional added latency"""
+
+    protocol_version = "HTTP/1.1"     # Keep-alive, like the real servers
+    disable_nagle_algorithm = True
+    wbufsize = 64 * 1024              # Headers and body leave in one write
+    delay_seconds = 0.0
+    started = time.time()
+
+    def do_GET(self):
+        if self.delay_seconds:
+            time.sleep(self.delay_seconds)
+        if self.path.split("?")[0] == "/health":
+            body = json.dumps({
+                "status": "healthy",
+                "uptime": int(time.time() - self.started),
+                "errors": [],
+            }).encode("utf-8")
+            content_type = "application/json"
+        else:
+            body = b"<!doctype html><html><body>NBA 2K26</body></html>"
+            content_type = "text/html"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_stub_server(delay_ms: float = 0.0, port: int = 0) -> ThreadingHTTPServer:
+    """Start the stub on 127.0.0.1 (port 0 picks a free one) on a background thread"""
+    handler = type("BoundStubHandler", (StubHandler,), {"delay_seconds": delay_ms / 1000.0})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="bench-stub", daemon=True).start()
+    return server
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def print_report(report: Dict[str, Any]):
+    latency = report["latencyMs"]
+    rate = f"{report['targetRate']:g} req/s target" if report["targetRate"] else "closed loop"
+    print(f"\nBenchmark: {report['url']}")
+    print(f"  Load:       {report['concurrency']} workers, {rate}, {report['durationSeconds']}s measured")
+    print(f"  Requests:   {report['requests']} ({report['succeeded']} ok, {report['failed']} failed)")
+    print(f"  Throughput: {report['throughput']} req/s")
+    print(f"  Error rate: {report['errorRate'] * 100:.2f}%")
+    if latency["count"]:
+        print(f"  Latency:    p50 {latency['p50']}ms | p95 {latency['p95']}ms | "
+              f"p99 {latency['p99']}ms | max {latency['max']}ms")
+    if report["errors"]:
+        print(f"  Errors:     " + ", ".join(f"{kind}: {n}" for kind, n in report["errors"].items()))
+    print()
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load-test the bot health endpoint or web server")
+    where = parser.add_mutually_exclusive_group()
+    where.add_argument("--target", default="bot",
+                       help="Name of a target in the health targets config (default: bot)")
+    where.add_argument("--url", help="Benchmark this URL instead of a configured target")
+    where.add_argument("--stub", action="store_true",
+                       help="Start the bundled stub server and benchmark it (no network needed)")
+    parser.add_argument("--targets", metavar="PATH", help="Health targets JSON (default: scripts/health_targets.json)")
+    parser.add_argument("-c", "--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Concurrent workers/connections (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("-d", "--duration", type=float, default=DEFAULT_DURATION_SECONDS,
+                        help=f"Measured seconds, after warm-up (default: {DEFAULT_DURATION_SECONDS})")
+    parser.add_argument("-n", "--requests", type=int, help="Stop after this many requests (including warm-up)")
+    parser.add_argument("--rate", type=float, help="Open-loop request rate in req/s across all workers")
+    parser.add_argument("--warmup", type=float, default=DEFAULT_WARMUP_SECONDS,
+                        help=f"Unmeasured warm-up seconds (default: {DEFAULT_WARMUP_SECONDS})")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT_SECONDS,
+                        help=f"Per-request timeout in seconds (default: {DEFAULT_TIMEOUT_SECONDS})")
+    parser.add_argument("--stub-delay-ms", type=float, default=0.0, help="Latency the stub server adds per request")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--max-p95-ms", type=float, help="Exit 1 if p95 latency exceeds this")
+    parser.add_argument("--max-error-rate", type=float, help="Exit 1 if the error rate (0-1) exceeds this")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    if args.concurrency < 1:
+        print("--concurrency must be at least 1")
+        sys.exit(2)
+
+    stub = None
+    if args.stub:
+        stub = start_stub_server(args.stub_delay_ms)
+        url = f"http://127.0.0.1:{stub.server_address[1]}/health"
+    elif args.url:
+        url = args.url
+    else:
+        targets = {t["name"]: t for t in load_targets(args.targets)}
+        if args.target not in targets:
+            print(f"Unknown target '{args.target}' (configured: {', '.join(targets)})")
+            sys.exit(2)
+        url = targets[args.target]["url"]
+
+    try:
+        report = run_benchmark(url, args.concurrency, args.duration, rate=args.rate,
+                               max_requests=args.requests, warmup=args.warmup, timeout=args.timeout)
+    finally:
+        if stub is not None:
+            stub.shutdown()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    failures = []
+    p95 = report["latencyMs"]["p95"]
+    if args.max_p95_ms is not None and (p95 is None or p95 > args.max_p95_ms):
+        failures.append(f"p95 {p95}ms exceeds {args.max_p95_ms:g}ms")
+    if args.max_error_rate is not None and report["errorRate"] > args.max_error_rate:
+        failures.append(f"error rate {report['errorRate']:.2%} exceeds {args.max_error_rate:.2%}")
+    if failures:
+        print("FAIL: " + "; ".join(failures), file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -6,26 +6,44 @@ This script performs deep health verification beyond basic HTTP pings:
 - Checks health endpoint response structure
 - Verifies bot uptime and status
 - Validates error counts and thresholds
-- Tests database connectivity
+- Tests database connectivity and latency (connect, SELECT 1, indexed read)
 - Monitors response times
 
+All configured targets are probed concurrently, so one hung service
+doesn't delay the others.
+
+Beyond the fixed thresholds below, each result is scored against a
+learned per-target baseline (health_anomaly.py), so gradual slowdowns,
+error jumps and restarts show up as DEGRADED well before a hard limit
+trips.
+
 Can be run manually or scheduled via cron for continuous monitoring.
 """
 
+import os
 import sys
-import json
 import time
-import requests
-from datetime import datetime
-from typing import Dict, Any, Optional
+import argparse
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List
+
+from db_pool import ConnectionPool, config_from_env
+from health_probe import ProbeEngine, load_targets
+from health_anomaly import AnomalyDetector, STATE_PATH as ANOMALY_STATE_PATH
 
 # Configuration
-HEALTH_URL = "http://localhost:3001/health"
-WEB_SERVER_URL = "http://localhost:3000"
-TIMEOUT_SECONDS = 10
+# Probe targets (bot instances, web server, HOFSN server) live in
+# scripts/health_targets.json; override with --targets or HEALTH_TARGETS_FILE
 MAX_ERRORS_ALLOWED = 5
+MAX_P95_RESPONSE_MS = 5000  # Judged on the burst's p95, not a single sample
 MIN_UPTIME_SECONDS = 60  # Alert if bot restarted recently
 
+# Database probe (runs when DATABASE_URL or DATABASE_HOST is set)
+DB_CONNECT_TIMEOUT_SECONDS = 10
+MAX_DB_CONNECT_MS = 3000  # TCP + TLS + auth handshake
+MAX_DB_QUERY_MS = 1000    # Each of SELECT 1 and the indexed read
+
 # ANSI color codes for terminal output
 class Colors:
     GREEN = '\033[92m'
@@ -42,115 +60,6 @@ def print_header():
     print(f"{Colors.BLUE}Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{Colors.END}")
     print(f"{Colors.BOLD}{'='*60}{Colors.END}\n")
 
-def check_health_endpoint() -> Dict[str, Any]:
-    """
-    Check the bot's health endpoint and validate response
-    
-    Returns:
-        dict: Health check results with status and details
-    """
-    result = {
-        "success": False,
-        "status": "unknown",
-        "uptime": 0,
-        "errors": 0,
-        "response_time_ms": 0,
-        "message": ""
-    }
-    
-    try:
-        start_time = time.time()
-        response = requests.get(HEALTH_URL, timeout=TIMEOUT_SECONDS)
-        response_time = (time.time() - start_time) * 1000  # Convert to ms
-        
-        result["response_time_ms"] = round(response_time, 2)
-        
-        if response.status_code != 200:
-            result["message"] = f"HTTP {response.status_code}"
-            return result
-        
-        # Parse JSON response
-        try:
-            data = response.json()
-        except json.JSONDecodeError:
-            result["message"] = "Invalid JSON response"
-            return result
-        
-        # Validate response structure
-        if "status" not in data:
-            result["message"] = "Missing 'status' field in response"
-            return result
-        
-        result["status"] = data.get("status", "unknown")
-        result["uptime"] = data.get("uptime", 0)
-        
-        # Handle errors as either list or count
-        errors = data.get("errors", [])
-        if isinstance(errors, list):
-            result["errors"] = len(errors)
-        else:
-            result["errors"] = errors
-        
-        # Check if bot is healthy
-        if result["status"] == "healthy":
-            result["success"] = True
-            result["message"] = "Bot is healthy and responsive"
-        elif result["status"] == "degraded":
-            result["success"] = True
-            result["message"] = f"Bot is degraded ({result['errors']} errors)"
-        else:
-            result["message"] = f"Bot status: {result['status']}"
-        
-        return result
-        
-    except requests.exceptions.Timeout:
-        result["message"] = f"Timeout after {TIMEOUT_SECONDS}s"
-        return result
-    except requests.exceptions.ConnectionError:
-        result["message"] = "Connection refused - bot may be offline"
-        return result
-    except Exception as e:
-        result["message"] = f"Unexpected error: {str(e)}"
-        return result
-
-def check_web_server() -> Dict[str, Any]:
-    """
-    Check if the web server is responding
-    
-    Returns:
-        dict: Web server check results
-    """
-    result = {
-        "success": False,
-        "response_time_ms": 0,
-        "message": ""
-    }
-    
-    try:
-        start_time = time.time()
-        response = requests.get(WEB_SERVER_URL, timeout=TIMEOUT_SECONDS)
-        response_time = (time.time() - start_time) * 1000
-        
-        result["response_time_ms"] = round(response_time, 2)
-        
-        if response.status_code == 200:
-            result["success"] = True
-            result["message"] = "Web server responding"
-        else:
-            result["message"] = f"HTTP {response.status_code}"
-        
-        return result
-        
-    except requests.exceptions.Timeout:
-        result["message"] = f"Timeout after {TIMEOUT_SECONDS}s"
-        return result
-    except requests.exceptions.ConnectionError:
-        result["message"] = "Connection refused"
-        return result
-    except Exception as e:
-        result["message"] = f"Error: {str(e)}"
-        return result
-
 def format_uptime(seconds: int) -> str:
     """Format uptime in human-readable format"""
     hours = seconds // 3600
@@ -164,6 +73,30 @@ def format_uptime(seconds: int) -> str:
     else:
         return f"{secs}s"
 
+def print_latency(result: Dict[str, Any]):
+    """Print the burst's latency percentiles (or the single sample for a burst of 1)"""
+    latency = result["latency"]
+    if latency["count"] <= 1:
+        print(f"  Response Time: {result['response_time_ms']}ms")
+    else:
+        print(f"  Response Time: p50 {latency['p50']}ms | p95 {latency['p95']}ms | "
+              f"p99 {latency['p99']}ms | max {latency['max']}ms ({latency['count']} probes)")
+    if result["failed_probes"]:
+        print(f"  Failed Probes: {Colors.YELLOW}{result['failed_probes']}{Colors.END}")
+    print_phases(result)
+
+PHASE_LABELS = (("dns_ms", "DNS"), ("connect_ms", "connect"), ("tls_ms", "TLS"),
+                ("ttfb_ms", "TTFB"), ("body_ms", "body"), ("json_ms", "JSON"))
+
+def print_phases(result: Dict[str, Any]):
+    """Print where the first request's time went (DNS, connect, TLS, TTFB, body, JSON)"""
+    phases = result.get("phases")
+    if not phases:
+        return
+    parts = [f"{label} {phases[key]}ms" for key, label in PHASE_LABELS if phases.get(key) is not None]
+    reused = " (reused connection)" if phases.get("reused") else ""
+    print(f"  Phases: {' | '.join(parts)}{reused}")
+
 def print_result(title: str, result: Dict[str, Any], check_type: str = "health"):
     """Print formatted check result"""
     print(f"{Colors.BOLD}{title}{Colors.END}")
@@ -176,22 +109,98 @@ def print_result(title: str, result: Dict[str, Any], check_type: str = "health")
             print(f"  Uptime: {format_uptime(result['uptime'])}")
             error_color = Colors.GREEN if result['errors'] == 0 else Colors.YELLOW
             print(f"  Errors: {error_color}{result['errors']}{Colors.END}")
-            print(f"  Response Time: {result['response_time_ms']}ms")
+            print_latency(result)
             print(f"  Message: {result['message']}")
         else:
             print(f"  Status: {Colors.RED}✗ FAILED{Colors.END}")
             print(f"  Message: {Colors.RED}{result['message']}{Colors.END}")
+            print_phases(result)
     else:
         # Web server check
         if result["success"]:
             print(f"  Status: {Colors.GREEN}✓ ONLINE{Colors.END}")
-            print(f"  Response Time: {result['response_time_ms']}ms")
+            print_latency(result)
         else:
             print(f"  Status: {Colors.RED}✗ OFFLINE{Colors.END}")
             print(f"  Message: {Colors.RED}{result['message']}{Colors.END}")
+            print_phases(result)
     
     print()
 
+def check_database() -> Dict[str, Any]:
+    """
+    Time the three things a bot command pays for on the database, separately:
+    acquiring a connection (TCP + TLS + auth), a trivial round-trip
+    (SELECT 1), and an indexed read (newest botHealthMetrics row via its
+    timestamp index).
+    """
+    result = {
+        "name": "database",
+        "kind": "db",
+        "url": "",
+        "success": False,
+        "response_time_ms": None,  # Set once the probe queries complete
+        "latency": {"count": 0, "p50": None},
+        "phases": None,
+        "last_sample_age": None,
+        "message": ""
+    }
+    try:
+        config = config_from_env()
+        result["url"] = f"{config['host']}:{config.get('port', 3306)}/{config['database']}"
+        # A private single-connection pool, so the first checkout is a real connect
+        pool = ConnectionPool(dict(config, connection_timeout=DB_CONNECT_TIMEOUT_SECONDS), size=1)
+        try:
+            start_time = time.perf_counter()
+            with pool.connection() as conn:
+                connected = time.perf_counter()
+                cursor = conn.cursor()
+                try:
+                    cursor.execute("SELECT 1")
+                    cursor.fetchall()
+                    pinged = time.perf_counter()
+                    
+                    cursor.execute("SELECT timestamp FROM botHealthMetrics ORDER BY timestamp DESC LIMIT 1")
+                    newest = cursor.fetchone()
+                    read_done = time.perf_counter()
+                finally:
+                    cursor.close()
+        finally:
+            pool.close()
+        
+        result["phases"] = {
+            "connect_ms": round((connected - start_time) * 1000, 2),
+            "ping_ms": round((pinged - connected) * 1000, 2),
+            "read_ms": round((read_done - pinged) * 1000, 2),
+        }
+        result["response_time_ms"] = round((read_done - start_time) * 1000, 2)
+        # Feeds the anomaly detector's query-latency baseline
+        query_ms = round(result["phases"]["ping_ms"] + result["phases"]["read_ms"], 2)
+        result["latency"] = {"count": 1, "p50": query_ms}
+        if newest:
+            # Sessions are UTC (db_pool), so the naive timestamp is UTC
+            written = newest[0].replace(tzinfo=timezone.utc)
+            result["last_sample_age"] = int((datetime.now(timezone.utc) - written).total_seconds())
+        result["success"] = True
+        result["message"] = "Database responding"
+    except Exception as e:
+        result["message"] = f"Database error: {e}"
+    return result
+
+def print_database(result: Dict[str, Any]):
+    print(f"{Colors.BOLD}🗄️  Database ({result['url'] or 'not configured'}){Colors.END}")
+    if result["success"]:
+        phases = result["phases"]
+        print(f"  Status: {Colors.GREEN}✓ CONNECTED{Colors.END}")
+        print(f"  Connect: {phases['connect_ms']}ms | SELECT 1: {phases['ping_ms']}ms | "
+              f"Indexed read: {phases['read_ms']}ms")
+        if result["last_sample_age"] is not None:
+            print(f"  Last botHealthMetrics sample: {format_uptime(max(result['last_sample_age'], 0))} ago")
+    else:
+        print(f"  Status: {Colors.RED}✗ FAILED{Colors.END}")
+        print(f"  Message: {Colors.RED}{result['message']}{Colors.END}")
+    print()
+
 def evaluate_health(health_result: Dict[str, Any]) -> tuple[bool, str]:
     """
     Evaluate overall health and return pass/fail with reason
@@ -210,36 +219,110 @@ def evaluate_health(health_result: Dict[str, Any]) -> tuple[bool, str]:
     
     # Removed uptime check - bot may restart frequently during development
     
-    if health_result["response_time_ms"] > 5000:
-        return False, f"Slow response time ({health_result['response_time_ms']}ms)"
+    p95 = health_result["latency"]["p95"]
+    if p95 is not None and p95 > MAX_P95_RESPONSE_MS:
+        return False, f"Slow response time (p95 {p95}ms > {MAX_P95_RESPONSE_MS}ms)"
+    
+    return True, "All checks passed"
+
+def evaluate_database(db_result: Dict[str, Any]) -> tuple[bool, str]:
+    """Database verdict: unreachable or slower than the limits fails the check"""
+    if not db_result["success"]:
+        return False, db_result["message"]
+    
+    phases = db_result["phases"]
+    if phases["connect_ms"] > MAX_DB_CONNECT_MS:
+        return False, f"Slow database connect ({phases['connect_ms']}ms > {MAX_DB_CONNECT_MS}ms)"
+    
+    slowest = max(phases["ping_ms"], phases["read_ms"])
+    if slowest > MAX_DB_QUERY_MS:
+        return False, f"Slow database queries ({slowest}ms > {MAX_DB_QUERY_MS}ms)"
     
     return True, "All checks passed"
 
+def detect_anomalies(results: List[Dict[str, Any]], state_path: str) -> Dict[str, List[str]]:
+    """Score results against the learned baselines and persist the updated state"""
+    detector = AnomalyDetector(state_path)
+    anomalies = detector.observe_all(results)
+    try:
+        detector.save()
+    except OSError as e:
+        print(f"{Colors.YELLOW}⚠️  Could not save anomaly state to {state_path}: {e}{Colors.END}\n")
+    return anomalies
+
+def target_title(result: Dict[str, Any]) -> str:
+    icon = {"bot": "🏥", "web": "🌐"}.get(result["kind"], "🔌")
+    return f"{icon} {result['name']} ({result['url']})"
+
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Deep health check for the NBA 2K26 bot")
+    parser.add_argument("--targets", help="Path to a JSON list of probe targets")
+    parser.add_argument("--burst", type=int, help="Requests per target per check (default: per target, 5)")
+    parser.add_argument("--anomaly-state", default=ANOMALY_STATE_PATH,
+                        help=f"Anomaly detector state file (default: {ANOMALY_STATE_PATH})")
+    parser.add_argument("--no-anomaly", action="store_true", help="Only apply the fixed thresholds")
+    parser.add_argument("--no-db", action="store_true", help="Skip the database latency probe")
+    args = parser.parse_args()
+    
     print_header()
     
-    # Check health endpoint
-    print(f"{Colors.BLUE}Checking bot health endpoint...{Colors.END}\n")
-    health_result = check_health_endpoint()
-    print_result("🏥 Health Endpoint", health_result, "health")
+    targets = load_targets(args.targets, args.burst)
     
-    # Check web server
-    print(f"{Colors.BLUE}Checking web server...{Colors.END}\n")
-    web_result = check_web_server()
-    print_result("🌐 Web Server", web_result, "web")
+    check_db = not args.no_db and bool(os.getenv("DATABASE_URL") or os.getenv("DATABASE_HOST"))
+    
+    # Probe every target at once, with the database probe running alongside
+    print(f"{Colors.BLUE}Probing {len(targets)} target(s){' and the database' if check_db else ''}...{Colors.END}\n")
+    engine = ProbeEngine(targets)
+    with ThreadPoolExecutor(max_workers=1) as db_executor:
+        db_future = db_executor.submit(check_database) if check_db else None
+        try:
+            results = engine.probe_all()
+        finally:
+            engine.close()
+        db_result = db_future.result() if db_future else None
     
-    # Overall evaluation
+    for result in results:
+        print_result(target_title(result), result, "health" if result["kind"] == "bot" else "web")
+    if db_result is not None:
+        print_database(db_result)
+    
+    observed = results + ([db_result] if db_result is not None and db_result["success"] else [])
+    anomalies = {} if args.no_anomaly else detect_anomalies(observed, args.anomaly_state)
+    if anomalies:
+        print(f"{Colors.BOLD}📈 Anomalies{Colors.END}")
+        for name, found in anomalies.items():
+            for anomaly in found:
+                print(f"  {Colors.YELLOW}{name}: {anomaly}{Colors.END}")
+        print()
+    
+    bot_results = [r for r in results if r["kind"] == "bot"]
+    other_results = [r for r in results if r["kind"] != "bot"]
+    
+    # Overall evaluation: every bot instance and the database must pass; other services only degrade
     print(f"{Colors.BOLD}{'='*60}{Colors.END}")
-    is_healthy, reason = evaluate_health(health_result)
+    is_healthy, reason = True, "All checks passed"
+    for bot_result in bot_results:
+        bot_healthy, bot_reason = evaluate_health(bot_result)
+        if not bot_healthy:
+            is_healthy = False
+            reason = bot_reason if len(bot_results) == 1 else f"{bot_result['name']}: {bot_reason}"
+            break
+    # Slow or unreachable TiDB breaks bot commands even while /health answers
+    if is_healthy and db_result is not None:
+        is_healthy, reason = evaluate_database(db_result)
+    offline = [r["name"] for r in other_results if not r["success"]]
     
-    if is_healthy and web_result["success"]:
+    if is_healthy and not offline and not anomalies:
         print(f"{Colors.GREEN}{Colors.BOLD}✓ OVERALL STATUS: HEALTHY{Colors.END}")
         print(f"{Colors.GREEN}  {reason}{Colors.END}")
         exit_code = 0
-    elif is_healthy and not web_result["success"]:
+    elif is_healthy:
         print(f"{Colors.YELLOW}{Colors.BOLD}⚠ OVERALL STATUS: DEGRADED{Colors.END}")
-        print(f"{Colors.YELLOW}  Bot is healthy but web server is not responding{Colors.END}")
+        if offline:
+            print(f"{Colors.YELLOW}  Bot is healthy but not responding: {', '.join(offline)}{Colors.END}")
+        else:
+            print(f"{Colors.YELLOW}  Anomalous behaviour: {', '.join(anomalies)}{Colors.END}")
         exit_code = 1
     else:
         print(f"{Colors.RED}{Colors.BOLD}✗ OVERALL STATUS: UNHEALTHY{Colors.END}")
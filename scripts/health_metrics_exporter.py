@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+NBA 2K26 Discord Bot - Prometheus Metrics Exporter
+
+Serves the health checker's latest results at /metrics in the Prometheus
+text exposition format. The probe loop pushes each round of results into
+a MetricsState; the exposition text is rendered once per round and the
+HTTP handler only returns the cached bytes, so scrapes never touch the
+probes or the database and stay cheap at any scrape frequency.
+
+Used by `health_check_db.py --daemon --metrics-port 9464`.
+"""
+
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+
+from latency_histogram import LatencyHistogram, bucket_bounds, TICK_MS
+
+PREFIX = "nba2k26"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Coarse `le` boundaries (seconds) exposed from the fine-grained latency histogram
+LATENCY_BUCKETS_SECONDS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+BOT_STATUSES = ("healthy", "degraded", "unhealthy", "unknown")
+
+def escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def labels(**pairs) -> str:
+    return "{" + ",".join(f'{key}="{escape_label(value)}"' for key, value in pairs.items()) + "}"
+
+class TargetCounters:
+    """Cumulative per-target counters kept across probe rounds"""
+
+    def __init__(self):
+        self.checks = 0
+        self.check_failures = 0
+        self.probes = 0
+        self.probe_failures = 0
+        self.histogram = LatencyHistogram()
+
+class MetricsState:
+    """
+    In-memory view of the checker, updated by the probe loop.
+
+    update() is called once per sample and re-renders the exposition text,
+    so a scrape only copies the cached bytes.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.samples = 0
+        self.last_sample_timestamp: Optional[float] = None
+        self.last_sample_seconds: Optional[float] = None
+        self.spool_pending = 0
+        self.db_flush_failures = 0
+        self.results: List[Dict[str, Any]] = []
+        self.counters: Dict[str, TargetCounters] = {}
+        self.cached = self._render().encode("utf-8")
+
+    def update(self, results: List[Dict[str, Any]], sample_seconds: float,
+               spool_pending: int = 0, db_flush_failed: bool = False):
+        with self.lock:
+            self.samples += 1
+            self.last_sample_timestamp = time.time()
+            self.last_sample_seconds = sample_seconds
+            self.spool_pending = spool_pending
+            self.db_flush_failures += 1 if db_flush_failed else 0
+            self.results = results
+            for result in results:
+                counters = self.counters.setdefault(result["name"], TargetCounters())
+                counters.checks += 1
+                counters.check_failures += 0 if result["success"] else 1
+                histogram = result.get("histogram")
+                recorded = histogram.count if histogram is not None else 0
+                if recorded:
+                    counters.histogram.merge(histogram)
+                # A first request that never completed isn't in the histogram but was still sent
+                counters.probes += max(1, recorded + result.get("failed_probes", 0))
+                counters.probe_failures += result.get("failed_probes", 0) + (0 if result["success"] else 1)
+            self.cached = self._render().encode("utf-8")
+
+    def exposition(self) -> bytes:
+        with self.lock:
+            return self.cached
+
+    def _render(self) -> str:
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples: List[tuple]):
+            lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+            for suffix, label_str, value in samples:
+                lines.append(f"{PREFIX}_{name}{suffix}{label_str} {format_value(value)}")
+
+        results = self.results
+        metric("target_up", "gauge", "1 if the target's last check succeeded",
+               [("", labels(target=r["name"], kind=r["kind"]), 1 if r["success"] else 0) for r in results])
+        # A check that got no response has no response time; leave the series out rather than report 0
+        metric("target_response_time_seconds", "gauge", "p50 response time of the target's last check",
+               [("", labels(target=r["name"]), r["response_time_ms"] / 1000.0) for r in results
+                if r["response_time_ms"] is not None])
+
+        bots = [r for r in results if r["kind"] == "bot"]
+        metric("bot_status", "gauge", "Bot status reported by /health (one series per state)",
+               [("", labels(target=r["name"], status=status), 1 if r["status"] == status else 0)
+                for r in bots for status in BOT_STATUSES])
+        metric("bot_uptime_seconds", "gauge", "Bot uptime reported by /health",
+               [("", labels(target=r["name"]), r["uptime"]) for r in bots])
+        metric("bot_errors", "gauge", "Error count reported by /health",
+               [("", labels(target=r["name"]), r["errors"]) for r in bots])
+
+        web = [r for r in results if r["kind"] == "web"]
+        metric("web_server_up", "gauge", "1 if the web server responded with HTTP 200",
+               [("", labels(target=r["name"]), 1 if r["success"] else 0) for r in web])
+
+        metric("checks_total", "counter", "Checks run per target since start",
+               [("", labels(target=name), c.checks) for name, c in self.counters.items()])
+        metric("check_failures_total", "counter", "Failed checks per target since start",
+               [("", labels(target=name), c.check_failures) for name, c in self.counters.items()])
+        metric("probe_requests_total", "counter", "HTTP probe requests sent per target since start",
+               [("", labels(target=name), c.probes) for name, c in self.counters.items()])
+        metric("probe_failures_total", "counter", "HTTP probe requests that failed per target since start",
+               [("", labels(target=name), c.probe_failures) for name, c in self.counters.items()])
+
+        histogram_samples = []
+        for name, c in self.counters.items():
+            histogram_samples.extend(histogram_series(name, c.histogram))
+        metric("probe_latency_seconds", "histogram", "Probe request latency per target since start",
+               histogram_samples)
+
+        metric("checker_samples_total", "counter", "Probe rounds completed since start",
+               [("", "", self.samples)])
+        metric("checker_sample_duration_seconds", "gauge", "Wall-clock time of the last probe round",
+               [("", "", self.last_sample_seconds)] if self.last_sample_seconds is not None else [])
+        metric("checker_last_sample_timestamp_seconds", "gauge", "Unix time of the last probe round",
+               [("", "", self.last_sample_timestamp)] if self.last_sample_timestamp is not None else [])
+        metric("checker_start_time_seconds", "gauge", "Unix time the checker started",
+               [("", "", self.started)])
+        metric("checker_spool_pending", "gauge", "Samples waiting in the spool for a DB flush",
+               [("", "", self.spool_pending)])
+        metric("checker_db_flush_failures_total", "counter", "Failed botHealthMetrics flushes since start",
+               [("", "", self.db_flush_failures)])
+
+        return "\n".join(lines) + "\n"
+
+def format_value(value) -> str:
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+def histogram_series(target: str, histogram: LatencyHistogram) -> List[tuple]:
+    """Cumulative `le` buckets; a fine bucket counts toward `le` once its upper edge fits"""
+    series = []
+    for le in LATENCY_BUCKETS_SECONDS:
+        limit_ms = le * 1000.0
+        cumulative = sum(
+            n for i, n in enumerate(histogram.counts)
+            if n and bucket_bounds(i)[1] * TICK_MS <= limit_ms
+        )
+        series.append(("_bucket", labels(target=target, le=format_value(le)), cumulative))
+    series.append(("_bucket", labels(target=target, le="+Inf"), histogram.count))
+    series.append(("_sum", labels(target=target), round(histogram.total_ms / 1000.0, 6)))
+    series.append(("_count", labels(target=target), histogram.count))
+    return series
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    state: MetricsState = None
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.state.exposition()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes every few seconds would flood the journal
+
+def start_metrics_server(state: MetricsState, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve /metrics from `state` on a background thread"""
+    handler = type("BoundMetricsHandler", (MetricsHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True)
+    thread.start()
+    return server
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+NBA 2K26 Discord Bot - Concurrent Health Probe Engine
+
+Shared by health_check.py and health_check_db.py. Reads the list of
+endpoints to probe from a JSON config and probes all of them at once on a
+thread pool, so a run takes as long as the slowest single probe instead of
+the sum of all of them.
+
+Each check fires a short burst of requests at a target (default 5, set
+per target with "burst" or globally with HEALTH_PROBE_BURST) and records
+their latencies in a LatencyHistogram, so verdicts can use p95/p99
+instead of a single noisy sample.
+
+Requests go through timed_http.TimedHTTPClient, which keeps one
+connection per target alive and splits the validated request's time into
+DNS, connect, TLS, TTFB and body phases; JSON decode time is added here.
+The breakdown is returned as result["phases"].
+
+Target config (scripts/health_targets.json, or HEALTH_TARGETS_FILE):
+    [
+        {"name": "bot", "kind": "bot", "url": "http://localhost:3001/health", "timeout": 10, "burst": 5},
+        {"name": "web", "kind": "web", "url": "http://localhost:3000"}
+    ]
+
+Kinds:
+    bot  - bot health endpoint; the JSON body is validated (status/uptime/errors)
+    web  - web server; any HTTP 200 counts as up
+    http - any other service (e.g. the HOFSN server); HTTP 200 counts as up
+"""
+
+import os
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, List, Optional
+
+from latency_histogram import LatencyHistogram
+from timed_http import TimedHTTPClient, ProbeTimeout, ProbeConnectionError
+
+DEFAULT_TIMEOUT_SECONDS = 10
+DEFAULT_BURST = int(os.getenv("HEALTH_PROBE_BURST", "5"))
+DEADLINE_GRACE_SECONDS = 0.25  # Lets a burst that ends right at its deadline still report
+DEFAULT_TARGETS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "health_targets.json")
+
+# Used when no config file exists, matching the original hard-coded checks
+DEFAULT_TARGETS = [
+    {"name": "bot", "kind": "bot", "url": "http://localhost:3001/health"},
+    {"name": "web", "kind": "web", "url": "http://localhost:3000"},
+]
+
+TARGET_KINDS = ("bot", "web", "http")
+
+def load_targets(path: Optional[str] = None, burst: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Load probe targets from JSON, filling in defaults for optional fields (burst overrides all)"""
+    path = path or os.getenv("HEALTH_TARGETS_FILE", DEFAULT_TARGETS_FILE)
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            raw_targets = json.load(f)
+    else:
+        raw_targets = DEFAULT_TARGETS
+
+    targets = []
+    for raw in raw_targets:
+        if "url" not in raw:
+            raise ValueError(f"Health target is missing 'url': {raw}")
+        kind = raw.get("kind", "http")
+        if kind not in TARGET_KINDS:
+            raise ValueError(f"Unknown health target kind '{kind}' (expected one of {TARGET_KINDS})")
+        targets.append({
+            "name": raw.get("name", raw["url"]),
+            "kind": kind,
+            "url": raw["url"],
+            "timeout": float(raw.get("timeout", DEFAULT_TIMEOUT_SECONDS)),
+            "burst": max(1, int(burst if burst is not None else raw.get("burst", DEFAULT_BURST))),
+        })
+
+    if not targets:
+        raise ValueError(f"No health targets configured in {path}")
+    return targets
+
+def empty_result(target: Dict[str, Any]) -> Dict[str, Any]:
+    result = {
+        "name": target["name"],
+        "kind": target["kind"],
+        "url": target["url"],
+        "success": False,
+        "response_time_ms": None,  # None until a response arrives; failures aren't latency samples
+        "failed_after_ms": None,   # Time spent before a timeout/refusal, when there was no response
+        "latency": LatencyHistogram().summary(),
+        "histogram": None,
+        "failed_probes": 0,
+        "phases": None,
+        "message": ""
+    }
+    if target["kind"] == "bot":
+        result.update({"status": "unknown", "uptime": 0, "errors": 0})
+    return result
+
+def parse_bot_health(result: Dict[str, Any], response) -> Dict[str, Any]:
+    """Validate a bot /health JSON body and copy status, uptime and errors into result"""
+    start_time = time.perf_counter()
+    try:
+        data = json.loads(response.content)
+    except (json.JSONDecodeError, UnicodeDecodeError, ValueError):
+        result["message"] = "Invalid JSON response"
+        return result
+    finally:
+        if result["phases"] is not None:
+            result["phases"]["json_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
+
+    if not isinstance(data, dict):
+        result["message"] = "Invalid JSON response"
+        return result
+
+    # Validate response structure
+    if "status" not in data:
+        result["message"] = "Missing 'status' field in response"
+        return result
+
+    result["status"] = data.get("status", "unknown")
+    result["uptime"] = data.get("uptime", 0)
+
+    # Handle errors as either list or count
+    errors = data.get("errors", [])
+    if isinstance(errors, list):
+        result["errors"] = len(errors)
+    else:
+        result["errors"] = errors
+
+    # Check if bot is healthy
+    if result["status"] == "healthy":
+        result["success"] = True
+        result["message"] = "Bot is healthy and responsive"
+    elif result["status"] == "degraded":
+        result["success"] = True
+        result["message"] = f"Bot is degraded ({result['errors']} errors)"
+    else:
+        result["message"] = f"Bot status: {result['status']}"
+
+    return result
+
+def probe_target(target: Dict[str, Any], client: Optional[TimedHTTPClient] = None) -> Dict[str, Any]:
+    """
+    Probe a single target with a burst of requests; never raises.
+
+    The first request is fully validated and decides success/status. The
+    rest of the burst only records latency, and stops early if the
+    target's deadline runs out. response_time_ms is the burst's p50 and
+    result["phases"] is the first request's timing breakdown. If the
+    first request gets no response at all, response_time_ms stays None
+    and failed_after_ms records how long it took to fail.
+    """
+    client = client or TimedHTTPClient(target["url"])
+    result = empty_result(target)
+    histogram = LatencyHistogram()
+    started = time.monotonic()
+    deadline = started + target["timeout"]
+
+    try:
+        response = client.get(target["timeout"])
+        result["phases"] = dict(response.phases, json_ms=None)
+
+        histogram.record(response.phases["total_ms"])
+        result["response_time_ms"] = response.phases["total_ms"]
+
+        if response.status_code != 200:
+            result["message"] = f"HTTP {response.status_code}"
+            return attach_latency(result, histogram)
+
+        if target["kind"] == "bot":
+            parse_bot_health(result, response)
+        else:
+            result["success"] = True
+            result["message"] = "Web server responding" if target["kind"] == "web" else "Responding"
+
+    except ProbeTimeout:
+        result["message"] = f"Timeout after {target['timeout']:g}s"
+        return failed_after(result, started)
+    except ProbeConnectionError:
+        if target["kind"] == "bot":
+            result["message"] = "Connection refused - bot may be offline"
+        else:
+            result["message"] = "Connection refused"
+        return failed_after(result, started)
+    except Exception as e:
+        result["message"] = f"Unexpected error: {str(e)}"
+        return failed_after(result, started)
+
+    # Rest of the burst: latency samples only
+    for _ in range(target["burst"] - 1):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            response = client.get(remaining)
+            histogram.record(response.phases["total_ms"])
+            if response.status_code != 200:
+                result["failed_probes"] += 1
+        except Exception:
+            result["failed_probes"] += 1
+
+    return attach_latency(result, histogram)
+
+def failed_after(result: Dict[str, Any], started: float) -> Dict[str, Any]:
+    result["failed_after_ms"] = round((time.monotonic() - started) * 1000, 2)
+    return result
+
+def attach_latency(result: Dict[str, Any], histogram: LatencyHistogram) -> Dict[str, Any]:
+    result["latency"] = histogram.summary()
+    result["histogram"] = histogram
+    if histogram.count:
+        result["response_time_ms"] = result["latency"]["p50"]
+    return result
+
+class ProbeEngine:
+    """
+    Probes every configured target concurrently.
+
+    Each target gets its own keep-alive client (a connection can only
+    carry one request at a time) and its own deadline: a probe that is
+    still running when its deadline passes is reported as timed out without
+    holding up the rest of the run.
+    """
+
+    def __init__(self, targets: List[Dict[str, Any]]):
+        self.targets = targets
+        self.clients = {target["name"]: TimedHTTPClient(target["url"]) for target in targets}
+        # Spare workers so a probe still hung from the previous round can't starve this one
+        self.executor = ThreadPoolExecutor(max_workers=len(targets) * 2, thread_name_prefix="probe")
+
+    def probe_all(self) -> List[Dict[str, Any]]:
+        """Probe all targets at once; results are returned in config order"""
+        started = time.monotonic()
+        futures = [
+            self.executor.submit(probe_target, target, self.clients[target["name"]])
+            for target in self.targets
+        ]
+
+        results = []
+        for target, future in zip(self.targets, futures):
+            # Socket timeouts apply per operation, so enforce the total here
+            remaining = started + target["timeout"] + DEADLINE_GRACE_SECONDS - time.monotonic()
+            try:
+                results.append(future.result(timeout=max(0.0, remaining)))
+            except FutureTimeoutError:
+                # The hung probe still owns its connection; give the next round a fresh one
+                self.clients[target["name"]] = TimedHTTPClient(target["url"])
+                result = empty_result(target)
+                result["failed_after_ms"] = round(target["timeout"] * 1000, 2)
+                result["message"] = f"Timeout after {target['timeout']:g}s"
+                results.append(result)
+        return results
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        for client in self.clients.values():
+            client.close()
+
+def first_of_kind(results: List[Dict[str, Any]], kind: str) -> Optional[Dict[str, Any]]:
+    """Return the first result for a target kind (the primary bot / web server)"""
+    for result in results:
+        if result["kind"] == kind:
+            return result
+    return None
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+NBA 2K26 Discord Bot - botHealthMetrics Rollup & Retention Job
+
+Incrementally aggregates raw botHealthMetrics rows into 1-minute, 1-hour
+and 1-day summaries in botHealthRollups, then prunes raw rows that are
+older than the retention window.
+
+Progress is tracked by a watermark on insert time (botHealthMetrics.createdAt,
+with the id as a tie-break) in botHealthRollupState, so each run only
+reads rows it has never seen. Neither the sample timestamp nor the id
+works for this: spooled samples are inserted up to a flush interval
+after they were taken, and on TiDB AUTO_INCREMENT ids are handed out in
+per-node ranges, so a later insert can get a lower id. Rows that land in
+a bucket that already has a summary (late spooled samples, replays after
+an outage) are merged into it, using the stored latency histogram so
+percentiles stay exact across merges.
+
+Usage:
+    python3 scripts/health_rollup.py                       # roll up + prune (30 day raw retention)
+    python3 scripts/health_rollup.py --retention-days 14
+    python3 scripts/health_rollup.py --no-prune
+
+Schedule it every minute via cron (see setup_cron.sh).
+"""
+
+import sys
+import json
+import argparse
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional, Tuple
+import os
+
+from db_pool import get_pool, close_pool, bulk_insert
+from latency_histogram import LatencyHistogram
+
+# Configuration
+DB_URL = os.getenv("DATABASE_URL", "")
+RESOLUTIONS = {"1m": 60, "1h": 3600, "1d": 86400}
+WATERMARK_NAME = "botHealthMetrics"
+BATCH_SIZE = 5000
+PRUNE_BATCH_SIZE = 5000
+RAW_RETENTION_DAYS = 30
+MINUTE_RETENTION_DAYS = 90
+# Only read rows inserted at least this long ago, so an insert whose
+# transaction hasn't committed yet can't later appear below the watermark
+SETTLE_SECONDS = 30
+EPOCH = datetime(1970, 1, 1, 0, 0, 1)  # Watermark before the first run
+
+ROLLUP_COLUMNS = [
+    "resolution", "bucketStart", "sampleCount", "upCount", "healthyCount", "degradedCount",
+    "unhealthyCount", "webUpCount", "uptimePct", "minResponseTime", "avgResponseTime",
+    "maxResponseTime", "p50ResponseTime", "p95ResponseTime", "p99ResponseTime", "healthSampleCount",
+    "webSampleCount", "avgWebResponseTime", "errorTotal", "maxErrors", "latencyHistogram",
+]
+
+class RollupBucket:
+    """Running aggregate for one (resolution, bucketStart) summary row"""
+
+    def __init__(self):
+        self.sample_count = 0
+        self.up_count = 0
+        self.healthy = 0
+        self.degraded = 0
+        self.unhealthy = 0
+        self.web_up = 0
+        self.rt_min: Optional[int] = None
+        self.rt_max: Optional[int] = None
+        self.rt_sum = 0.0
+        self.rt_count = 0
+        self.web_count = 0
+        self.web_sum = 0.0
+        self.error_total = 0
+        self.max_errors = 0
+        self.histogram = LatencyHistogram()
+
+    def add_sample(self, row: Dict[str, Any]):
+        status = row["status"]
+        rt = row["healthResponseTime"]
+        self.sample_count += 1
+        self.healthy += status == "healthy"
+        self.degraded += status == "degraded"
+        self.unhealthy += status not in ("healthy", "degraded")
+        self.up_count += status in ("healthy", "degraded")
+        self.web_up += 1 if row["webServerUp"] else 0
+        # healthResponseTime is NULL when the probe got no response; that's downtime, not latency
+        if rt is not None:
+            self.rt_count += 1
+            self.rt_min = rt if self.rt_min is None else min(self.rt_min, rt)
+            self.rt_max = rt if self.rt_max is None else max(self.rt_max, rt)
+            self.rt_sum += rt
+        if row["webResponseTime"] is not None:
+            self.web_count += 1
+            self.web_sum += row["webResponseTime"]
+        self.error_total += row["errors"]
+        self.max_errors = max(self.max_errors, row["errors"])
+
+        # Prefer the full burst histogram; older rows only have the single sample
+        if row.get("healthLatencyHistogram"):
+            self.histogram.merge(LatencyHistogram.from_dict(json.loads(row["healthLatencyHistogram"])))
+        elif rt is not None:
+            self.histogram.record(rt)
+
+    def merge_existing(self, stored: Dict[str, Any]):
+        """Fold an already-stored summary row into this bucket"""
+        self.sample_count += stored["sampleCount"]
+        self.up_count += stored["upCount"]
+        self.healthy += stored["healthyCount"]
+        self.degraded += stored["degradedCount"]
+        self.unhealthy += stored["unhealthyCount"]
+        self.web_up += stored["webUpCount"]
+        self.rt_count += stored["healthSampleCount"]
+        if stored["healthSampleCount"]:
+            for value in (stored["minResponseTime"], stored["maxResponseTime"]):
+                self.rt_min = value if self.rt_min is None else min(self.rt_min, value)
+                self.rt_max = value if self.rt_max is None else max(self.rt_max, value)
+            self.rt_sum += float(stored["avgResponseTime"]) * stored["healthSampleCount"]
+        self.web_count += stored["webSampleCount"]
+        if stored["avgWebResponseTime"] is not None:
+            self.web_sum += float(stored["avgWebResponseTime"]) * stored["webSampleCount"]
+        self.error_total += stored["errorTotal"]
+        self.max_errors = max(self.max_errors, stored["maxErrors"])
+        if stored["latencyHistogram"]:
+            self.histogram.merge(LatencyHistogram.from_dict(json.loads(stored["latencyHistogram"])))
+
+    def to_params(self, resolution: str, bucket_start: datetime) -> tuple:
+        latency = self.histogram.summary()
+        return (
+            resolution,
+            bucket_start.strftime("%Y-%m-%d %H:%M:%S"),
+            self.sample_count,
+            self.up_count,
+            self.healthy,
+            self.degraded,
+            self.unhealthy,
+            self.web_up,
+            round(self.up_count / self.sample_count * 100, 3),
+            self.rt_min,
+            round(self.rt_sum / self.rt_count, 2) if self.rt_count else None,
+            self.rt_max,
+            round_ms(latency["p50"]),
+            round_ms(latency["p95"]),
+            round_ms(latency["p99"]),
+            self.rt_count,
+            self.web_count,
+            round(self.web_sum / self.web_count, 2) if self.web_count else None,
+            self.error_total,
+            self.max_errors,
+            json.dumps(self.histogram.to_dict()),
+        )
+
+def round_ms(value: Optional[float]) -> Optional[int]:
+    return int(round(value)) if value is not None else None
+
+def bucket_start(ts: datetime, seconds: int) -> datetime:
+    """Floor a (UTC, naive) timestamp to the start of its bucket"""
+    epoch = int(ts.replace(tzinfo=timezone.utc).timestamp())
+    return datetime.fromtimestamp(epoch - epoch % seconds, tz=timezone.utc).replace(tzinfo=None)
+
+def lock_watermark(cursor) -> Tuple[datetime, int]:
+    """Read the (createdAt, id) watermark with a row lock so overlapping runs can't double-count"""
+    cursor.execute(
+        "INSERT IGNORE INTO botHealthRollupState (name, lastMetricId) VALUES (%s, 0)",
+        (WATERMARK_NAME,)
+    )
+    cursor.execute(
+        "SELECT lastCreatedAt, lastMetricId FROM botHealthRollupState WHERE name = %s FOR UPDATE",
+        (WATERMARK_NAME,)
+    )
+    state = cursor.fetchone()
+    return state["lastCreatedAt"] or EPOCH, state["lastMetricId"]
+
+def fetch_new_rows(cursor, watermark: Tuple[datetime, int], batch_size: int) -> List[Dict[str, Any]]:
+    """The next settled rows after the watermark, in (createdAt, id) order"""
+    created_at, last_id = watermark
+    cursor.execute(
+        """
+        SELECT id, createdAt, timestamp, status, errors, healthResponseTime, webResponseTime,
+               webServerUp, healthLatencyHistogram
+        FROM botHealthMetrics
+        WHERE (createdAt > %s OR (createdAt = %s AND id > %s))
+          AND createdAt <= NOW() - INTERVAL %s SECOND
+        ORDER BY createdAt, id
+        LIMIT %s
+        """,
+        (created_at, created_at, last_id, SETTLE_SECONDS, batch_size)
+    )
+    return cursor.fetchall()
+
+def load_existing(cursor, keys: List[Tuple[str, datetime]]) -> Dict[Tuple[str, datetime], Dict[str, Any]]:
+    existing = {}
+    for resolution in RESOLUTIONS:
+        starts = [start for res, start in keys if res == resolution]
+        if not starts:
+            continue
+        placeholders = ", ".join(["%s"] * len(starts))
+        cursor.execute(
+            f"SELECT * FROM botHealthRollups WHERE resolution = %s AND bucketStart IN ({placeholders})",
+            [resolution] + [start.strftime("%Y-%m-%d %H:%M:%S") for start in starts]
+        )
+        for stored in cursor.fetchall():
+            existing[(resolution, stored["bucketStart"])] = stored
+    return existing
+
+def upsert_rollups(cursor, buckets: Dict[Tuple[str, datetime], RollupBucket]):
+    bulk_insert(
+        cursor, "botHealthRollups", ROLLUP_COLUMNS,
+        [bucket.to_params(res, start) for (res, start), bucket in sorted(buckets.items())],
+        update_columns=ROLLUP_COLUMNS[2:]
+    )
+
+def roll_up(conn, batch_size: int = BATCH_SIZE) -> int:
+    """Aggregate every settled raw row past the watermark; returns rows processed"""
+    processed = 0
+    while True:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            watermark = lock_watermark(cursor)
+            rows = fetch_new_rows(cursor, watermark, batch_size)
+            if not rows:
+                conn.rollback()
+                break
+
+            buckets: Dict[Tuple[str, datetime], RollupBucket] = {}
+            for row in rows:
+                for resolution, seconds in RESOLUTIONS.items():
+                    key = (resolution, bucket_start(row["timestamp"], seconds))
+                    buckets.setdefault(key, RollupBucket()).add_sample(row)
+
+            for key, stored in load_existing(cursor, list(buckets)).items():
+                buckets[key].merge_existing(stored)
+
+            upsert_rollups(cursor, buckets)
+            cursor.execute(
+                "UPDATE botHealthRollupState SET lastCreatedAt = %s, lastMetricId = %s WHERE name = %s",
+                (rows[-1]["createdAt"], rows[-1]["id"], WATERMARK_NAME)
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        processed += len(rows)
+        print(f"  Rolled up {len(rows)} row(s) into {len(buckets)} bucket(s) "
+              f"(inserted through {rows[-1]['createdAt']:%Y-%m-%d %H:%M:%S})")
+        if len(rows) < batch_size:
+            break
+    return processed
+
+def delete_in_batches(conn, query: str, params: tuple, batch_size: int = PRUNE_BATCH_SIZE) -> int:
+    """Run a bounded DELETE ... LIMIT repeatedly, committing between batches"""
+    deleted = 0
+    cursor = conn.cursor()
+    try:
+        while True:
+            cursor.execute(f"{query} LIMIT {int(batch_size)}", params)
+            conn.commit()
+            deleted += cursor.rowcount
+            if cursor.rowcount < batch_size:
+                break
+    finally:
+        cursor.close()
+    return deleted
+
+def prune(conn, raw_retention_days: int, minute_retention_days: int) -> Tuple[int, int]:
+    """Delete raw rows (already rolled up) and 1m summaries past their retention windows"""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT lastCreatedAt FROM botHealthRollupState WHERE name = %s", (WATERMARK_NAME,))
+    row = cursor.fetchone()
+    cursor.close()
+    rolled_up_before = row[0] if row else None
+
+    # Never delete raw rows the rollup hasn't consumed yet: everything inserted
+    # before the watermark's second has been (rows in that second may not have)
+    raw_deleted = 0
+    if rolled_up_before is not None:
+        raw_deleted = delete_in_batches(
+            conn,
+            "DELETE FROM botHealthMetrics WHERE timestamp < %s AND createdAt < %s ORDER BY id",
+            ((now - timedelta(days=raw_retention_days)).strftime("%Y-%m-%d %H:%M:%S"), rolled_up_before)
+        )
+    minute_deleted = delete_in_batches(
+        conn,
+        "DELETE FROM botHealthRollups WHERE resolution = '1m' AND bucketStart < %s ORDER BY bucketStart",
+        ((now - timedelta(days=minute_retention_days)).strftime("%Y-%m-%d %H:%M:%S"),)
+    )
+    return raw_deleted, minute_deleted
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Roll up and prune botHealthMetrics")
+    parser.add_argument("--retention-days", type=int, default=RAW_RETENTION_DAYS,
+                        help="Keep raw botHealthMetrics rows this long (default: %(default)s)")
+    parser.add_argument("--minute-retention-days", type=int, default=MINUTE_RETENTION_DAYS,
+                        help="Keep 1-minute rollups this long (default: %(default)s)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help="Raw rows aggregated per transaction (default: %(default)s)")
+    parser.add_argument("--no-prune", action="store_true", help="Only roll up; delete nothing")
+    return parser.parse_args(argv)
+
+def main():
+    """Main execution function"""
+    args = parse_args()
+
+    if not DB_URL:
+        print("ERROR: DATABASE_URL not set", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        # Pooled connections read and bucket everything in UTC, so 1d buckets are UTC days
+        with get_pool(size=1).connection() as conn:
+            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} Rolling up botHealthMetrics...")
+            processed = roll_up(conn, args.batch_size)
+            print(f"✓ Rolled up {processed} new row(s)")
+
+            if not args.no_prune:
+                raw_deleted, minute_deleted = prune(conn, args.retention_days, args.minute_retention_days)
+                print(f"✓ Pruned {raw_deleted} raw row(s) older than {args.retention_days}d, "
+                      f"{minute_deleted} 1m rollup(s) older than {args.minute_retention_days}d")
+    except Exception as e:
+        print(f"ERROR: Rollup failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        close_pool()
+
+if __name__ == "__main__":
+    main()
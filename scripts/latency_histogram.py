@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+NBA 2K26 Discord Bot - Fixed-Bucket Latency Histogram
+
+A small log-linear histogram (HdrHistogram-style) for probe latencies.
+Values are recorded in 10µs ticks. The first 16 ticks get one bucket
+each; above that every power of two is split into 8 linear sub-buckets,
+so any recorded value is reported within 12.5% of its true value while
+the whole 0-80s range fits in 176 fixed buckets.
+
+Histograms with the same layout can be merged, and serialize to a sparse
+JSON dict (only non-empty buckets) for storage next to botHealthMetrics.
+"""
+
+import math
+from typing import Dict, Any, Iterable, Optional
+
+TICK_MS = 0.01            # One tick = 10µs
+LINEAR_BUCKETS = 16       # Ticks 0-15 are exact
+SUB_BUCKETS = 8           # Linear sub-buckets per power of two above that
+SUB_BUCKET_BITS = 3
+MAX_MAGNITUDE = 20        # Highest bucket covers ~84s
+BUCKET_COUNT = LINEAR_BUCKETS + MAX_MAGNITUDE * SUB_BUCKETS
+
+def bucket_index(ticks: int) -> int:
+    """Map a tick count to its bucket (values past the top bucket are clamped)"""
+    if ticks < LINEAR_BUCKETS:
+        return max(ticks, 0)
+    shift = ticks.bit_length() - (SUB_BUCKET_BITS + 1)
+    if shift > MAX_MAGNITUDE:
+        return BUCKET_COUNT - 1
+    sub = (ticks >> shift) - SUB_BUCKETS
+    return LINEAR_BUCKETS + (shift - 1) * SUB_BUCKETS + sub
+
+def bucket_bounds(index: int) -> tuple:
+    """Inclusive (low, high) tick range covered by a bucket"""
+    if index < LINEAR_BUCKETS:
+        return index, index
+    shift = (index - LINEAR_BUCKETS) // SUB_BUCKETS + 1
+    sub = (index - LINEAR_BUCKETS) % SUB_BUCKETS + SUB_BUCKETS
+    return sub << shift, ((sub + 1) << shift) - 1
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with percentile queries, in milliseconds"""
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms: Optional[float] = None
+
+    def record(self, value_ms: float):
+        ticks = int(round(value_ms / TICK_MS))
+        self.counts[bucket_index(ticks)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.min_ms = value_ms if self.min_ms is None else min(self.min_ms, value_ms)
+        self.max_ms = value_ms if self.max_ms is None else max(self.max_ms, value_ms)
+
+    def record_all(self, values_ms: Iterable[float]):
+        for value in values_ms:
+            self.record(value)
+
+    def merge(self, other: "LatencyHistogram"):
+        for i, n in enumerate(other.counts):
+            self.counts[i] += n
+        self.count += other.count
+        self.total_ms += other.total_ms
+        for value in (other.min_ms, other.max_ms):
+            if value is not None:
+                self.min_ms = value if self.min_ms is None else min(self.min_ms, value)
+                self.max_ms = value if self.max_ms is None else max(self.max_ms, value)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Value at the given percentile (0-100), or None if nothing was recorded"""
+        if self.count == 0:
+            return None
+        rank = max(1, math.ceil(pct / 100.0 * self.count))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                low, high = bucket_bounds(i)
+                value = (low + high) / 2.0 * TICK_MS
+                # Bucket midpoints can overshoot the real extremes
+                return round(min(max(value, self.min_ms), self.max_ms), 2)
+        return round(self.max_ms, 2)
+
+    def summary(self) -> Dict[str, Any]:
+        """p50/p95/p99/max (ms) plus sample count"""
+        return {
+            "count": self.count,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": round(self.max_ms, 2) if self.max_ms is not None else None,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Sparse, JSON-friendly form: only non-empty buckets are kept"""
+        return {
+            "tickMs": TICK_MS,
+            "count": self.count,
+            "sumMs": round(self.total_ms, 2),
+            "minMs": round(self.min_ms, 2) if self.min_ms is not None else None,
+            "maxMs": round(self.max_ms, 2) if self.max_ms is not None else None,
+            "buckets": {str(i): n for i, n in enumerate(self.counts) if n},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls()
+        for index, n in data.get("buckets", {}).items():
+            histogram.counts[int(index)] = int(n)
+        histogram.count = int(data.get("count", sum(histogram.counts)))
+        histogram.total_ms = float(data.get("sumMs", 0.0))
+        histogram.min_ms = data.get("minMs")
+        histogram.max_ms = data.get("maxMs")
+        return histogram
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Load FA window signings into fa_window_signings
+
+Reads signings from JSON (a list, or {"signings": [...]}), JSON Lines or
+CSV, with camelCase or snake_case columns:
+
+    playerName, newTeam, signedDate, contractType      required
+    formerTeam, isWaived, isRFA, isSignAndTrade, notes optional
+    playerId                                           optional, see below
+
+Rows are keyed on (playerName, signedDate), matching the unique index
+from drizzle/migrations/add_fa_signings_unique.sql (apply it first). The
+current rows for the file's date range are read in one query, and only
+new or changed signings are written, as parameterized multi-row upserts
+(db_pool.bulk_insert) inside one transaction, so re-running a file is a
+no-op and a partial failure leaves the table as it was.
+
+playerId is taken from the file if given, otherwise looked up in players
+by name (case and accent insensitive), otherwise a stable id derived
+from the name.
+
+Usage:
+    python3 scripts/load-fa-signings.py                      # fa-signings-data.json
+    python3 scripts/load-fa-signings.py window-2026-01.csv --dry-run
+"""
+import os
+import re
+import sys
+import csv
+import json
+import time
+import argparse
+import unicodedata
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Tuple
+
+from db_pool import get_pool, close_pool, bulk_insert
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'fa-signings-data.json')
+TABLE = "fa_window_signings"
+UNIQUE_INDEX = "fa_window_signings_player_date_idx"
+COLUMNS = ["playerId", "playerName", "newTeam", "formerTeam", "signedDate", "contractType",
+           "isWaived", "isRFA", "isSignAndTrade", "notes"]
+REQUIRED = ["playerName", "newTeam", "signedDate", "contractType"]
+FLAGS = ["isWaived", "isRFA", "isSignAndTrade"]
+UPSERT_CHUNK_ROWS = 500
+DATE_FORMATS = ["%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%m/%d/%Y"]
+
+class SigningError(ValueError):
+    pass
+
+def fold(name: str) -> str:
+    """Case- and accent-insensitive form, matching the table's default collation"""
+    decomposed = unicodedata.normalize("NFKD", " ".join(str(name).split()))
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+def stable_player_id(name: str) -> str:
+    return "fa_" + re.sub(r"[^a-z0-9]+", "_", fold(name)).strip("_")[:60]
+
+def iter_records(path: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """(line or index, raw record) from a JSON, JSON Lines or CSV file"""
+    lowered = path.lower()
+    if lowered.endswith(".csv"):
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            for line, record in enumerate(csv.DictReader(f), start=2):
+                yield line, record
+    elif lowered.endswith((".jsonl", ".ndjson")):
+        with open(path, "r", encoding="utf-8") as f:
+            for line, text in enumerate(f, start=1):
+                if text.strip():
+                    yield line, json.loads(text)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get("signings", [])
+        yield from enumerate(data, start=1)
+
+def parse_flag(value: Any) -> int:
+    if isinstance(value, str):
+        value = value.strip().lower()
+        if value in ("", "0", "false", "no", "n"):
+            return 0
+        if value in ("1", "true", "yes", "y"):
+            return 1
+        raise SigningError(f"not a 0/1 flag: {value!r}")
+    return 1 if value else 0
+
+def parse_date(value: Any) -> datetime:
+    """Midnight of the signing day: the key is per date, so a time of day must not make a second row"""
+    text = str(value or "").strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).replace(hour=0, minute=0, second=0, microsecond=0)
+        except ValueError:
+            continue
+    raise SigningError(f"unreadable signedDate {value!r}")
+
+def normalize_signing(record: Dict[str, Any]) -> Dict[str, Any]:
+    """One record -> column values; raises SigningError naming the problem"""
+    by_key = {re.sub(r"[_\s]", "", str(k)).lower(): v for k, v in record.items() if k is not None}
+    value = {col: by_key.get(col.lower()) for col in COLUMNS}
+    for col in REQUIRED:
+        if value[col] in (None, ""):
+            raise SigningError(f"missing {col}")
+    for col in ("playerName", "newTeam", "contractType", "formerTeam", "playerId"):
+        if value[col] is not None:
+            value[col] = " ".join(str(value[col]).split()) or None
+    value["signedDate"] = parse_date(value["signedDate"])
+    for col in FLAGS:
+        value[col] = parse_flag(value[col])
+    value["notes"] = str(value["notes"]).strip() if value["notes"] not in (None, "") else None
+    return value
+
+def read_signings(paths: List[str]) -> Tuple[Dict[Tuple[str, str], Dict[str, Any]], List[str], int]:
+    """({(folded name, date): signing}, errors, duplicates); a later row for the same key wins"""
+    signings: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    errors, duplicates = [], 0
+    for path in paths:
+        for position, record in iter_records(path):
+            try:
+                signing = normalize_signing(record)
+            except SigningError as e:
+                errors.append(f"{os.path.basename(path)}:{position}: {e}")
+                continue
+            key = (fold(signing["playerName"]), signing["signedDate"].date().isoformat())
+            duplicates += key in signings
+            signings[key] = signing
+    return signings, errors, duplicates
+
+def require_unique_index(cursor):
+    cursor.execute(f"SHOW INDEX FROM `{TABLE}` WHERE Key_name = %s", (UNIQUE_INDEX,))
+    if not cursor.fetchall():
+        raise SystemExit(f"❌ {TABLE} has no {UNIQUE_INDEX} index, so upserts would insert duplicates.\n"
+                         f"   Apply drizzle/migrations/add_fa_signings_unique.sql first.")
+
+def resolve_player_ids(cursor, signings: Dict[Tuple[str, str], Dict[str, Any]]):
+    """Fill playerId from the players table where the file didn't give one"""
+    missing = {fold(s["playerName"]) for s in signings.values() if not s["playerId"]}
+    if not missing:
+        return 0
+    cursor.execute("SELECT id, name FROM players")
+    ids = {}
+    for player_id, name in cursor.fetchall():
+        ids.setdefault(fold(name), player_id)
+    matched = 0
+    for signing in signings.values():
+        if not signing["playerId"]:
+            signing["playerId"] = ids.get(fold(signing["playerName"]))
+            matched += signing["playerId"] is not None
+            signing["playerId"] = signing["playerId"] or stable_player_id(signing["playerName"])
+    return matched
+
+def current_rows(cursor, signings: Dict[Tuple[str, str], Dict[str, Any]]) -> Dict[Tuple[str, str], Tuple]:
+    """Existing rows in the file's date range, keyed like read_signings"""
+    dates = [s["signedDate"].date() for s in signings.values()]
+    cursor.execute(f"SELECT {', '.join(f'`{c}`' for c in COLUMNS)} FROM `{TABLE}` "
+                   f"WHERE signedDate >= %s AND signedDate < %s + INTERVAL 1 DAY", (min(dates), max(dates)))
+    existing = {}
+    for row in cursor.fetchall():
+        values = dict(zip(COLUMNS, row))
+        existing[(fold(values["playerName"]), values["signedDate"].date().isoformat())] = row_tuple(values)
+    return existing
+
+def row_tuple(signing: Dict[str, Any]) -> Tuple:
+    return tuple(signing[col] for col in COLUMNS)
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Upsert FA window signings from JSON or CSV")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_PATH], metavar="PATH",
+                        help="Signings files (default: fa-signings-data.json)")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+    parser.add_argument("--skip-invalid", action="store_true", help="Load the valid rows even if some rows are invalid")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    started = time.perf_counter()
+    signings, errors, duplicates = read_signings(args.paths)
+    print(f"📖 Read {len(signings)} signings from {len(args.paths)} file(s)"
+          + (f" ({duplicates} repeated player/date rows, last one kept)" if duplicates else ""))
+    if errors:
+        print(f"{'⚠️ ' if args.skip_invalid else '❌'} {len(errors)} invalid row(s):")
+        for error in errors[:20]:
+            print(f"    {error}")
+        if len(errors) > 20:
+            print(f"    ... and {len(errors) - 20} more")
+        if not args.skip_invalid:
+            sys.exit(1)
+    if not signings:
+        print("Nothing to load")
+        return
+
+    try:
+        with get_pool(size=1).transaction() as conn:
+            cursor = conn.cursor()
+            require_unique_index(cursor)
+            matched = resolve_player_ids(cursor, signings)
+            existing = current_rows(cursor, signings)
+
+            new = [row_tuple(s) for key, s in signings.items() if key not in existing]
+            changed = [row_tuple(s) for key, s in signings.items() if key in existing and existing[key] != row_tuple(s)]
+            print(f"🔍 {len(new)} new, {len(changed)} changed, {len(signings) - len(new) - len(changed)} unchanged "
+                  f"({matched} player ids matched in players)")
+
+            if not args.dry_run and (new or changed):
+                bulk_insert(cursor, TABLE, COLUMNS, new + changed, chunk_size=UPSERT_CHUNK_ROWS,
+                            update_columns=[col for col in COLUMNS if col != "signedDate"])
+            elif args.dry_run:
+                conn.rollback()
+            cursor.close()
+    finally:
+        close_pool()
+
+    if args.dry_run:
+        print("Dry run - nothing written")
+    else:
+        print(f"✅ Loaded {len(new) + len(changed)} signing(s) in {time.perf_counter() - started:.2f}s")
+
+if __name__ == '__main__':
+    main()
@@ -10,6 +10,9 @@ PROJECT_DIR="/home/ubuntu/nba2k26-database"
 # Create cron job entry (runs every 5 minutes)
 CRON_JOB="*/5 * * * * cd $PROJECT_DIR && python3 scripts/health_check_db.py >> /home/ubuntu/health_check.log 2>&1"
 
+# Rollup/retention job for botHealthMetrics (runs every minute)
+ROLLUP_JOB="* * * * * cd $PROJECT_DIR && python3 scripts/health_rollup.py >> /home/ubuntu/health_rollup.log 2>&1"
+
 # Check if cron job already exists
 if crontab -l 2>/dev/null | grep -q "health_check_db.py"; then
     echo "✓ Cron job already exists"
@@ -19,6 +22,13 @@ else
     echo "✓ Cron job added successfully"
 fi
 
+if crontab -l 2>/dev/null | grep -q "health_rollup.py"; then
+    echo "✓ Rollup cron job already exists"
+else
+    (crontab -l 2>/dev/null; echo "$ROLLUP_JOB") | crontab -
+    echo "✓ Rollup cron job added successfully"
+fi
+
 echo ""
 echo "Health check will run every 5 minutes and log to:"
 echo "  /home/ubuntu/health_check.log"
@@ -29,3 +39,7 @@ echo ""
 echo "To remove the cron job:"
 echo "  crontab -e"
 echo "  (then delete the line containing 'health_check_db.py')"
+echo ""
+echo "For sub-minute sampling, use the daemon instead of cron:"
+echo "  python3 scripts/health_check_db.py --daemon"
+echo "  (see scripts/nba2k26-health-daemon.service)"
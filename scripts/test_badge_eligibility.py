@@ -0,0 +1,26 @@
+"""Tests for BadgeMatrix (python3 -m pytest scripts/test_badge_eligibility.py)"""
+
+from badge_eligibility import BadgeMatrix, NO_TIER, TIERS
+
+def highest(matrix, ratings):
+    tiers = matrix.highest_tiers(matrix.attribute_vectors([ratings]))[0]
+    return {badge: TIERS[t] for badge, t in zip(matrix.badges, tiers.tolist()) if t != NO_TIER}
+
+def test_empty_requirement_row_grants_nothing():
+    matrix = BadgeMatrix.from_rows([
+        ("Limitless Range", "bronze", "Three-Point Shot", 80, None, None, None, None),
+        ("Limitless Range", "gold", None, None, None, None, None, None),
+        ("Blank Badge", "silver", None, None, None, None, None, None),
+    ])
+    assert matrix.badges == ["Limitless Range"]
+    assert not matrix.defined[0, TIERS.index("gold")]
+    assert highest(matrix, {"Three-Point Shot": 50}) == {}
+    assert highest(matrix, {"Three-Point Shot": 85}) == {"Limitless Range": "bronze"}
+
+def test_rows_for_the_same_tier_are_merged():
+    matrix = BadgeMatrix.from_rows([
+        ("Deadeye", "silver", "Three-Point Shot", 75, None, None, None, None),
+        ("Deadeye", "silver", "Shot IQ", 70, "three-point shot", 78, None, None),
+    ])
+    assert highest(matrix, {"Three-Point Shot": 77, "Shot IQ": 90}) == {}
+    assert highest(matrix, {"Three-Point Shot": 78, "Shot IQ": 70}) == {"Deadeye": "silver"}
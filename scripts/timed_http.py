@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+NBA 2K26 Discord Bot - Phase-Timed HTTP Client
+
+A minimal keep-alive HTTP/1.1 GET client for health probes that records
+where each request's time goes, using the monotonic perf_counter clock:
+
+    dns_ms      name resolution (getaddrinfo)
+    connect_ms  TCP connect
+    tls_ms      TLS handshake (https only)
+    ttfb_ms     request sent -> status line and headers received
+    body_ms     body download
+    total_ms    all of the above
+
+dns/connect/tls are 0 when the request reuses the previous connection
+(`reused` is True). JSON decode time is measured by the caller.
+"""
+
+import ssl
+import time
+import socket
+import http.client
+from urllib.parse import urlsplit, urljoin
+from typing import Dict, Any, Optional
+
+MAX_REDIRECTS = 3
+USER_AGENT = "nba2k26-health-check"
+
+class ProbeTimeout(Exception):
+    pass
+
+class ProbeConnectionError(Exception):
+    pass
+
+class TimedResponse:
+    def __init__(self, status: int, body: bytes, phases: Dict[str, Any], location: Optional[str] = None):
+        self.status_code = status
+        self.content = body
+        self.phases = phases
+        self.location = location
+
+def ms(start: float, end: float) -> float:
+    return round((end - start) * 1000, 2)
+
+class TimedHTTPClient:
+    """
+    One persistent connection to one origin. Not thread-safe: the probe
+    engine keeps one client per target.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.conn: Optional[http.client.HTTPConnection] = None
+        self.origin = None
+        self.ssl_context = ssl.create_default_context()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+            self.origin = None
+
+    def _connect(self, scheme: str, host: str, port: int, timeout: float, phases: Dict[str, Any]):
+        start = time.perf_counter()
+        try:
+            addrinfo = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            raise ProbeConnectionError(f"DNS lookup failed for {host}: {e}")
+        resolved = time.perf_counter()
+        phases["dns_ms"] = ms(start, resolved)
+
+        sock = None
+        last_error: Optional[Exception] = None
+        for family, socktype, proto, _, sockaddr in addrinfo:
+            sock = socket.socket(family, socktype, proto)
+            sock.settimeout(timeout)
+            try:
+                sock.connect(sockaddr)
+                break
+            except socket.timeout:
+                sock.close()
+                raise ProbeTimeout(f"Connect timeout after {timeout:g}s")
+            except OSError as e:
+                sock.close()
+                sock = None
+                last_error = e
+        if sock is None:
+            raise ProbeConnectionError(f"Connection refused ({last_error})")
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connected = time.perf_counter()
+        phases["connect_ms"] = ms(resolved, connected)
+
+        if scheme == "https":
+            try:
+                sock = self.ssl_context.wrap_socket(sock, server_hostname=host)
+            except socket.timeout:
+                sock.close()
+                raise ProbeTimeout(f"TLS handshake timeout after {timeout:g}s")
+            phases["tls_ms"] = ms(connected, time.perf_counter())
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout, context=self.ssl_context)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        conn.sock = sock
+        self.conn = conn
+        self.origin = (scheme, host, port)
+
+    def _request_once(self, url: str, timeout: float) -> TimedResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        host = parts.hostname
+        port = parts.port or (443 if scheme == "https" else 80)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        phases: Dict[str, Any] = {"dns_ms": 0.0, "connect_ms": 0.0, "tls_ms": 0.0, "reused": False}
+        started = time.perf_counter()
+
+        for attempt in range(2):
+            if self.conn is None or self.origin != (scheme, host, port):
+                self.close()
+                self._connect(scheme, host, port, timeout, phases)
+            else:
+                phases["reused"] = True
+                self.conn.sock.settimeout(timeout)
+
+            sent = time.perf_counter()
+            try:
+                self.conn.request("GET", path, headers={"User-Agent": USER_AGENT, "Accept": "*/*"})
+                response = self.conn.getresponse()
+                break
+            except socket.timeout:
+                self.close()
+                raise ProbeTimeout(f"Timeout after {timeout:g}s")
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+                # The server dropped an idle keep-alive connection; retry once on a fresh one
+                self.close()
+                if not phases["reused"] or attempt == 1:
+                    raise ProbeConnectionError(f"Connection closed by server ({e})")
+                phases["reused"] = False
+        headers_received = time.perf_counter()
+
+        try:
+            body = response.read()
+        except socket.timeout:
+            self.close()
+            raise ProbeTimeout(f"Timeout after {timeout:g}s reading body")
+        finished = time.perf_counter()
+        if response.will_close:
+            self.close()
+
+        phases["ttfb_ms"] = ms(sent, headers_received)
+        phases["body_ms"] = ms(headers_received, finished)
+        phases["total_ms"] = ms(started, finished)
+
+        return TimedResponse(response.status, body, phases, response.getheader("Location"))
+
+    def get(self, timeout: float, url: Optional[str] = None) -> TimedResponse:
+        """GET the client's URL, following up to MAX_REDIRECTS redirects"""
+        url = url or self.url
+        try:
+            response = self._request_once(url, timeout)
+            for _ in range(MAX_REDIRECTS):
+                if response.status_code not in (301, 302, 303, 307, 308) or not response.location:
+                    break
+                first_phases = response.phases
+                # A relative Location is relative to the hop that sent it, not the original URL
+                url = urljoin(url, response.location)
+                response = self._request_once(url, timeout)
+                response.phases["total_ms"] = round(first_phases["total_ms"] + response.phases["total_ms"], 2)
+            return response
+        except (ProbeTimeout, ProbeConnectionError):
+            raise
+        except socket.timeout:
+            self.close()
+            raise ProbeTimeout(f"Timeout after {timeout:g}s")
+        except (ConnectionRefusedError, ConnectionResetError, OSError, http.client.HTTPException) as e:
+            self.close()
+            raise ProbeConnectionError(str(e))
@@ -1,45 +0,0 @@
--- FA Window Signings Seed Data (2025 NBA Off-Season)
-
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_001', 'Deandre Ayton', 'Los Angeles Lakers', 'Portland Trail Blazers', '2025-07-06', 'Free Agent', 1, 0, 0, 'Waived on June 29');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_002', 'James Harden', 'Los Angeles Clippers', 'Los Angeles Clippers', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_003', 'Kyrie Irving', 'Dallas Mavericks', 'Dallas Mavericks', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_004', 'Brook Lopez', 'Los Angeles Clippers', 'Milwaukee Bucks', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_005', 'Myles Turner', 'Milwaukee Bucks', 'Indiana Pacers', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_006', 'Fred VanVleet', 'Houston Rockets', 'Houston Rockets', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_007', 'Tyus Jones', 'Orlando Magic', 'Phoenix Suns', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_008', 'Clint Capela', 'Houston Rockets', 'Atlanta Hawks', '2025-07-06', 'Sign-and-Trade', 0, 0, 1, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_009', 'Nicolas Batum', 'Los Angeles Clippers', 'Los Angeles Clippers', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_010', 'Justin Edwards', 'Philadelphia 76ers', 'Philadelphia 76ers', '2025-07-06', 'RFA', 0, 1, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_011', 'Dorian Finney-Smith', 'Houston Rockets', 'Los Angeles Lakers', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_012', 'Jaxson Hayes', 'Los Angeles Lakers', 'Los Angeles Lakers', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_013', 'Joe Ingles', 'Minnesota Timberwolves', 'Minnesota Timberwolves', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_014', 'Tre Jones', 'Chicago Bulls', 'Chicago Bulls', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_015', 'Jake LaRavia', 'Los Angeles Lakers', 'Sacramento Kings', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_016', 'Sam Merrill', 'Cleveland Cavaliers', 'Cleveland Cavaliers', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_017', 'Ajay Mitchell', 'Oklahoma City Thunder', 'Oklahoma City Thunder', '2025-07-06', 'RFA', 0, 1, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_018', 'Larry Nance Jr.', 'Cleveland Cavaliers', 'Atlanta Hawks', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_019', 'Bobby Portis', 'Milwaukee Bucks', 'Milwaukee Bucks', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_020', 'D'Angelo Russell', 'Dallas Mavericks', 'Brooklyn Nets', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_021', 'Guerschon Yabusele', 'New York Knicks', 'Philadelphia 76ers', '2025-07-06', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_022', 'Nickeil Alexander-Walker', 'Atlanta Hawks', 'Minnesota Timberwolves', '2025-07-06', 'Sign-and-Trade', 0, 0, 1, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_023', 'Jordan Clarkson', 'New York Knicks', 'Utah Jazz', '2025-07-07', 'Free Agent', 1, 0, 0, 'Waived on July 1');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_024', 'Luka Garza', 'Boston Celtics', 'Minnesota Timberwolves', '2025-07-07', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_025', 'Luke Kornet', 'San Antonio Spurs', 'Boston Celtics', '2025-07-07', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_026', 'Caris LeVert', 'Detroit Pistons', 'Atlanta Hawks', '2025-07-07', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_027', 'Kevon Looney', 'New Orleans Pelicans', 'Golden State Warriors', '2025-07-07', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_028', 'Kyle Lowry', 'Philadelphia 76ers', 'Philadelphia 76ers', '2025-07-07', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_029', 'Davion Mitchell', 'Miami Heat', 'Miami Heat', '2025-07-07', 'RFA', 0, 1, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_030', 'Duncan Robinson', 'Detroit Pistons', 'Miami Heat', '2025-07-07', 'Sign-and-Trade', 0, 0, 1, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_031', 'Dennis Schröder', 'Sacramento Kings', 'Detroit Pistons', '2025-07-07', 'Sign-and-Trade', 0, 0, 1, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_032', 'Gary Trent Jr.', 'Milwaukee Bucks', 'Milwaukee Bucks', '2025-07-07', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_033', 'Moritz Wagner', 'Orlando Magic', 'Orlando Magic', '2025-07-07', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_034', 'Ty Jerome', 'Memphis Grizzlies', 'Cleveland Cavaliers', '2025-07-14', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_035', 'Naz Reid', 'Minnesota Timberwolves', 'Minnesota Timberwolves', '2025-07-14', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_036', 'Santi Aldama', 'Memphis Grizzlies', 'Memphis Grizzlies', '2025-07-15', 'RFA', 0, 1, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_037', 'Julius Randle', 'Minnesota Timberwolves', 'Minnesota Timberwolves', '2025-07-15', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_038', 'Bradley Beal', 'Los Angeles Clippers', 'Phoenix Suns', '2025-07-18', 'Free Agent', 1, 0, 0, 'Waived on July 16');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_039', 'Damian Lillard', 'Portland Trail Blazers', 'Milwaukee Bucks', '2025-07-19', 'Free Agent', 1, 0, 0, 'Waived on July 7');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_040', 'Chris Paul', 'Los Angeles Clippers', 'San Antonio Spurs', '2025-07-21', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_041', 'Marcus Smart', 'Los Angeles Lakers', 'Washington Wizards', '2025-07-22', 'Free Agent', 1, 0, 0, 'Waived on July 20');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_042', 'Eric Gordon', 'Philadelphia 76ers', 'Philadelphia 76ers', '2025-07-01', 'Free Agent', 0, 0, 0, '');
-INSERT INTO fa_window_signings (playerId, playerName, newTeam, formerTeam, signedDate, contractType, isWaived, isRFA, isSignAndTrade, notes) VALUES ('fa2025_043', 'Garrett Temple', 'Toronto Raptors', 'Toronto Raptors', '2025-07-01', 'Free Agent', 0, 0, 0, '');
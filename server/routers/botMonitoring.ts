@@ -1,7 +1,7 @@
 import { publicProcedure, router } from "../_core/trpc";
 import { getDb } from "../db";
-import { botHealthMetrics } from "../../drizzle/schema";
-import { desc, sql, gte } from "drizzle-orm";
+import { botHealthMetrics, botHealthRollups } from "../../drizzle/schema";
+import { and, asc, desc, eq, sql, gte } from "drizzle-orm";
 import { z } from "zod";
 
 /**
@@ -105,8 +105,12 @@ export const botMonitoringRouter = router({
 
       const uptimePercentage = ((healthyChecks + degradedChecks) / totalChecks) * 100;
 
+      // Checks that got no response have a null response time and don't count toward the average
+      const healthMetrics = metrics.filter((m) => m.healthResponseTime !== null);
       const avgHealthResponseTime =
-        metrics.reduce((sum, m) => sum + m.healthResponseTime, 0) / totalChecks;
+        healthMetrics.length > 0
+          ? healthMetrics.reduce((sum, m) => sum + (m.healthResponseTime || 0), 0) / healthMetrics.length
+          : 0;
 
       const webMetrics = metrics.filter((m) => m.webResponseTime !== null);
       const avgWebResponseTime =
@@ -146,7 +150,26 @@ export const botMonitoringRouter = router({
       const hoursAgo = new Date();
       hoursAgo.setHours(hoursAgo.getHours() - input.hours);
 
-      // Get metrics grouped by hour
+      // Prefer the pre-aggregated hourly rollups (scripts/health_rollup.py)
+      const hourStart = new Date(hoursAgo);
+      hourStart.setMinutes(0, 0, 0);
+      const rollups = await db
+        .select()
+        .from(botHealthRollups)
+        .where(and(eq(botHealthRollups.resolution, "1h"), gte(botHealthRollups.bucketStart, hourStart)))
+        .orderBy(asc(botHealthRollups.bucketStart));
+
+      if (rollups.length > 0) {
+        return rollups.map((r) => ({
+          hour: r.bucketStart.toISOString().slice(0, 13).replace("T", " ") + ":00:00",
+          avgHealthResponseTime: Math.round((r.avgResponseTime || 0) * 100) / 100,
+          avgWebResponseTime: Math.round((r.avgWebResponseTime || 0) * 100) / 100,
+          avgErrors: Math.round((r.errorTotal / r.sampleCount) * 100) / 100,
+          uptimePercentage: Math.round((r.healthyCount / r.sampleCount) * 10000) / 100,
+        }));
+      }
+
+      // Rollup job not running yet: aggregate raw metrics grouped by hour
       const trends = await db
         .select({
           hour: sql<string>`DATE_FORMAT(${botHealthMetrics.timestamp}, '%Y-%m-%d %H:00:00')`,